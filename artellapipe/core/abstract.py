@@ -22,8 +22,9 @@ from tpDcc.libs.python import decorators, python, path as path_utils
 from tpDcc.libs.qt.core import qtutils
 
 import artellapipe
-from artellapipe.core import defines
+from artellapipe.core import defines, filequeries
 from artellapipe.libs.artella.core import artellalib
+from artellapipe.utils import orderedset, metrics
 
 LOGGER = logging.getLogger('artellapipe')
 
@@ -32,6 +33,7 @@ class AbstractFile(object):
 
     FILE_TYPE = None
     FILES = dict()
+    MAX_CONCURRENT_QUERIES = 8
 
     def __init__(self, project):
         super(AbstractFile, self).__init__()
@@ -206,6 +208,24 @@ class AbstractFile(object):
 
         return file_path
 
+    def get_files(self, status, file_types=None, must_exist=True, concurrent=False):
+        """
+        Returns file paths of the given file types and status
+        :param status: str
+        :param file_types: list(str), file types to retrieve paths of. If not given, all valid file types are used
+        :param must_exist: bool, If True, None will be returned for file types whose file path is not found
+        :param concurrent: bool, Whether file types should be queried concurrently or not
+        :return: dict(str, str), dictionary that maps each file type with its file path
+        """
+
+        valid_types = self._get_types_to_check(file_types)
+
+        def _get_file(file_type):
+            return self.get_file(file_type=file_type, status=status, must_exist=must_exist)
+
+        return filequeries.get_files(
+            valid_types, _get_file, concurrent=concurrent, max_workers=self.MAX_CONCURRENT_QUERIES)
+
     def solve_path(
             self, file_type, template_dict, template=None, extra_dict=None, version=None, fix_path=False,
             only_local=False, status=defines.ArtellaFileStatus.WORKING, must_exist=True, next_version=False,
@@ -263,7 +283,7 @@ class AbstractFile(object):
             file_path = template.format(template_dict)
         else:
             latest_local_versions = self.get_latest_local_versions(
-                status=defines.ArtellaFileStatus.PUBLISHED, next_version=next_version)
+                status=defines.ArtellaFileStatus.PUBLISHED, file_types=[file_type], next_version=next_version)
             file_type_local_versions = latest_local_versions.get(file_type, None)
             if file_type_local_versions:
                 if version:
@@ -445,11 +465,12 @@ class AbstractFile(object):
     # VERSIONS
     # ==========================================================================================================
 
-    def get_local_versions(self, status=None, file_types=None):
+    def get_local_versions(self, status=None, file_types=None, concurrent=False):
         """
         Returns all local version of the given asset file types and with the given status
         :param status: ArtellaFileStatus
         :param file_types:
+        :param concurrent: bool, Whether file types should be queried concurrently or not
         :return:
         """
 
@@ -465,21 +486,20 @@ class AbstractFile(object):
         if not self.get_path():
             return local_versions
 
-        for valid_type in valid_types:
-            file_type = self.get_file_type(valid_type)
-            if not file_type:
-                continue
-            file_type_versions = file_type.get_local_versions(status=status)
+        file_types_versions = self._query_file_types(
+            valid_types, lambda file_type: file_type.get_local_versions(status=status), concurrent=concurrent)
+        for valid_type, file_type_versions in file_types_versions:
             if not file_type_versions:
                 continue
             local_versions[valid_type] = file_type_versions
 
         return local_versions
 
-    def get_latest_local_versions(self, status=None, file_types=None, next_version=False):
+    def get_latest_local_versions(self, status=None, file_types=None, next_version=False, concurrent=False):
         """
         Returns latest local version of the given asset file types
         :param file_types: list (optional)
+        :param concurrent: bool, Whether file types should be queried concurrently or not
         :return: dict
         """
 
@@ -492,11 +512,10 @@ class AbstractFile(object):
         for file_type in valid_types:
             latest_local_versions[file_type] = None
 
-        for valid_type in valid_types:
-            file_type = self.get_file_type(valid_type)
-            if not file_type:
-                continue
-            file_type_versions = file_type.get_latest_local_versions(status=status, next_version=next_version)
+        file_types_versions = self._query_file_types(
+            valid_types, lambda file_type: file_type.get_latest_local_versions(
+                status=status, next_version=next_version), concurrent=concurrent)
+        for valid_type, file_type_versions in file_types_versions:
             if not file_type_versions:
                 continue
             latest_local_versions[valid_type] = file_type_versions
@@ -507,34 +526,26 @@ class AbstractFile(object):
     # SYNC
     # ==========================================================================================================
 
-    @decorators.timestamp
-    def is_published(self, file_type=None):
+    @metrics.timed('file.is_published')
+    def is_published(self, file_type=None, concurrent=False):
         """
         Returns whether or not current asset and given type is published
         :param file_type: str, type of asset file. If None, True will be returned if any fiel type is published
+        :param concurrent: bool, Whether file types should be queried concurrently or not
         :return: bool
         """
 
         valid_types = self._get_types_to_check(file_type)
         if not valid_types:
-            return
-
-        for valid_type in valid_types:
-            file_type = self.get_file_type(valid_type)
-            if not file_type:
-                continue
+            return False
 
-            latest_published_info = file_type.get_server_versions(status=defines.ArtellaFileStatus.PUBLISHED)
-            if not latest_published_info:
-                return False
-            for version_info in latest_published_info:
-                latest_version_path = version_info.get('version_path', None)
-                if not latest_version_path:
-                    return False
+        published_infos = self._query_file_types(
+            valid_types, lambda file_type: file_type.get_server_versions(
+                status=defines.ArtellaFileStatus.PUBLISHED), concurrent=concurrent)
 
-            return True
+        return filequeries.is_any_published(published_infos)
 
-    @decorators.timestamp
+    @metrics.timed('file.sync')
     def sync(self, file_type=None, sync_type=defines.ArtellaFileStatus.ALL):
         """
         Synchronizes asset file type and with the given sync type (working or published)
@@ -552,11 +563,12 @@ class AbstractFile(object):
 
         artellapipe.FilesMgr().sync_paths(paths_to_sync, recursive=True)
 
-    @decorators.timestamp
-    def sync_latest_published_files(self, file_type=None, ask=False):
+    @metrics.timed('file.sync_latest_published_files')
+    def sync_latest_published_files(self, file_type=None, ask=False, concurrent=False):
         """
         Synchronizes all latest published files for current asset
         :param file_type: str, if not given all files will be synced
+        :param concurrent: bool, Whether file types should be queried concurrently or not
         """
 
         if ask:
@@ -572,12 +584,11 @@ class AbstractFile(object):
 
         files_to_sync = list()
 
-        for valid_type in valid_types:
-            file_type = self.get_file_type(valid_type)
-            if not file_type:
-                continue
+        published_infos = self._query_file_types(
+            valid_types, lambda file_type: file_type.get_server_versions(
+                status=defines.ArtellaFileStatus.PUBLISHED), concurrent=concurrent)
 
-            latest_published_info = file_type.get_server_versions(status=defines.ArtellaFileStatus.PUBLISHED)
+        for valid_type, latest_published_info in published_infos:
             if not latest_published_info:
                 continue
             for version_info in latest_published_info:
@@ -619,6 +630,20 @@ class AbstractFile(object):
 
         return file_types
 
+    def _query_file_types(self, file_types, query_fn, concurrent=False):
+        """
+        Internal function that executes given query in all the given file types. File types that are not valid for
+        this object are skipped
+        :param file_types: list(str)
+        :param query_fn: fn, function that receives a file type object and returns the result of the query
+        :param concurrent: bool, If True, file types are queried concurrently in a bounded pool of threads. Otherwise,
+            file types are queried lazily one after another while the results are consumed
+        :return: iterator(tuple(str, variant)), tuples of (file type name, query result)
+        """
+
+        return filequeries.query_file_types(
+            file_types, self.get_file_type, query_fn, concurrent=concurrent, max_workers=self.MAX_CONCURRENT_QUERIES)
+
     def _get_paths_to_sync(self, file_type, sync_type):
         """
         Internal function that returns a complete list of paths to sync depending on the given file type and sync type
@@ -631,7 +656,7 @@ class AbstractFile(object):
         if not valid_types:
             return
 
-        paths_to_sync = list()
+        paths_to_sync = orderedset.OrderedSet()
 
         for valid_type in valid_types:
             file_type = self.get_file_type(valid_type)
@@ -640,14 +665,14 @@ class AbstractFile(object):
 
             if sync_type == defines.ArtellaFileStatus.ALL or sync_type == defines.ArtellaFileStatus.WORKING:
                 working_path = file_type.get_working_path(sync_folder=True)
-                if working_path and working_path not in paths_to_sync:
-                    paths_to_sync.append(working_path)
+                if working_path:
+                    paths_to_sync.add(working_path)
             if sync_type == defines.ArtellaFileStatus.ALL or sync_type == defines.ArtellaFileStatus.PUBLISHED:
                 published_path = file_type.get_latest_server_published_path(sync_folder=True)
-                if published_path and published_path not in paths_to_sync:
-                    paths_to_sync.append(published_path)
+                if published_path:
+                    paths_to_sync.add(published_path)
 
-        return paths_to_sync
+        return paths_to_sync.to_list()
 
 
 class AbstractAsset(AbstractFile, object):
@@ -38,7 +38,7 @@ class ArtellaAsset(abstract.AbstractAsset, object):
         :return: str
         """
 
-        id_attr = artellapipe.AssetsMgr().config.get('data', 'id_attribute')
+        id_attr = artellapipe.AssetsMgr().config_snapshot.get('data.id_attribute')
         asset_id = self._asset_data.get(id_attr, None)
         if not asset_id:
             LOGGER.warning(
@@ -54,7 +54,7 @@ class ArtellaAsset(abstract.AbstractAsset, object):
         :param new_id: str
         """
 
-        id_attr = artellapipe.AssetsMgr().config.get('data', 'id_attribute')
+        id_attr = artellapipe.AssetsMgr().config_snapshot.get('data.id_attribute')
         asset_id = self._asset_data.get(id_attr, None)
         if not asset_id:
             LOGGER.warning(
@@ -71,7 +71,7 @@ class ArtellaAsset(abstract.AbstractAsset, object):
         :return: str
         """
 
-        name_attr = artellapipe.AssetsMgr().config.get('data', 'name_attribute')
+        name_attr = artellapipe.AssetsMgr().config_snapshot.get('data.name_attribute')
         asset_name = self._asset_data.get(name_attr, None)
         if not asset_name:
             LOGGER.warning(
@@ -88,7 +88,7 @@ class ArtellaAsset(abstract.AbstractAsset, object):
         :return: list(str)
         """
 
-        tags_attr = artellapipe.AssetsMgr().config.get('data', 'tag_attribute')
+        tags_attr = artellapipe.AssetsMgr().config_snapshot.get('data.tag_attribute')
         tags_list = self._asset_data.get(tags_attr, None)
         if not tags_list:
             LOGGER.warning(
@@ -105,7 +105,7 @@ class ArtellaAsset(abstract.AbstractAsset, object):
         :return: str
         """
 
-        path_template_name = artellapipe.AssetsMgr().config.get('data', 'path_template_name')
+        path_template_name = artellapipe.AssetsMgr().config_snapshot.get('data.path_template_name')
         template = artellapipe.FilesMgr().get_template(path_template_name)
         if not template:
             LOGGER.warning(
@@ -139,7 +139,7 @@ class ArtellaAsset(abstract.AbstractAsset, object):
         :return: str
         """
 
-        thumb_attr = artellapipe.AssetsMgr().config.get('data', 'thumb_attribute')
+        thumb_attr = artellapipe.AssetsMgr().config_snapshot.get('data.thumb_attribute')
         thumb_path = self._asset_data.get(thumb_attr, None)
 
         return thumb_path
@@ -151,7 +151,7 @@ class ArtellaAsset(abstract.AbstractAsset, object):
         :return: str
         """
 
-        category_attr = artellapipe.AssetsMgr().config.get('data', 'category_attribute')
+        category_attr = artellapipe.AssetsMgr().config_snapshot.get('data.category_attribute')
 
         category = self._asset_data.get(category_attr, None)
         if not category:
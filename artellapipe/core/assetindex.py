@@ -0,0 +1,89 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for an index of assets that allows fast queries by ID and by name
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+
+class AssetIndex(object):
+    """
+    Class that indexes assets of the project catalog by ID and by name. Asset attributes are only read once, when
+    assets are added to the index
+    """
+
+    def __init__(self, assets=None):
+        self._by_id = dict()
+        self._by_name = dict()
+
+        for asset in assets or list():
+            self.add(asset)
+
+    def __len__(self):
+        return sum(len(assets) for assets in self._by_name.values())
+
+    def __contains__(self, asset_name):
+        return asset_name in self._by_name
+
+    def add(self, asset):
+        """
+        Adds given asset to the index. If other asset with the same ID is already indexed, the first one is kept
+        :param asset: ArtellaAsset
+        """
+
+        asset_id = asset.get_id()
+        if asset_id:
+            self._by_id.setdefault(asset_id.rstrip(), asset)
+        self._by_name.setdefault(asset.get_name(), list()).append(asset)
+
+    def clear(self):
+        """
+        Removes all the assets from the index
+        """
+
+        self._by_id.clear()
+        self._by_name.clear()
+
+    def get_asset_by_id(self, asset_id):
+        """
+        Returns asset with the given ID
+        :param asset_id: str
+        :return: ArtellaAsset or None
+        """
+
+        if not asset_id:
+            return None
+
+        return self._by_id.get(asset_id.rstrip(), None)
+
+    def get_assets_by_name(self, asset_name):
+        """
+        Returns all the assets with the given name
+        :param asset_name: str
+        :return: list(ArtellaAsset)
+        """
+
+        return list(self._by_name.get(asset_name, list()))
+
+    def resolve(self, asset_data, id_attribute, create_fn):
+        """
+        Returns the indexed asset with the ID stored in the given data. If the asset is not indexed, a new asset is
+        created with the given function
+        :param asset_data: dict
+        :param id_attribute: str, attribute of the data that stores the ID of the asset
+        :param create_fn: fn, function that receives asset data and returns a new asset
+        :return: ArtellaAsset or None
+        """
+
+        asset = self.get_asset_by_id(asset_data.get(id_attribute, None))
+        if asset:
+            return asset
+
+        return create_fn(asset_data)
@@ -0,0 +1,144 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for casting data of a project
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import threading
+
+
+class CastingMatrix(object):
+    """
+    Class that stores the number of occurrences of each asset in each shot. Data is stored as a sparse table indexed
+    both by shot and by asset, so occurrences, assets in a shot and shots of an asset are retrieved without
+    contacting the production tracker
+    """
+
+    def __init__(self):
+        self._by_shot = dict()
+        self._by_asset = dict()
+        self._loaded_shots = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(shots) for shots in self._by_asset.values())
+
+    @classmethod
+    def from_breakdown(cls, breakdown, shot_ids=None):
+        """
+        Creates a new casting matrix from the given shots breakdown
+        :param breakdown: iterable(tuple(str, str, int)), (shot ID, asset name, occurrences) tuples
+        :param shot_ids: list(str), shots whose breakdown is complete. If not given, all the shots of the breakdown
+            are considered complete
+        :return: CastingMatrix
+        """
+
+        casting_matrix = cls()
+        loaded_shots = set()
+        for shot_id, asset_name, occurrences in breakdown:
+            casting_matrix.set_occurrences(shot_id, asset_name, occurrences)
+            loaded_shots.add(shot_id)
+        casting_matrix.set_loaded_shots(shot_ids if shot_ids is not None else loaded_shots)
+
+        return casting_matrix
+
+    def set_shot_occurrences(self, shot_id, occurrences):
+        """
+        Stores the complete casting of the given shot, replacing the casting already stored for it
+        :param shot_id: str
+        :param occurrences: dict(str, int), dictionary that maps asset names with its occurrences in the shot
+        """
+
+        occurrences = dict(
+            (asset_name, int(asset_occurrences or 0)) for asset_name, asset_occurrences in occurrences.items()
+            if asset_name)
+
+        with self._lock:
+            for asset_name in self._by_shot.pop(shot_id, dict()):
+                self._by_asset.get(asset_name, dict()).pop(shot_id, None)
+            self._by_shot[shot_id] = occurrences
+            for asset_name, asset_occurrences in occurrences.items():
+                if asset_occurrences:
+                    self._by_asset.setdefault(asset_name, dict())[shot_id] = asset_occurrences
+            self._loaded_shots.add(shot_id)
+
+    def set_occurrences(self, shot_id, asset_name, occurrences):
+        """
+        Stores the number of occurrences of the given asset in the given shot
+        :param shot_id: str
+        :param asset_name: str
+        :param occurrences: int
+        """
+
+        occurrences = int(occurrences or 0)
+        # Assets not cast in a shot are also stored (with 0 occurrences), so they are not requested again
+        with self._lock:
+            self._by_shot.setdefault(shot_id, dict())[asset_name] = occurrences
+            if occurrences:
+                self._by_asset.setdefault(asset_name, dict())[shot_id] = occurrences
+            else:
+                self._by_asset.get(asset_name, dict()).pop(shot_id, None)
+
+    def set_loaded_shots(self, shot_ids):
+        """
+        Marks given shots as complete. Assets not stored in complete shots have 0 occurrences
+        :param shot_ids: iterable(str)
+        """
+
+        with self._lock:
+            self._loaded_shots.update(shot_ids)
+
+    def is_shot_loaded(self, shot_id):
+        """
+        Returns whether the complete breakdown of the given shot is stored in the matrix
+        :param shot_id: str
+        :return: bool
+        """
+
+        return shot_id in self._loaded_shots
+
+    def get_occurrences(self, asset_name, shot_id):
+        """
+        Returns the number of occurrences of the given asset in the given shot
+        :param asset_name: str
+        :param shot_id: str
+        :return: int or None, None if the matrix does not know the occurrences of the asset in the shot
+        """
+
+        shot_assets = self._by_shot.get(shot_id, None)
+        if shot_assets is not None and asset_name in shot_assets:
+            return shot_assets[asset_name]
+
+        return 0 if shot_id in self._loaded_shots else None
+
+    def get_assets_in_shot(self, shot_id):
+        """
+        Returns all the assets cast in the given shot
+        :param shot_id: str
+        :return: dict(str, int) or None, dictionary that maps asset names with its occurrences in the shot.
+            None if the breakdown of the shot is not stored in the matrix
+        """
+
+        if shot_id not in self._loaded_shots:
+            return None
+
+        return dict(
+            (asset_name, occurrences) for asset_name, occurrences in self._by_shot.get(shot_id, dict()).items()
+            if occurrences)
+
+    def get_shots_of_asset(self, asset_name):
+        """
+        Returns all the shots where the given asset is cast. Only complete shots are taken into account
+        :param asset_name: str
+        :return: dict(str, int), dictionary that maps shot IDs with the occurrences of the asset in the shot
+        """
+
+        return dict(self._by_asset.get(asset_name, dict()))
@@ -0,0 +1,143 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for a crawler that finds file dependencies in parallel
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import logging
+import threading
+
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
+LOGGER = logging.getLogger('artellapipe')
+
+# Object put in queues to notify that there is no more work to do
+_DONE = object()
+
+
+class DependencyCrawler(object):
+    """
+    Class that finds all the dependencies of a group of files. Independent branches of the dependency tree are parsed
+    in a bounded pool of threads, visited files are shared between branches so each file is parsed only once and
+    found dependencies are streamed while the crawl is still running
+    """
+
+    def __init__(self, parse_fn, max_workers=8):
+        """
+        :param parse_fn: fn, function that receives a file path and returns the paths directly referenced by the file
+        :param max_workers: int, maximum number of files parsed at the same time
+        """
+
+        self._parse_fn = parse_fn
+        self._max_workers = max(1, max_workers or 1)
+        self._errors = dict()
+
+    @property
+    def errors(self):
+        """
+        Returns errors raised while parsing files during the last crawl
+        :return: dict(str, Exception)
+        """
+
+        return dict(self._errors)
+
+    def crawl(self, file_paths, consumer=None):
+        """
+        Finds all the dependencies of the given files. Dependencies are returned as soon as they are found, so they
+        can be processed (for example, synchronized) before the crawl finishes
+        :param file_paths: list(str), files to find dependencies of
+        :param consumer: fn, optional function called with each found dependency (in the thread that iterates)
+        :return: iterator(str), found dependencies. Each dependency is only returned once
+        """
+
+        self._errors = dict()
+        file_paths = [self._normalize(file_path) for file_path in file_paths if file_path]
+        if not file_paths:
+            return
+
+        visited = set(file_paths)
+        visited_lock = threading.Lock()
+        pending = [len(file_paths)]
+        work_queue = Queue()
+        results_queue = Queue()
+
+        def _worker():
+            while True:
+                file_path = work_queue.get()
+                if file_path is _DONE:
+                    return
+                try:
+                    references = self._parse_fn(file_path) or list()
+                except Exception as exc:
+                    LOGGER.warning('Error while parsing dependencies of "{}": {}'.format(file_path, exc))
+                    self._errors[file_path] = exc
+                    references = list()
+
+                new_references = list()
+                with visited_lock:
+                    for reference in references:
+                        if not reference:
+                            continue
+                        reference = self._normalize(reference)
+                        if reference in visited:
+                            continue
+                        visited.add(reference)
+                        new_references.append(reference)
+                    pending[0] += len(new_references) - 1
+                    is_finished = pending[0] == 0
+
+                for reference in new_references:
+                    results_queue.put(reference)
+                    if os.path.isfile(reference):
+                        work_queue.put(reference)
+                    else:
+                        with visited_lock:
+                            pending[0] -= 1
+                            is_finished = pending[0] == 0
+                if is_finished:
+                    results_queue.put(_DONE)
+
+        workers = [threading.Thread(target=_worker) for _ in range(self._max_workers)]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+        for file_path in file_paths:
+            work_queue.put(file_path)
+
+        try:
+            while True:
+                dependency = results_queue.get()
+                if dependency is _DONE:
+                    break
+                if consumer:
+                    consumer(dependency)
+                yield dependency
+        finally:
+            for _ in workers:
+                work_queue.put(_DONE)
+
+    def get_dependencies(self, file_paths, consumer=None):
+        """
+        Returns all the dependencies of the given files once the crawl finishes
+        :param file_paths: list(str)
+        :param consumer: fn, optional function called with each found dependency
+        :return: list(str)
+        """
+
+        return list(self.crawl(file_paths, consumer=consumer))
+
+    @staticmethod
+    def _normalize(file_path):
+        return os.path.normpath(file_path).replace('\\', '/')
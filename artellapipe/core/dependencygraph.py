@@ -0,0 +1,354 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for a persistent graph of file dependencies
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, deque
+
+LOGGER = logging.getLogger('artellapipe')
+
+
+class DependencyGraph(object):
+    """
+    Class that stores the references of each file. References of a file are only parsed again when its modification
+    time or size changes (or its contents hash, if hashes are enabled). Graph can be stored on disk so it can be
+    reused between sessions
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_file=None, use_hash=False):
+        self._cache_file = cache_file
+        self._use_hash = use_hash
+        self._nodes = dict()
+        self._referencers = dict()
+        self._dirty = False
+        self._lock = threading.RLock()
+
+        if cache_file and os.path.isfile(cache_file):
+            self.load(cache_file)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, file_path):
+        return self._normalize(file_path) in self._nodes
+
+    @property
+    def cache_file(self):
+        """
+        Returns path where graph is stored
+        :return: str
+        """
+
+        return self._cache_file
+
+    @property
+    def is_dirty(self):
+        """
+        Returns whether graph changed since it was loaded or saved
+        :return: bool
+        """
+
+        return self._dirty
+
+    def update(self, file_path, parse_fn, recursive=True):
+        """
+        Updates the references of the given file (and of its references if recursive is True). Only files that
+        changed since the last update are parsed
+        :param file_path: str
+        :param parse_fn: fn, function that receives a file path and returns the paths directly referenced by the file
+        :param recursive: bool
+        :return: list(str), files parsed during the update
+        """
+
+        parsed_files = list()
+        visited = set()
+        files_to_update = deque([self._normalize(file_path)])
+
+        while files_to_update:
+            file_to_update = files_to_update.popleft()
+            if file_to_update in visited:
+                continue
+            visited.add(file_to_update)
+
+            references = self._update_node(file_to_update, parse_fn)
+            if references is None:
+                continue
+            if references is not False:
+                parsed_files.append(file_to_update)
+            if recursive:
+                with self._lock:
+                    files_to_update.extend(self._get_references(file_to_update))
+
+        return parsed_files
+
+    def get_direct_references(self, file_path, parse_fn):
+        """
+        Returns files directly referenced by the given file, parsing it only if it changed since last update.
+        Can be called from several threads at the same time
+        :param file_path: str
+        :param parse_fn: fn, function that receives a file path and returns the paths directly referenced by the file
+        :return: list(str)
+        """
+
+        file_path = self._normalize(file_path)
+        self._update_node(file_path, parse_fn)
+
+        with self._lock:
+            return list(self._get_references(file_path))
+
+    def get_references(self, file_path, recursive=False):
+        """
+        Returns files referenced by the given file
+        :param file_path: str
+        :param recursive: bool, Whether to return also the references of the references
+        :return: list(str)
+        """
+
+        return self._walk(self._normalize(file_path), self._get_references, recursive)
+
+    def get_referencing_files(self, file_path, recursive=False):
+        """
+        Returns files that reference the given file (for example, all the files that use a rig)
+        :param file_path: str
+        :param recursive: bool, Whether to return also the files that reference those files
+        :return: list(str)
+        """
+
+        return self._walk(self._normalize(file_path), self._get_referencers, recursive)
+
+    def get_topological_order(self, file_paths=None):
+        """
+        Returns given files and all their references sorted so each file is located after all its references.
+        Useful to update files in bulk, because dependencies are updated before the files that use them
+        :param file_paths: list(str), If not given, all files of the graph are sorted
+        :return: list(str)
+        """
+
+        with self._lock:
+            if file_paths is None:
+                files = list(self._nodes.keys())
+            else:
+                files = OrderedDict()
+                for file_path in file_paths:
+                    file_path = self._normalize(file_path)
+                    files[file_path] = None
+                    for reference in self.get_references(file_path, recursive=True):
+                        files[reference] = None
+                files = list(files.keys())
+
+            files_set = set(files)
+            pending_references = dict(
+                (file_path, len([ref for ref in self._get_references(file_path) if ref in files_set]))
+                for file_path in files)
+            ready = deque(file_path for file_path in files if not pending_references[file_path])
+
+            ordered_files = list()
+            while ready:
+                file_path = ready.popleft()
+                ordered_files.append(file_path)
+                for referencer in self._get_referencers(file_path):
+                    if referencer not in pending_references:
+                        continue
+                    pending_references[referencer] -= 1
+                    if pending_references[referencer] == 0:
+                        ready.append(referencer)
+
+        if len(ordered_files) != len(files):
+            cyclic_files = [file_path for file_path in files if pending_references[file_path] > 0]
+            LOGGER.warning('Cyclic references found between files: {}'.format(cyclic_files))
+            ordered_files.extend(cyclic_files)
+
+        return ordered_files
+
+    def remove(self, file_path):
+        """
+        Removes given file from the graph
+        :param file_path: str
+        """
+
+        file_path = self._normalize(file_path)
+        with self._lock:
+            node = self._nodes.pop(file_path, None)
+            if not node:
+                return
+            for reference in node['references']:
+                self._referencers.get(reference, set()).discard(file_path)
+            self._dirty = True
+
+    def clear(self):
+        """
+        Removes all the files of the graph
+        """
+
+        with self._lock:
+            self._nodes.clear()
+            self._referencers.clear()
+            self._dirty = True
+
+    def save(self, cache_file=None):
+        """
+        Stores graph in disk
+        :param cache_file: str, If not given, graph cache file is used
+        :return: bool
+        """
+
+        cache_file = cache_file or self._cache_file
+        if not cache_file:
+            return False
+
+        with self._lock:
+            data = {'version': self.VERSION, 'nodes': self._nodes}
+            cache_folder = os.path.dirname(cache_file)
+            try:
+                if cache_folder and not os.path.isdir(cache_folder):
+                    os.makedirs(cache_folder)
+                temp_file = '{}.tmp'.format(cache_file)
+                with open(temp_file, 'w') as fh:
+                    json.dump(data, fh)
+                if os.path.isfile(cache_file):
+                    os.remove(cache_file)
+                os.rename(temp_file, cache_file)
+            except (IOError, OSError) as exc:
+                LOGGER.warning('Impossible to store dependency graph in "{}": {}'.format(cache_file, exc))
+                return False
+            self._dirty = False
+
+        return True
+
+    def load(self, cache_file=None):
+        """
+        Loads graph from disk
+        :param cache_file: str, If not given, graph cache file is used
+        :return: bool
+        """
+
+        cache_file = cache_file or self._cache_file
+        try:
+            with open(cache_file, 'r') as fh:
+                data = json.load(fh)
+        except (IOError, OSError, ValueError) as exc:
+            LOGGER.warning('Impossible to load dependency graph from "{}": {}'.format(cache_file, exc))
+            return False
+
+        if data.get('version', None) != self.VERSION:
+            return False
+
+        with self._lock:
+            self._nodes = data.get('nodes', dict())
+            self._referencers = dict()
+            for file_path, node in self._nodes.items():
+                for reference in node['references']:
+                    self._referencers.setdefault(reference, set()).add(file_path)
+            self._dirty = False
+
+        return True
+
+    def _update_node(self, file_path, parse_fn):
+        """
+        Internal function that parses the given file if it changed since last update. Files are parsed without
+        locking the graph, so several files can be updated at the same time from different threads
+        :param file_path: str
+        :param parse_fn: fn
+        :return: list(str) if file was parsed, False if cached references are valid and None if file does not exist
+        """
+
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            if file_path in self._nodes:
+                self.remove(file_path)
+            return None
+
+        with self._lock:
+            node = self._nodes.get(file_path, None)
+            if node and node['mtime'] == file_stat.st_mtime and node['size'] == file_stat.st_size:
+                return False
+
+        file_hash = self._get_hash(file_path) if self._use_hash else None
+        if node and file_hash and node.get('hash', None) == file_hash:
+            with self._lock:
+                node['mtime'] = file_stat.st_mtime
+                self._dirty = True
+            return False
+
+        references = list(OrderedDict.fromkeys(
+            self._normalize(reference) for reference in parse_fn(file_path) or list() if reference))
+
+        with self._lock:
+            node = self._nodes.get(file_path, None)
+            if node:
+                for reference in node['references']:
+                    self._referencers.get(reference, set()).discard(file_path)
+            for reference in references:
+                self._referencers.setdefault(reference, set()).add(file_path)
+
+            self._nodes[file_path] = {
+                'mtime': file_stat.st_mtime, 'size': file_stat.st_size, 'hash': file_hash, 'references': references}
+            self._dirty = True
+
+        return references
+
+    def _get_references(self, file_path):
+        node = self._nodes.get(file_path, None)
+        return node['references'] if node else list()
+
+    def _get_referencers(self, file_path):
+        return sorted(self._referencers.get(file_path, set()))
+
+    def _walk(self, file_path, neighbours_fn, recursive):
+        """
+        Internal function that returns files connected with the given one
+        :param file_path: str
+        :param neighbours_fn: fn, function that returns the files directly connected to a file
+        :param recursive: bool
+        :return: list(str)
+        """
+
+        with self._lock:
+            if not recursive:
+                return list(neighbours_fn(file_path))
+
+            found_files = OrderedDict()
+            files_to_visit = deque(neighbours_fn(file_path))
+            while files_to_visit:
+                file_to_visit = files_to_visit.popleft()
+                if file_to_visit in found_files or file_to_visit == file_path:
+                    continue
+                found_files[file_to_visit] = None
+                files_to_visit.extend(neighbours_fn(file_to_visit))
+
+        return list(found_files.keys())
+
+    def _get_hash(self, file_path):
+        """
+        Internal function that returns the hash of the contents of the given file
+        :param file_path: str
+        :return: str
+        """
+
+        file_hash = hashlib.md5()
+        with open(file_path, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
+    @staticmethod
+    def _normalize(file_path):
+        return os.path.normpath(file_path).replace('\\', '/')
@@ -19,8 +19,9 @@ import tpDcc as tp
 from tpDcc.libs.python import decorators, python, path as path_utils
 
 import artellapipe
-from artellapipe.core import defines
+from artellapipe.core import defines, localversions, versioncache
 from artellapipe.libs.artella.core import artellalib
+from artellapipe.utils import metrics
 
 LOGGER = logging.getLogger('artellapipe')
 
@@ -37,9 +38,7 @@ class ArtellaFile(object):
         self._file_name = self._get_name(file_name)
         self._file_path = self._get_path(file_path)
         self._extensions = self._get_extensions(file_extension)
-        self._history = None
         self._working_status = None
-        self._working_history = None
         self._latest_server_version = {
             defines.ArtellaFileStatus.WORKING: None,
             defines.ArtellaFileStatus.PUBLISHED: None
@@ -154,6 +153,7 @@ class ArtellaFile(object):
     def get_history(self, status, force_update=False):
         """
         Returns the history of the asset files
+        History is stored in a cache shared by all files, so file instances recreated by get_file_type reuse it
         :param status: ArtellaFileStatus
         :param force_update: bool
         :return:
@@ -161,18 +161,12 @@ class ArtellaFile(object):
 
         # TODO: Add support for both working and published files
 
-        if self._history and not force_update:
-            return self._history
-
         file_name = self.get_name()
         file_path = self.get_path()
         working_folder = self._project.get_working_folder()
         file_path = os.path.join(file_path, working_folder, self.FILE_TYPE, file_name + self.FILE_EXTENSIONS[0])
-        history = artellalib.get_file_history(file_path=file_path)
-
-        self._history = history
 
-        return self._history
+        return versioncache.get_history_cache().get_history(file_path, force_update=force_update)
 
     def get_file_paths(self, return_first=False, fix_path=True, **kwargs):
         """
@@ -312,29 +306,25 @@ class ArtellaFile(object):
                     self.FILE_TYPE))
             return local_versions
 
-        for extension in self.FILE_EXTENSIONS:
+        # Only published files are stored in version folders
+        if status != defines.ArtellaFileStatus.PUBLISHED or not self.FILE_EXTENSIONS:
+            return local_versions
 
-            template_dict = self.get_template_dict(extension=extension)
+        extension = self.FILE_EXTENSIONS[0]
+        template_dict = self.get_template_dict(extension=extension)
 
-            folders_to_check = list()
-            working_folder = self._project.get_working_folder()
-            if status == defines.ArtellaFileStatus.PUBLISHED:
-                for p in os.listdir(file_path):
-                    if p == working_folder:
-                        continue
-                    folders_to_check.append(p)
-            for folder in folders_to_check:
-                template_dict['version_folder'] = folder
-                file_path = file_type_template.format(template_dict)
-                file_path = artellapipe.FilesMgr().prefix_path_with_project_path(file_path)
-                if file_path and os.path.exists(file_path):
-                    version = artellalib.split_version(folder)
-                    if version:
-                        local_versions[str(version[1])] = folder
+        def _has_version_file(version_folder):
+            version_dict = dict(template_dict)
+            version_dict['version_folder'] = version_folder
+            version_path = file_type_template.format(version_dict)
+            version_path = artellapipe.FilesMgr().prefix_path_with_project_path(version_path)
+            return bool(version_path and os.path.exists(version_path))
 
-            return local_versions
+        # Version folders listing is shared between all file types located in the same path
+        version_index = localversions.get_local_version_index(
+            file_path, ignored_folders=[self._project.get_working_folder()])
 
-        return local_versions
+        return version_index.get_versions(resolve_fn=_has_version_file, version_fn=artellalib.split_version)
 
     def get_latest_local_versions(self, status=None, next_version=False):
         """
@@ -396,7 +386,7 @@ class ArtellaFile(object):
 
         return latest_local_versions
 
-    @decorators.timestamp
+    @metrics.timed('file.get_server_versions')
     def get_server_versions(self, status=None, all_versions=True, force_update=False):
         """
         Returns all server version of the current file type in the wrapped asset
@@ -644,7 +634,4 @@ class ArtellaFile(object):
         file_name = os.path.basename(ref_path)
         for extension in self.FILE_EXTENSIONS:
             if file_name == '{}{}'.format(asset_name, extension):
-                if not force_update and self._working_history:
-                    return self._working_history
-                else:
-                    return artellalib.get_file_history(ref_path)
+                return versioncache.get_history_cache().get_history(ref_path, force_update=force_update)
@@ -0,0 +1,85 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions used to query data of several file types of an Artella file at once
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+from artellapipe.utils import concurrency
+
+
+def query_file_types(file_types, get_file_type_fn, query_fn, concurrent=False, max_workers=None):
+    """
+    Executes given query in all the given file types. File types whose object cannot be retrieved are skipped
+    :param file_types: list(str), names of the file types to query
+    :param get_file_type_fn: fn, function that receives a file type name and returns its file type object or None
+    :param query_fn: fn, function that receives a file type object and returns the result of the query
+    :param concurrent: bool, If True, file types are queried concurrently in a bounded pool of threads. Otherwise,
+        file types are queried lazily one after another while the results are consumed
+    :param max_workers: int, maximum number of threads used when querying concurrently
+    :return: iterator(tuple(str, variant)), tuples of (file type name, query result)
+    """
+
+    def _query(file_type_name):
+        file_type = get_file_type_fn(file_type_name)
+        if not file_type:
+            return None, None
+        return file_type, query_fn(file_type)
+
+    def _iterate():
+        for file_type_name in file_types:
+            file_type, result = _query(file_type_name)
+            if file_type:
+                yield file_type_name, result
+
+    if not concurrent:
+        return _iterate()
+
+    results = concurrency.map_concurrent(_query, file_types, max_workers=max_workers)
+
+    return [
+        (file_type_name, result) for file_type_name, (file_type, result) in zip(file_types, results) if file_type]
+
+
+def get_files(file_types, get_file_fn, concurrent=False, max_workers=None):
+    """
+    Returns file paths of all the given file types
+    :param file_types: list(str)
+    :param get_file_fn: fn, function that receives a file type name and returns its file path or None
+    :param concurrent: bool, Whether file types should be queried concurrently or not
+    :param max_workers: int, maximum number of threads used when querying concurrently
+    :return: dict(str, str), dictionary that maps each file type with its file path
+    """
+
+    file_types = list(file_types)
+    if concurrent:
+        files_paths = concurrency.map_concurrent(get_file_fn, file_types, max_workers=max_workers)
+    else:
+        files_paths = [get_file_fn(file_type) for file_type in file_types]
+
+    return dict(zip(file_types, files_paths))
+
+
+def is_any_published(published_infos):
+    """
+    Returns whether any of the given file types is published. A file type is published if it has published versions
+    and all of them have a valid path. Results are consumed lazily, so sequential queries stop as soon as a published
+    file type is found
+    :param published_infos: iterable(tuple(str, list(dict))), tuples of (file type name, published versions info)
+    :return: bool
+    """
+
+    for _, latest_published_info in published_infos:
+        if not latest_published_info:
+            continue
+        if all(version_info.get('version_path', None) for version_info in latest_published_info):
+            return True
+
+    return False
@@ -0,0 +1,282 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for transactions that lock, upload and unlock several files at once
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+
+from artellapipe.utils import concurrency
+from artellapipe.core import versioncache
+
+LOGGER = logging.getLogger('artellapipe')
+
+
+class FilesTransaction(object):
+    """
+    Class that uploads a new version of several files with a single comment. All files are locked together, current
+    versions are computed with a single status query per folder, files are uploaded and finally all the files locked
+    by the transaction are unlocked (also if something goes wrong).
+    Can be used as a context manager: files are committed when the context finishes without errors.
+
+        with FilesTransaction(comment='New shaders version') as transaction:
+            transaction.lock(shader_files)
+            ... write shader files ...
+    """
+
+    MAX_WORKERS = 8
+
+    def __init__(
+            self, files=None, comment=None, skip_saving=True, upload=True, client=None, max_workers=None,
+            version_cache=None, history_cache=None, use_history=False):
+        """
+        :param files: list(str), files to upload
+        :param comment: str or fn, comment of the new versions. If it is a function, it is called with a dictionary
+            that maps files with their new versions when the comment is needed
+        :param skip_saving: bool, Whether current DCC scene should not be saved before uploading. Scene is saved
+            once in the calling thread, uploads never save the scene because they are done in worker threads
+        :param upload: bool, If False, files are only locked and unlocked
+        :param client: module, object used to communicate with Artella. If not given, artellalib is used
+        :param max_workers: int, maximum number of Artella calls done at the same time
+        :param version_cache: VersionCache, If given, it is updated with the versions of the uploaded files
+        :param history_cache: HistoryCache, If given, cached histories of the uploaded files are invalidated
+        :param use_history: bool, Whether the history of a file is used to retrieve its current version when the
+            status of its folder does not contain it (indie projects)
+        """
+
+        self._files = OrderedDict()
+        self._locked_files = OrderedDict()
+        self._comment = comment
+        self._skip_saving = skip_saving
+        self._upload = upload
+        self._client = client
+        self._max_workers = max_workers or self.MAX_WORKERS
+        self._version_cache = version_cache
+        self._history_cache = history_cache
+        self._use_history = use_history
+        self._versions = dict()
+        self._uploaded_files = list()
+        self._lock = threading.Lock()
+
+        self.add(files or list())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+        return False
+
+    @property
+    def client(self):
+        if self._client is None:
+            from artellapipe.libs.artella.core import artellalib
+            self._client = artellalib
+
+        return self._client
+
+    @property
+    def files(self):
+        return list(self._files.keys())
+
+    @property
+    def locked_files(self):
+        return list(self._locked_files.keys())
+
+    @property
+    def uploaded_files(self):
+        return list(self._uploaded_files)
+
+    @property
+    def versions(self):
+        """
+        Returns dictionary that maps files with the version they were uploaded with
+        :return: dict(str, int)
+        """
+
+        return dict(self._versions)
+
+    def add(self, files):
+        """
+        Adds given files to the transaction
+        :param files: str or list(str)
+        """
+
+        files = [files] if not isinstance(files, (list, tuple, set)) else files
+        for file_path in files:
+            if file_path:
+                self._files[file_path] = None
+
+    def lock(self, files=None):
+        """
+        Locks given files (adding them to the transaction) or all the files of the transaction that are not locked yet
+        :param files: str or list(str)
+        :return: bool, True if all the files were locked
+        """
+
+        if files:
+            self.add(files)
+            files = [files] if not isinstance(files, (list, tuple, set)) else files
+        else:
+            files = self.files
+        files_to_lock = [file_path for file_path in files if file_path and file_path not in self._locked_files]
+        if not files_to_lock:
+            return True
+
+        def _lock(file_path):
+            try:
+                return self.client.lock_file(file_path=file_path, force=True)
+            except Exception as exc:
+                LOGGER.warning('Impossible to lock file "{}": {}'.format(file_path, exc))
+                return False
+
+        results = concurrency.map_concurrent(_lock, files_to_lock, max_workers=self._max_workers)
+        with self._lock:
+            for file_path, valid_lock in zip(files_to_lock, results):
+                if valid_lock:
+                    self._locked_files[file_path] = None
+
+        failed_files = [file_path for file_path, valid_lock in zip(files_to_lock, results) if not valid_lock]
+        if failed_files:
+            LOGGER.warning('Impossible to lock files: {}'.format(failed_files))
+            return False
+
+        return True
+
+    def get_current_versions(self, files=None):
+        """
+        Returns current server version of the given files. Status of each folder is only requested once
+        :param files: list(str), If not given, all the files of the transaction are used
+        :return: dict(str, int), dictionary that maps files with its current version (0 if file has no versions)
+        """
+
+        files = files or self.files
+        files_by_folder = OrderedDict()
+        for file_path in files:
+            files_by_folder.setdefault(os.path.dirname(file_path), list()).append(file_path)
+
+        def _get_folder_versions(folder_path):
+            folder_versions = dict()
+            try:
+                status = self.client.get_status(folder_path)
+            except Exception as exc:
+                LOGGER.debug('Impossible to retrieve status of "{}": {}'.format(folder_path, exc))
+                status = None
+            references = getattr(status, 'references', None) or dict()
+            for file_path in files_by_folder[folder_path]:
+                reference = references.get(os.path.basename(file_path), None)
+                max_version = getattr(reference, 'maximum_version', None) if reference else None
+                if max_version is None:
+                    # Status of the folder does not contain the file, so its version is requested directly
+                    if self._use_history:
+                        max_version = versioncache.query_history_version(file_path, client=self.client)
+                    else:
+                        max_version = self.client.get_current_version(file_path)
+                folder_versions[file_path] = max(0, int(max_version or 0))
+            return folder_versions
+
+        versions = dict()
+        for folder_versions in concurrency.map_concurrent(
+                _get_folder_versions, list(files_by_folder.keys()), max_workers=self._max_workers):
+            versions.update(folder_versions)
+
+        return versions
+
+    def commit(self):
+        """
+        Locks all the files that are not locked yet, uploads them with the transaction comment and unlocks them
+        :return: bool, True if all the files were uploaded
+        """
+
+        try:
+            if not self._files:
+                return True
+            if not self.lock():
+                return False
+            if not self._upload:
+                return True
+
+            current_versions = self.get_current_versions()
+            new_versions = dict((file_path, version + 1) for file_path, version in current_versions.items())
+            comment = self._comment(new_versions) if callable(self._comment) else self._comment
+            if not comment:
+                LOGGER.warning('Files are not uploaded because no comment was given')
+                return False
+
+            if not self._skip_saving:
+                self._save_scene()
+
+            files_to_upload = [file_path for file_path in self.files if os.path.isfile(file_path)]
+
+            def _upload(file_path):
+                try:
+                    return self.client.upload_new_asset_version(
+                        file_path=file_path, comment=str(comment), skip_saving=True) is not False
+                except Exception as exc:
+                    LOGGER.warning('Impossible to upload file "{}": {}'.format(file_path, exc))
+                    return False
+
+            results = concurrency.map_concurrent(_upload, files_to_upload, max_workers=self._max_workers)
+            for file_path, valid_upload in zip(files_to_upload, results):
+                if valid_upload:
+                    self._uploaded_files.append(file_path)
+                    self._versions[file_path] = new_versions[file_path]
+            if self._version_cache is not None:
+                self._version_cache.update(self._versions)
+            if self._history_cache is not None:
+                for file_path in self._uploaded_files:
+                    self._history_cache.invalidate(file_path)
+
+            return len(self._uploaded_files) == len(self._files)
+        finally:
+            self.unlock()
+
+    def _save_scene(self):
+        """
+        Internal function that saves current DCC scene before uploading the files
+        """
+
+        import tpDcc as tp
+
+        tp.Dcc.save_current_scene(force=False)
+
+    def rollback(self):
+        """
+        Unlocks all the files locked by the transaction without uploading them
+        """
+
+        self.unlock()
+
+    def unlock(self):
+        """
+        Unlocks all the files locked by the transaction
+        """
+
+        with self._lock:
+            files_to_unlock = self.locked_files
+            self._locked_files.clear()
+        if not files_to_unlock:
+            return
+
+        def _unlock(file_path):
+            try:
+                self.client.unlock_file(file_path=file_path)
+            except Exception as exc:
+                LOGGER.warning('Impossible to unlock file "{}": {}'.format(file_path, exc))
+
+        concurrency.map_concurrent(_unlock, files_to_unlock, max_workers=self._max_workers)
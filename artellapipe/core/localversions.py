@@ -0,0 +1,164 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains index of local versions folders shared by all the file types of an asset
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import threading
+
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
+
+# Local version indices registry, indexed by path
+_INDICES = dict()
+_INDICES_LOCK = threading.Lock()
+
+
+class LocalVersionIndex(object):
+    """
+    Class that stores version folders located in a path. Folders are listed in a single pass and listing is reused
+    until the modification time of the path changes, so all file types of the same asset share a single folder
+    listing. Version numbers parsed from folder names are cached with the listing
+    """
+
+    def __init__(self, path, ignored_folders=None):
+        self._path = path
+        self._ignored_folders = frozenset(ignored_folders or list())
+        self._mtime = None
+        self._folders = list()
+        self._parsed_folders = dict()
+        self._lock = threading.RLock()
+
+    @property
+    def path(self):
+        """
+        Returns path indexed by this index
+        :return: str
+        """
+
+        return self._path
+
+    def refresh(self, force=False):
+        """
+        Scans index path again if its modification time changed since last scan
+        :param force: bool, Whether to force the scan of the path
+        :return: bool, True if the path was scanned again; False otherwise
+        """
+
+        try:
+            mtime = os.stat(self._path).st_mtime
+        except OSError:
+            mtime = None
+
+        with self._lock:
+            if not force and self._mtime is not None and mtime == self._mtime:
+                return False
+
+            self._mtime = mtime
+            self._folders = self._scan() if mtime is not None else list()
+            self._parsed_folders.clear()
+
+        return True
+
+    def invalidate(self):
+        """
+        Forces the scan of the index path next time index data is requested
+        """
+
+        with self._lock:
+            self._mtime = None
+
+    def get_folders(self):
+        """
+        Returns names of all the folders located in the index path
+        :return: list(str)
+        """
+
+        self.refresh()
+
+        return list(self._folders)
+
+    def get_versions(self, resolve_fn, version_fn):
+        """
+        Returns dictionary that maps version numbers with the folders that contain a valid file. Contents of version
+        folders can change without modifying the index path, so folders are validated each time versions are requested
+        :param resolve_fn: fn, function that receives a folder name and returns whether it contains a valid file
+        :param version_fn: fn, function that receives a folder name and returns a tuple (version name, version number)
+        :return: dict(str, str)
+        """
+
+        self.refresh()
+
+        with self._lock:
+            for folder in self._folders:
+                if folder not in self._parsed_folders:
+                    self._parsed_folders[folder] = version_fn(folder)
+            parsed_folders = [(folder, self._parsed_folders[folder]) for folder in self._folders]
+
+        versions = dict()
+        for folder, version in parsed_folders:
+            if version and resolve_fn(folder):
+                versions[str(version[1])] = folder
+
+        return versions
+
+    def _scan(self):
+        """
+        Internal function that lists all the folders of the index path
+        :return: list(str)
+        """
+
+        if scandir is None:
+            return [name for name in os.listdir(self._path) if name not in self._ignored_folders]
+
+        return [
+            entry.name for entry in scandir(self._path)
+            if entry.name not in self._ignored_folders and entry.is_dir()]
+
+
+def get_local_version_index(path, ignored_folders=None):
+    """
+    Returns local version index of the given path. Index is shared by all the callers that request the same path
+    :param path: str
+    :param ignored_folders: list(str), folders that are not taken into account (used when the index is created)
+    :return: LocalVersionIndex
+    """
+
+    version_index = _INDICES.get(path, None)
+    if version_index is not None:
+        return version_index
+
+    with _INDICES_LOCK:
+        version_index = _INDICES.get(path, None)
+        if version_index is None:
+            version_index = LocalVersionIndex(path, ignored_folders=ignored_folders)
+            _INDICES[path] = version_index
+
+    return version_index
+
+
+def invalidate_local_version_indices(path=None):
+    """
+    Invalidates local version indices. Must be called after files are synchronized into user hard drive
+    :param path: str, if given only the index of the given path is invalidated
+    """
+
+    if path:
+        version_index = _INDICES.get(path, None)
+        if version_index is not None:
+            version_index.invalidate()
+        return
+
+    for version_index in list(_INDICES.values()):
+        version_index.invalidate()
@@ -0,0 +1,177 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for the registry of media profiles files
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import copy
+import threading
+
+from artellapipe.utils import orderedset
+
+
+class MediaProfileRegistry(object):
+    """
+    Class that indexes media profiles files by name. Media profiles folders are only walked when the registry is
+    built (or when its media paths change) and profiles data is parsed once and reused until the modification time
+    of the profile file changes
+    """
+
+    def __init__(self, media_paths, extensions, load_fn=None, path_utils=None):
+        """
+        :param media_paths: list(str), paths where media profiles are searched in
+        :param extensions: list(str), extensions of media profiles files
+        :param load_fn: fn, function that receives a media profile path and returns its data. If not given, profile
+            is read as a YAML file
+        :param path_utils: module, object with clean_path function. If not given, tpDcc.libs.python.path is used
+        """
+
+        if path_utils is None:
+            from tpDcc.libs.python import path as path_utils
+
+        self._media_paths = list(media_paths or list())
+        self._extensions = frozenset(ext.lower() for ext in extensions or list())
+        self._load_fn = load_fn or _read_yaml
+        self._path_utils = path_utils
+        self._profiles = None
+        self._paths = list()
+        self._data = dict()
+        self._lock = threading.RLock()
+
+    @property
+    def media_paths(self):
+        """
+        Returns paths where media profiles are searched in
+        :return: list(str)
+        """
+
+        return self._media_paths
+
+    def set_media_paths(self, media_paths, extensions=None):
+        """
+        Updates paths where media profiles are searched in. Profiles are indexed again only if paths or extensions
+        are different from the current ones
+        :param media_paths: list(str)
+        :param extensions: list(str), If not given, current extensions are kept
+        :return: bool, True if the registry was invalidated; False otherwise
+        """
+
+        media_paths = list(media_paths or list())
+        extensions = self._extensions if extensions is None else frozenset(ext.lower() for ext in extensions)
+
+        with self._lock:
+            if media_paths == self._media_paths and extensions == self._extensions:
+                return False
+            self._media_paths = media_paths
+            self._extensions = extensions
+            self.refresh()
+
+        return True
+
+    def get_paths(self):
+        """
+        Returns paths to all the indexed media profiles
+        :return: list(str)
+        """
+
+        self._build()
+
+        return list(self._paths)
+
+    def get_path(self, media_profile_name):
+        """
+        Returns path to the media profile with given name. Name can be given with or without extension
+        :param media_profile_name: str
+        :return: str or None
+        """
+
+        self._build()
+
+        return self._profiles.get(media_profile_name, None)
+
+    def get_data(self, media_profile_name):
+        """
+        Returns data stored in the media profile with given name
+        :param media_profile_name: str
+        :return: dict
+        """
+
+        media_profile_path = self.get_path(media_profile_name)
+        if not media_profile_path:
+            return dict()
+
+        try:
+            mtime = os.stat(media_profile_path).st_mtime
+        except OSError:
+            with self._lock:
+                self._data.pop(media_profile_path, None)
+            return dict()
+
+        with self._lock:
+            cached_data = self._data.get(media_profile_path, None)
+            if not cached_data or cached_data[0] != mtime:
+                cached_data = (mtime, self._load_fn(media_profile_path) or dict())
+                self._data[media_profile_path] = cached_data
+
+        return copy.deepcopy(cached_data[1])
+
+    def refresh(self):
+        """
+        Forces the indexing of media profiles and the parsing of its data next time they are requested
+        """
+
+        with self._lock:
+            self._profiles = None
+            self._paths = list()
+            self._data.clear()
+
+    def _build(self):
+        """
+        Internal function that walks media profiles paths and indexes all found profiles by name
+        """
+
+        if self._profiles is not None:
+            return
+
+        with self._lock:
+            if self._profiles is not None:
+                return
+
+            paths_found = orderedset.OrderedSet()
+            for media_path in self._media_paths:
+                for root, _, files in os.walk(media_path):
+                    for file_name in files:
+                        file_ext = os.path.splitext(file_name)[-1].lower()
+                        if file_ext in self._extensions:
+                            paths_found.add(self._path_utils.clean_path(os.path.join(root, file_name)))
+
+            # First found profile has priority. Profiles can be retrieved with or without its extension
+            profiles = dict()
+            for media_profile_path in paths_found:
+                profile_name = os.path.basename(media_profile_path)
+                profiles.setdefault(profile_name, media_profile_path)
+                profiles.setdefault(os.path.splitext(profile_name)[0], media_profile_path)
+
+            self._paths = paths_found.to_list()
+            self._profiles = profiles
+
+
+def _read_yaml(media_profile_path):
+    """
+    Internal function that reads given media profile YAML file
+    :param media_profile_path: str
+    :return: dict
+    """
+
+    from tpDcc.libs.python import yamlio
+
+    return yamlio.read_file(media_profile_path) or dict()
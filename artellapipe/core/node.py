@@ -24,6 +24,7 @@ from tpDcc.libs.python import decorators
 
 import artellapipe.register
 from artellapipe.core import defines
+from artellapipe.utils import orderedset
 
 LOGGER = logging.getLogger()
 
@@ -567,13 +568,11 @@ class ArtellaAssetNode(ArtellaDCCNode, object):
             LOGGER.warning('No shaders found ... ({})'.format(status))
             return
 
-        shaders_files = list()
+        shaders_files = orderedset.OrderedSet()
         for shader in shaders:
-            shader_file_path = artellapipe.ShadersMgr().get_shader_path(shader)
-            if shader_file_path not in shaders_files:
-                shaders_files.append(shader_file_path)
+            shaders_files.add(artellapipe.ShadersMgr().get_shader_path(shader))
 
-        return shaders_files
+        return shaders_files.to_list()
 
     def load_shaders(self, status=defines.ArtellaFileStatus.PUBLISHED, apply_shaders=True):
         """
@@ -0,0 +1,176 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for a queue that captures playblasts of several shots reusing the same capture
+panel and stamps captured frames in background
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import re
+import glob
+import logging
+import mimetypes
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+LOGGER = logging.getLogger('artellapipe')
+
+# Name of the folder, next to the captured frames, where stamped frames are stored
+STAMPED_FOLDER = 'stamped'
+
+
+def get_playblast_frames(playblast_path):
+    """
+    Returns paths of the image frames generated by a playblast
+    :param playblast_path: str, path returned by capture. Image sequences can use # characters as frame padding
+    :return: list(str)
+    """
+
+    if not playblast_path:
+        return list()
+
+    if '#' in playblast_path:
+        frames_pattern = re.sub('#+', lambda match: '[0-9]' * len(match.group(0)), playblast_path)
+        return sorted(glob.glob(frames_pattern))
+
+    if not os.path.isfile(playblast_path):
+        return list()
+
+    mime_type = mimetypes.guess_type(playblast_path)[0] or ''
+
+    return [playblast_path] if mime_type.startswith('image') else list()
+
+
+def get_stamped_path(playblast_path):
+    """
+    Returns path where stamped version of the given playblast (or playblast frame) is stored. Stamped frames are
+    stored in a different folder, so captured frames are never overwritten
+    :param playblast_path: str
+    :return: str
+    """
+
+    return os.path.join(os.path.dirname(playblast_path), STAMPED_FOLDER, os.path.basename(playblast_path))
+
+
+class PlayblastCaptureQueue(object):
+    """
+    Class that captures playblasts of several shots one after another. A single capture panel is created by the
+    playblasts manager for all the captures and it is given to each capture with the panel option. Stamping of a
+    captured shot is done in background while next shot is captured
+    """
+
+    def __init__(self, playblasts_manager, stamp_fn=None, **kwargs):
+        """
+        :param playblasts_manager: PlayblastsManager
+        :param stamp_fn: fn, function called with the captured frames and the paths where stamped frames must be
+            stored. If not given, frames are not stamped
+        :param kwargs: dict, capture options shared by all the shots
+        """
+
+        self._manager = playblasts_manager
+        self._stamp_fn = stamp_fn
+        self._options = kwargs
+        self._items = list()
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, shot_name, **kwargs):
+        """
+        Adds a new capture to the queue
+        :param shot_name: str
+        :param kwargs: dict, capture options that override queue capture options for this capture
+        """
+
+        self._items.append((shot_name, kwargs))
+
+    def add_shot(self, shot, filename=None, timing_table=None, **kwargs):
+        """
+        Adds given shot to the queue
+        :param shot: ArtellaShot
+        :param filename: str, playblast filename. Can contain tokens that are resolved using shot capture options
+        :param timing_table: ShotTimingTable, table used to retrieve shot ranges. If not given, shot node is read
+        :param kwargs: dict, capture options that override queue capture options for this shot
+        """
+
+        shot_timing = timing_table.get_timing(shot.get_name()) if timing_table else None
+        if shot_timing:
+            sequence_range = (shot_timing.sequencer_start_frame, shot_timing.sequencer_end_frame)
+        else:
+            sequence_range = (shot.get_sequencer_start_frame(), shot.get_sequencer_end_frame())
+        shot_data = shot.get_data(sequence_range=sequence_range, timing_table=timing_table)
+
+        options = dict(kwargs)
+        options.setdefault('camera', shot_data['camera'])
+        options.setdefault('start_frame', shot_data['time_start_frame'])
+        options.setdefault('end_frame', shot_data['time_end_frame'])
+        if filename:
+            options['filename'] = filename
+
+        self.add(shot_data['shot_name'], **options)
+
+    def run(self):
+        """
+        Captures all the shots in the queue
+        :return: OrderedDict(str, str), dictionary that maps each captured shot name with its playblast path. If
+            frames are stamped, path of the stamped playblast is returned
+        """
+
+        results = OrderedDict()
+        if not self._items:
+            return results
+
+        options = dict(self._options)
+        options.setdefault('off_screen', True)
+
+        # Stamping is executed in a background thread (that sends frames to a pool of processes) so the next shot
+        # can be captured while the previous one is being stamped
+        stamp_pool = ThreadPool(processes=1) if self._stamp_fn else None
+        stamp_results = list()
+
+        panel = self._manager._create_capture_panel(**options)
+        try:
+            for shot_name, shot_options in self._items:
+                capture_options = dict(options)
+                capture_options.update(shot_options)
+                capture_options['panel'] = panel
+                filename = capture_options.get('filename', None)
+                if filename:
+                    token_context = self._manager.create_token_context(capture_options)
+                    capture_options['filename'] = self._manager.format_tokens(filename, context=token_context)
+
+                output = self._manager.capture(**capture_options)
+                results[shot_name] = output
+                if not output or not stamp_pool:
+                    continue
+
+                frames = get_playblast_frames(output)
+                if not frames:
+                    LOGGER.warning('Playblast "{}" cannot be stamped. Only image sequences can be stamped!'.format(
+                        output))
+                    continue
+                stamped_frames = [get_stamped_path(frame) for frame in frames]
+                stamp_results.append(
+                    (shot_name, output, stamp_pool.apply_async(self._stamp_fn, (frames, stamped_frames))))
+        finally:
+            self._manager._delete_capture_panel(panel)
+            if stamp_pool:
+                stamp_pool.close()
+                stamp_pool.join()
+
+        for shot_name, output, stamp_result in stamp_results:
+            try:
+                if stamp_result.get():
+                    results[shot_name] = get_stamped_path(output)
+            except Exception as exc:
+                LOGGER.error('Error while stamping playblast "{}": {}'.format(output, exc))
+
+        return results
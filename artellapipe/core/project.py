@@ -22,6 +22,7 @@ import datetime
 import importlib
 import traceback
 import webbrowser
+from collections import namedtuple
 
 from Qt.QtCore import *
 from Qt.QtWidgets import *
@@ -45,12 +46,19 @@ from artellapipe.libs.artella.core import artellalib
 
 LOGGER = logging.getLogger('artellapipe')
 
+# Immutable struct that stores project values used during path resolution
+ArtellaProjectContext = namedtuple('ArtellaProjectContext', [
+    'env_var', 'project_path', 'project_type', 'root_prefix', 'artella_root', 'working_folder',
+    'production_folder', 'data_path', 'clean_name'])
+
 
 class ArtellaProject(object):
     def __init__(self, name, settings=None):
         super(ArtellaProject, self).__init__()
 
         self._tray = None
+        self._context = None
+        self._context_key = None
 
         clean_name = self._get_clean_name(name)
 
@@ -79,10 +87,11 @@ class ArtellaProject(object):
         self.init_settings()
 
     def __getattr__(self, attr_name):
-        if attr_name not in self._config_data:
+        config_data = self.__dict__.get('_config_data', None)
+        if config_data is None or attr_name not in config_data:
             raise AttributeError('{} has no attribute {}'.format(self.__class__.__name__, attr_name))
 
-        attr_data = self._config_data[attr_name]
+        attr_data = config_data[attr_name]
         return attr_data
 
     # ==========================================================================================================
@@ -415,6 +424,32 @@ class ArtellaProject(object):
 
         return data_path
 
+    def get_context(self, force_update=False):
+        """
+        Returns context of the project. Context values are computed only once per environment change
+        :param force_update: bool, Whether to force the computation of the context
+        :return: ArtellaProjectContext
+        """
+
+        context = self._context
+        if context and not force_update:
+            context_key = (os.environ.get(context.env_var), os.environ.get(context.root_prefix))
+            if context_key == self._context_key:
+                return context
+
+        self._context = self._create_context()
+        self._context_key = (self._context.project_path, self._context.artella_root)
+
+        return self._context
+
+    def invalidate_context(self):
+        """
+        Forces the computation of the project context next time it is requested
+        """
+
+        self._context = None
+        self._context_key = None
+
     def get_settings_file(self):
         """
         Returns file path of the window settings file
@@ -558,6 +593,8 @@ class ArtellaProject(object):
             os.environ['{}_SLACK_API_TOKEN'.format(self.get_clean_name().upper())] = 'xoxb-{}'.format(slack_token)
             os.environ['{}_SLACK_CHANNEL'.format(self.get_clean_name().upper())] = slack_channel
 
+        self.invalidate_context()
+
         LOGGER.debug('=' * 100)
         LOGGER.debug("{} Pipeline initialization completed!".format(self.name))
         LOGGER.debug('=' * 100)
@@ -695,6 +732,11 @@ class ArtellaProject(object):
         :return: str
         """
 
+        if not force_update:
+            project_path = self.get_context().project_path
+            if project_path:
+                return project_path
+
         env_var = os.environ.get(self.env_var, None)
 
         if not env_var or force_update:
@@ -737,7 +779,7 @@ class ArtellaProject(object):
         :return: str
         """
 
-        return artellapipe.libs.artella.config.get('server', self.get_project_type()).get('working_folder')
+        return self.get_context().working_folder
 
     def get_production_folder_name(self):
         """
@@ -753,7 +795,7 @@ class ArtellaProject(object):
         :return: str
         """
 
-        return artellapipe.libs.artella.config.get('server', self.get_project_type()).get('production_folder')
+        return self.get_context().production_folder
 
     def get_production_path(self):
         """
@@ -935,6 +977,30 @@ class ArtellaProject(object):
 
         return name.replace(' ', '').lower()
 
+    def _create_context(self):
+        """
+        Internal function that computes a new project context with current environment values
+        :return: ArtellaProjectContext
+        """
+
+        clean_name = self.get_clean_name()
+        project_type = self.get_project_type()
+        server_config = artellapipe.libs.artella.config.get('server', project_type) or dict()
+        app_config = artellapipe.libs.artella.config.get('app', project_type) or dict()
+        root_prefix = app_config.get('root_prefix', 'ART_LOCAL_ROOT')
+
+        return ArtellaProjectContext(
+            env_var=self.env_var,
+            project_path=os.environ.get(self.env_var),
+            project_type=project_type,
+            root_prefix=root_prefix,
+            artella_root=os.environ.get(root_prefix),
+            working_folder=server_config.get('working_folder'),
+            production_folder=server_config.get('production_folder'),
+            data_path=self.get_data_path(),
+            clean_name=clean_name
+        )
+
     def _create_new_settings(self):
         """
         Creates new empty settings file
@@ -34,7 +34,7 @@ class ArtellaSequence(abstract.AbstractSequence, object):
         :return: str
         """
 
-        name_attr = artellapipe.SequencesMgr().config.get('data', 'name_attribute')
+        name_attr = artellapipe.SequencesMgr().config_snapshot.get('data.name_attribute')
         sequence_name = self._sequence_data.get(name_attr, None)
         if not sequence_name:
             LOGGER.warning(
@@ -51,7 +51,7 @@ class ArtellaSequence(abstract.AbstractSequence, object):
         :return: str
         """
 
-        path_template_name = artellapipe.SequencesMgr().config.get('data', 'path_template_name')
+        path_template_name = artellapipe.SequencesMgr().config_snapshot.get('data.path_template_name')
         template = artellapipe.FilesMgr().get_template(path_template_name)
         if not template:
             LOGGER.warning(
@@ -83,7 +83,7 @@ class ArtellaSequence(abstract.AbstractSequence, object):
         :return: str
         """
 
-        thumb_attr = artellapipe.SequencesMgr().config.get('data', 'thumb_attribute')
+        thumb_attr = artellapipe.SequencesMgr().config_snapshot.get('data.thumb_attribute')
         thumb_path = self._sequence_data.get(thumb_attr, None)
 
         return thumb_path
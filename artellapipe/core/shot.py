@@ -19,14 +19,14 @@ import tpDcc as tp
 from tpDcc.libs.python import folder
 
 import artellapipe
-from artellapipe.core import abstract
+from artellapipe.core import abstract, timing
 
 LOGGER = logging.getLogger('artellapipe')
 
 
 class ArtellaShot(abstract.AbstractShot, object):
 
-    def __init_(self, project, shot_data):
+    def __init__(self, project, shot_data):
         super(ArtellaShot, self).__init__(project=project, shot_data=shot_data)
 
         self._data = None
@@ -38,7 +38,7 @@ class ArtellaShot(abstract.AbstractShot, object):
         :return: str
         """
 
-        id_attr = artellapipe.ShotsMgr().config.get('data', 'id_attribute')
+        id_attr = artellapipe.ShotsMgr().config_snapshot.get('data.id_attribute')
         asset_id = self._shot_data.get(id_attr, None)
         if not asset_id:
             LOGGER.warning(
@@ -55,7 +55,7 @@ class ArtellaShot(abstract.AbstractShot, object):
         :return: str
         """
 
-        name_attr = artellapipe.ShotsMgr().config.get('data', 'name_attribute')
+        name_attr = artellapipe.ShotsMgr().config_snapshot.get('data.name_attribute')
         shot_name = self._shot_data.get(name_attr, None)
         if not shot_name:
             LOGGER.warning(
@@ -72,7 +72,7 @@ class ArtellaShot(abstract.AbstractShot, object):
         :return: str
         """
 
-        thumb_attr = artellapipe.ShotsMgr().config.get('data', 'thumb_attribute')
+        thumb_attr = artellapipe.ShotsMgr().config_snapshot.get('data.thumb_attribute')
         thumb_path = self._shot_data.get(thumb_attr, None)
 
         return thumb_path
@@ -101,7 +101,7 @@ class ArtellaShot(abstract.AbstractShot, object):
         :return: str
         """
 
-        sequence_attr = artellapipe.ShotsMgr().config.get('data', 'sequence_attribute')
+        sequence_attr = artellapipe.ShotsMgr().config_snapshot.get('data.sequence_attribute')
         sequence_name = self._shot_data.get(sequence_attr, None)
         if not sequence_name:
             LOGGER.warning(
@@ -117,7 +117,7 @@ class ArtellaShot(abstract.AbstractShot, object):
         :return: str
         """
 
-        name_attr = artellapipe.ShotsMgr().config.get('data', 'number_attribute')
+        name_attr = artellapipe.ShotsMgr().config_snapshot.get('data.number_attribute')
         shot_number = self._shot_data.get(name_attr, None)
         if not shot_number:
             LOGGER.warning(
@@ -245,7 +245,10 @@ class ArtellaShot(abstract.AbstractShot, object):
         if not shot_node:
             return
 
-        return tp.Dcc.set_shot_start_frame(shot_node, start_frame)
+        valid_set = tp.Dcc.set_shot_start_frame(shot_node, start_frame)
+        artellapipe.ShotsMgr().invalidate_shot_index()
+
+        return valid_set
 
     def set_end_frame(self, end_frame):
         """
@@ -257,7 +260,10 @@ class ArtellaShot(abstract.AbstractShot, object):
         if not shot_node:
             return
 
-        return tp.Dcc.set_shot_end_frame(shot_node, end_frame)
+        valid_set = tp.Dcc.set_shot_end_frame(shot_node, end_frame)
+        artellapipe.ShotsMgr().invalidate_shot_index()
+
+        return valid_set
 
     def get_camera(self):
         """
@@ -271,6 +277,28 @@ class ArtellaShot(abstract.AbstractShot, object):
 
         return tp.Dcc.shot_camera(shot_node)
 
+    def get_timing(self):
+        """
+        Returns all the timing data of the shot reading the shot node only once
+        :return: ShotTiming or None
+        """
+
+        shot_node = self.get_node()
+        if not shot_node:
+            return None
+
+        return timing.ShotTiming(
+            name=self.get_name(),
+            sequencer_start_frame=tp.Dcc.shot_start_frame_in_sequencer(shot_node),
+            sequencer_end_frame=tp.Dcc.shot_end_frame_in_sequencer(shot_node),
+            start_frame=tp.Dcc.shot_start_frame(shot_node),
+            end_frame=tp.Dcc.shot_end_frame(shot_node),
+            pre_hold=tp.Dcc.shot_pre_hold(shot_node),
+            post_hold=tp.Dcc.shot_post_hold(shot_node),
+            scale=tp.Dcc.shot_scale(shot_node),
+            track=tp.Dcc.shot_track_number(shot_node)
+        )
+
     def get_range_frames_in_sequence(self, sequence_range):
         """
         Returns list of frames this shot belongs to in sequence
@@ -297,63 +325,59 @@ class ArtellaShot(abstract.AbstractShot, object):
 
         return range(start_frame, end_frame + 1)
 
-    def get_max_sequencer(self):
+    def get_max_sequencer(self, timing_table=None):
         """
         Returns maximum frame in sequencer of shot taking into account all non muted shots
+        :param timing_table: ShotTimingTable, table to read timing data from. If not given, timing data is read
+            from the shots of the current scene
         :return: int
         """
 
-        non_muted_shots = artellapipe.ShotsMgr().find_non_muted_shots()
-        if not non_muted_shots:
-            return 0.0
-
-        greatest_time = max([shot.get_sequencer_end_frame() for shot in non_muted_shots])
+        if timing_table is None:
+            timing_table = artellapipe.ShotsMgr().get_timing_table()
 
-        return greatest_time
+        return timing_table.get_max_sequencer()
 
-    def get_min_sequencer(self):
+    def get_min_sequencer(self, timing_table=None):
         """
         Returns minimum frame in sequencer of shot taking into account all non muted shots
+        :param timing_table: ShotTimingTable, table to read timing data from. If not given, timing data is read
+            from the shots of the current scene
         :return: int
         """
 
-        non_muted_shots = artellapipe.ShotsMgr().find_non_muted_shots()
-        if not non_muted_shots:
-            return 0.0
+        if timing_table is None:
+            timing_table = artellapipe.ShotsMgr().get_timing_table()
 
-        greatest_time = min([shot.get_sequencer_start_frame() for shot in non_muted_shots])
+        return timing_table.get_min_sequencer()
 
-        return greatest_time
-
-    def get_max_time(self):
+    def get_max_time(self, timing_table=None):
         """
         Returns maximum frame in timeline of shot taking into account all non muted shots
+        :param timing_table: ShotTimingTable, table to read timing data from. If not given, timing data is read
+            from the shots of the current scene
         :return: int
         """
 
-        non_muted_shots = artellapipe.ShotsMgr().find_non_muted_shots()
-        if not non_muted_shots:
-            return 0.0
-
-        greatest_time = max([shot.get_end_frame() for shot in non_muted_shots])
+        if timing_table is None:
+            timing_table = artellapipe.ShotsMgr().get_timing_table()
 
-        return greatest_time
+        return timing_table.get_max_time()
 
-    def get_min_time(self):
+    def get_min_time(self, timing_table=None):
         """
         Returns minimum frame in timeline of shot taking into account all non muted shots
+        :param timing_table: ShotTimingTable, table to read timing data from. If not given, timing data is read
+            from the shots of the current scene
         :return: int
         """
 
-        non_muted_shots = artellapipe.ShotsMgr().find_non_muted_shots()
-        if not non_muted_shots:
-            return 0.0
-
-        least_time = min([shot.get_start_frame() for shot in non_muted_shots])
+        if timing_table is None:
+            timing_table = artellapipe.ShotsMgr().get_timing_table()
 
-        return least_time
+        return timing_table.get_min_time()
 
-    def get_data(self, sequence_range, start_duplicate_index=None, force_update=False):
+    def get_data(self, sequence_range, start_duplicate_index=None, force_update=False, timing_table=None):
         """
         Returns data of current node
         :param sequence_range: list(int, int), start and enf frame of shot in sequencer timeline
@@ -361,63 +385,17 @@ class ArtellaShot(abstract.AbstractShot, object):
             When the shot has one or more shots overlapping, it causes section of the shot to be played multiple times
         :param start_duplicate_index: int, pass if we want to duplicate camera
         :param force_update: bool
+        :param timing_table: ShotTimingTable, table to read timing data from. If not given, shot node is read
         :return: dict
         """
 
         if self._data and not force_update:
             return self._data
 
-        sequence_start_frame = sequence_range[0]
-        sequence_end_frame = sequence_range[-1]
-        shot_sequencer_start_frame = self.get_sequencer_start_frame()
-        shot_sequencer_end_frame = self.get_sequencer_end_frame()
-        shot_pre_hold = self.get_pre_hold()
-        shot_post_hold = self.get_post_hold()
-        shot_scale = self.get_scale()
-        shot_start_frame = self.get_start_frame()
-        shot_end_frame = self.get_end_frame()
-
-        pre_hold = 0.0
-        pre_hold_in = None
-        if sequence_start_frame < shot_sequencer_start_frame + shot_pre_hold:
-            pre_hold = shot_sequencer_start_frame + shot_pre_hold - sequence_start_frame
-        elif sequence_start_frame > shot_sequencer_start_frame + shot_pre_hold:
-            pre_hold_in = sequence_start_frame - (shot_sequencer_start_frame + shot_pre_hold)
-
-        post_hold = 0.0
-        post_hold_in = None
-        if sequence_end_frame > shot_sequencer_end_frame - shot_post_hold:
-            post_hold = sequence_end_frame - (shot_sequencer_end_frame - shot_post_hold)
-        elif sequence_end_frame < shot_sequencer_end_frame - shot_post_hold:
-            post_hold_in = shot_sequencer_end_frame - shot_post_hold - sequence_end_frame
-
-        time_start_frame = shot_start_frame
-        if pre_hold_in is not None:
-            time_start_frame = pre_hold_in / shot_scale + shot_start_frame
-
-        time_end_frame = shot_end_frame
-        if post_hold_in is not None:
-            time_end_frame = (sequence_end_frame - shot_sequencer_start_frame) / shot_scale + shot_start_frame
-
-        shot_node_name = self.get_name()
+        shot_dict = timing.get_shot_data(self, sequence_range, timing_table=timing_table)
         if start_duplicate_index is not None:
-            shot_node_name = artellapipe.ShotsMgr().get_shot_unique_name(self.get_name(), start=start_duplicate_index)
-
-        shot_camera = self.get_camera()
-        shot_track = self.get_track_number()
-
-        shot_dict = {
-            'shot_name': shot_node_name,
-            'track': shot_track,
-            'camera': shot_camera,
-            'sequence_start_frame': sequence_start_frame,
-            'sequence_end_frame': sequence_end_frame,
-            'prehold': pre_hold,
-            'posthold': post_hold,
-            'shot_scale': shot_scale,
-            'time_start_frame': time_start_frame,
-            'time_end_frame': time_end_frame
-        }
+            shot_dict['shot_name'] = artellapipe.ShotsMgr().get_shot_unique_name(
+                self.get_name(), start=start_duplicate_index)
 
         return shot_dict
 
@@ -446,8 +424,9 @@ class ArtellaShot(abstract.AbstractShot, object):
 
         start_frame = self.get_start_frame()
         end_frame = self.get_end_frame()
-        max_time = self.get_max_time()
-        min_time = self.get_min_time()
+        timing_table = artellapipe.ShotsMgr().get_timing_table()
+        max_time = self.get_max_time(timing_table=timing_table)
+        min_time = self.get_min_time(timing_table=timing_table)
 
         post_hold = self.get_post_hold()
         if post_hold > 0.0:
@@ -0,0 +1,172 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for an index of shots that allows fast queries by name, sequence and frame range
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+from bisect import bisect_right
+from collections import namedtuple
+
+ShotIndexEntry = namedtuple('ShotIndexEntry', ['shot', 'name', 'sequence', 'start_frame', 'end_frame'])
+
+
+class ShotIndex(object):
+    """
+    Class that indexes shots by name, by sequence and by frame range. Shots attributes are only read once, when the
+    index is built. Frame ranges are stored sorted by start frame together with a tree that stores the maximum end
+    frame of each subtree, so overlapping queries visit only the branches that can contain results
+    """
+
+    def __init__(self, entries=None):
+        self._entries = sorted(entries or list(), key=lambda entry: entry.start_frame)
+        self._starts = [entry.start_frame for entry in self._entries]
+        self._by_name = dict()
+        self._by_sequence = dict()
+
+        for entry in self._entries:
+            self._by_name.setdefault(entry.name, list()).append(entry)
+            self._by_sequence.setdefault(entry.sequence, list()).append(entry)
+
+        self._max_ends = [None] * (4 * len(self._entries))
+        if self._entries:
+            self._build_tree(1, 0, len(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, shot_name):
+        return shot_name in self._by_name
+
+    @classmethod
+    def from_shots(cls, shots):
+        """
+        Creates a new index with the given shots
+        :param shots: list(ArtellaShot)
+        :return: ShotIndex
+        """
+
+        entries = list()
+        for shot in shots or list():
+            entries.append(ShotIndexEntry(
+                shot, shot.get_name(), shot.get_sequence(), shot.get_start_frame(), shot.get_end_frame()))
+
+        return cls(entries)
+
+    def get_shots(self, reverse=False):
+        """
+        Returns all indexed shots sorted by start frame
+        :param reverse: bool, If True, shots are returned from the latest to the earliest one
+        :return: list(ArtellaShot)
+        """
+
+        entries = sorted(self._entries, key=lambda entry: entry.start_frame, reverse=True) if reverse else \
+            self._entries
+
+        return [entry.shot for entry in entries]
+
+    def get_shots_by_name(self, shot_name):
+        """
+        Returns all shots with the given name
+        :param shot_name: str
+        :return: list(ArtellaShot)
+        """
+
+        return [entry.shot for entry in self._by_name.get(shot_name, list())]
+
+    def get_sequence_shots(self, sequence_name, reverse=False):
+        """
+        Returns shots of the given sequence sorted by start frame
+        :param sequence_name: str
+        :param reverse: bool, If True, shots are returned from the latest to the earliest one
+        :return: list(ArtellaShot)
+        """
+
+        entries = self._by_sequence.get(sequence_name, list())
+        if reverse:
+            entries = sorted(entries, key=lambda entry: entry.start_frame, reverse=True)
+
+        return [entry.shot for entry in entries]
+
+    def get_sequences(self):
+        """
+        Returns names of all the sequences of the indexed shots
+        :return: list(str)
+        """
+
+        return list(self._by_sequence.keys())
+
+    def get_shots_in_range(self, start_frame, end_frame):
+        """
+        Returns shots whose frame range overlaps the given one sorted by start frame
+        :param start_frame: int
+        :param end_frame: int
+        :return: list(ArtellaShot)
+        """
+
+        # Only shots that start before the end of the range can overlap it
+        limit = bisect_right(self._starts, end_frame)
+        if not limit:
+            return list()
+
+        indices = list()
+        self._collect(1, 0, len(self._entries), limit, start_frame, indices)
+
+        return [self._entries[i].shot for i in indices]
+
+    def get_shots_at_frame(self, frame):
+        """
+        Returns shots that contain the given frame sorted by start frame
+        :param frame: int
+        :return: list(ArtellaShot)
+        """
+
+        return self.get_shots_in_range(frame, frame)
+
+    def _build_tree(self, node, low, high):
+        """
+        Internal function that stores the maximum end frame of each range of entries
+        :param node: int, tree node index
+        :param low: int, first entry index (included)
+        :param high: int, last entry index (excluded)
+        :return: int or float
+        """
+
+        if high - low == 1:
+            self._max_ends[node] = self._entries[low].end_frame
+        else:
+            middle = (low + high) // 2
+            self._max_ends[node] = max(
+                self._build_tree(2 * node, low, middle), self._build_tree(2 * node + 1, middle, high))
+
+        return self._max_ends[node]
+
+    def _collect(self, node, low, high, limit, start_frame, indices):
+        """
+        Internal function that collects indices of the entries located before the limit whose end frame is equal or
+        greater than the given start frame
+        :param node: int, tree node index
+        :param low: int, first entry index (included)
+        :param high: int, last entry index (excluded)
+        :param limit: int, entries from this index are not collected
+        :param start_frame: int
+        :param indices: list(int), list where found indices are stored
+        """
+
+        if low >= limit or self._max_ends[node] < start_frame:
+            return
+
+        if high - low == 1:
+            indices.append(low)
+            return
+
+        middle = (low + high) // 2
+        self._collect(2 * node, low, middle, limit, start_frame, indices)
+        self._collect(2 * node + 1, middle, high, limit, start_frame, indices)
@@ -0,0 +1,359 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for shots timing table
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+from array import array
+from collections import namedtuple
+
+NUMPY_AVAILABLE = True
+try:
+    import numpy as np
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+ShotTiming = namedtuple(
+    'ShotTiming', [
+        'name', 'sequencer_start_frame', 'sequencer_end_frame', 'start_frame', 'end_frame',
+        'pre_hold', 'post_hold', 'scale', 'track'])
+
+
+class ShotTimingTable(object):
+    """
+    Class that stores timing information of several shots in compact arrays (one array per attribute). Table is built
+    in a single pass so DCC shot attributes are only read once
+    """
+
+    _FLOAT_COLUMNS = (
+        'sequencer_start_frame', 'sequencer_end_frame', 'start_frame', 'end_frame', 'pre_hold', 'post_hold', 'scale')
+
+    def __init__(self):
+        self._names = list()
+        self._indices = dict()
+        self._columns = dict((column, array('d')) for column in self._FLOAT_COLUMNS)
+        self._columns['track'] = array('i')
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, shot_name):
+        return shot_name in self._indices
+
+    def __iter__(self):
+        for i in range(len(self._names)):
+            yield self._get_row(i)
+
+    @classmethod
+    def from_shots(cls, shots):
+        """
+        Creates a new timing table with the timing data of the given shots
+        :param shots: list(ArtellaShot)
+        :return: ShotTimingTable
+        """
+
+        return cls.from_rows(shot.get_timing() for shot in shots)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Creates a new timing table from the given rows
+        :param rows: iterable(ShotTiming or tuple)
+        :return: ShotTimingTable
+        """
+
+        table = cls()
+        for row in rows:
+            if row:
+                table.add_row(row)
+
+        return table
+
+    @property
+    def names(self):
+        """
+        Returns names of the shots stored in the table
+        :return: list(str)
+        """
+
+        return list(self._names)
+
+    def add_row(self, row):
+        """
+        Adds timing data of a shot to the table
+        :param row: ShotTiming or tuple
+        """
+
+        row = ShotTiming(*row)
+        self._indices[row.name] = len(self._names)
+        self._names.append(row.name)
+        for column in self._FLOAT_COLUMNS:
+            self._columns[column].append(getattr(row, column))
+        self._columns['track'].append(int(row.track))
+
+    def get_timing(self, shot_name):
+        """
+        Returns timing data of the given shot
+        :param shot_name: str
+        :return: ShotTiming or None
+        """
+
+        index = self._indices.get(shot_name, None)
+        if index is None:
+            return None
+
+        return self._get_row(index)
+
+    def get_column(self, column):
+        """
+        Returns all the values of the given timing attribute
+        :param column: str
+        :return: array
+        """
+
+        return self._columns[column]
+
+    def get_max_sequencer(self):
+        """
+        Returns maximum frame in sequencer taking into account all the shots of the table
+        :return: int or float
+        """
+
+        return _to_frame(max(self._columns['sequencer_end_frame'])) if self._names else 0.0
+
+    def get_min_sequencer(self):
+        """
+        Returns minimum frame in sequencer taking into account all the shots of the table
+        :return: int or float
+        """
+
+        return _to_frame(min(self._columns['sequencer_start_frame'])) if self._names else 0.0
+
+    def get_max_time(self):
+        """
+        Returns maximum frame in timeline taking into account all the shots of the table
+        :return: int or float
+        """
+
+        return _to_frame(max(self._columns['end_frame'])) if self._names else 0.0
+
+    def get_min_time(self):
+        """
+        Returns minimum frame in timeline taking into account all the shots of the table
+        :return: int or float
+        """
+
+        return _to_frame(min(self._columns['start_frame'])) if self._names else 0.0
+
+    def get_range_data(self, shot_name, sequence_range):
+        """
+        Returns range data of the given shot when it is played in the given sequence range
+        :param shot_name: str
+        :param sequence_range: list(int, int), start and end frame of shot in sequencer timeline
+        :return: dict or None
+        """
+
+        timing = self.get_timing(shot_name)
+        if not timing:
+            return None
+
+        return get_range_data(timing, sequence_range)
+
+    def _get_row(self, index):
+        """
+        Internal function that returns the timing data stored in the given index
+        :param index: int
+        :return: ShotTiming
+        """
+
+        values = [
+            self._columns[column][index] if column == 'scale' else _to_frame(self._columns[column][index])
+            for column in self._FLOAT_COLUMNS]
+
+        return ShotTiming(self._names[index], *(values + [self._columns['track'][index]]))
+
+
+def _to_frame(value):
+    """
+    Internal function that converts values stored in the table to integers when they do not have decimals, so
+    frames are returned as they are returned by the DCC
+    :param value: float
+    :return: int or float
+    """
+
+    return int(value) if value.is_integer() else value
+
+
+def get_range_data(timing, sequence_range):
+    """
+    Returns range data of a shot when it is played in the given sequence range
+    :param timing: ShotTiming
+    :param sequence_range: list(int, int), start and end frame of shot in sequencer timeline
+    :return: dict
+    """
+
+    sequence_start_frame = sequence_range[0]
+    sequence_end_frame = sequence_range[-1]
+
+    pre_hold = 0.0
+    pre_hold_in = None
+    if sequence_start_frame < timing.sequencer_start_frame + timing.pre_hold:
+        pre_hold = timing.sequencer_start_frame + timing.pre_hold - sequence_start_frame
+    elif sequence_start_frame > timing.sequencer_start_frame + timing.pre_hold:
+        pre_hold_in = sequence_start_frame - (timing.sequencer_start_frame + timing.pre_hold)
+
+    post_hold = 0.0
+    post_hold_in = None
+    if sequence_end_frame > timing.sequencer_end_frame - timing.post_hold:
+        post_hold = sequence_end_frame - (timing.sequencer_end_frame - timing.post_hold)
+    elif sequence_end_frame < timing.sequencer_end_frame - timing.post_hold:
+        post_hold_in = timing.sequencer_end_frame - timing.post_hold - sequence_end_frame
+
+    time_start_frame = timing.start_frame
+    if pre_hold_in is not None:
+        time_start_frame = pre_hold_in / timing.scale + timing.start_frame
+
+    time_end_frame = timing.end_frame
+    if post_hold_in is not None:
+        time_end_frame = (sequence_end_frame - timing.sequencer_start_frame) / timing.scale + timing.start_frame
+
+    return {
+        'sequence_start_frame': sequence_start_frame,
+        'sequence_end_frame': sequence_end_frame,
+        'prehold': pre_hold,
+        'posthold': post_hold,
+        'shot_scale': timing.scale,
+        'time_start_frame': time_start_frame,
+        'time_end_frame': time_end_frame
+    }
+
+
+def get_range_data_many(timings, sequence_ranges, use_numpy=True):
+    """
+    Returns range data of several shots at once. If NumPy is available, ranges are computed over arrays.
+    Results are the same ones returned by get_range_data for each shot
+    :param timings: list(ShotTiming)
+    :param sequence_ranges: list(list(int, int)), start and end frame of each shot in sequencer timeline
+    :param use_numpy: bool, Whether to use NumPy (if available) or not
+    :return: list(dict)
+    """
+
+    timings = list(timings)
+    sequence_ranges = list(sequence_ranges)
+    if len(timings) != len(sequence_ranges):
+        raise ValueError('Number of shot timings and sequence ranges does not match!')
+    if not timings:
+        return list()
+
+    if not NUMPY_AVAILABLE or not use_numpy:
+        return [get_range_data(shot_timing, sequence_range) for shot_timing, sequence_range in zip(
+            timings, sequence_ranges)]
+
+    sequence_start_frames = np.array([sequence_range[0] for sequence_range in sequence_ranges], dtype=np.float64)
+    sequence_end_frames = np.array([sequence_range[-1] for sequence_range in sequence_ranges], dtype=np.float64)
+    columns = np.array([shot_timing[1:8] for shot_timing in timings], dtype=np.float64)
+    sequencer_start, sequencer_end, start, end, pre_holds, post_holds, scales = columns.T
+
+    start_holds = sequencer_start + pre_holds
+    pre_hold = np.where(sequence_start_frames < start_holds, start_holds - sequence_start_frames, 0.0)
+    pre_hold_in_mask = sequence_start_frames > start_holds
+
+    end_holds = sequencer_end - post_holds
+    post_hold = np.where(sequence_end_frames > end_holds, sequence_end_frames - end_holds, 0.0)
+    post_hold_in_mask = sequence_end_frames < end_holds
+
+    # Same error raised by get_range_data when a shot with no scale must be scaled
+    if np.any((pre_hold_in_mask | post_hold_in_mask) & (scales == 0)):
+        raise ZeroDivisionError('float division by zero')
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        time_start_frames = (sequence_start_frames - start_holds) / scales + start
+        time_end_frames = (sequence_end_frames - sequencer_start) / scales + start
+
+    pre_hold = pre_hold.tolist()
+    post_hold = post_hold.tolist()
+    pre_hold_in_mask = pre_hold_in_mask.tolist()
+    post_hold_in_mask = post_hold_in_mask.tolist()
+    time_start_frames = time_start_frames.tolist()
+    time_end_frames = time_end_frames.tolist()
+
+    range_data = list()
+    for i, (shot_timing, sequence_range) in enumerate(zip(timings, sequence_ranges)):
+        range_data.append({
+            'sequence_start_frame': sequence_range[0],
+            'sequence_end_frame': sequence_range[-1],
+            'prehold': pre_hold[i],
+            'posthold': post_hold[i],
+            'shot_scale': shot_timing.scale,
+            'time_start_frame': time_start_frames[i] if pre_hold_in_mask[i] else shot_timing.start_frame,
+            'time_end_frame': time_end_frames[i] if post_hold_in_mask[i] else shot_timing.end_frame
+        })
+
+    return range_data
+
+
+def get_shot_timing(shot, timing_table=None):
+    """
+    Returns timing data of the given shot. If the shot is not stored in the given table, shot node is read
+    :param shot: ArtellaShot
+    :param timing_table: ShotTimingTable
+    :return: ShotTiming, timing with -1 values if the shot node does not exist
+    """
+
+    shot_timing = timing_table.get_timing(shot.get_name()) if timing_table else None
+    if not shot_timing:
+        shot_timing = shot.get_timing() or ShotTiming(shot.get_name(), -1, -1, -1, -1, -1, -1, -1, -1)
+
+    return shot_timing
+
+
+def get_shot_data(shot, sequence_range, timing_table=None):
+    """
+    Returns data of the given shot when it is played in the given sequence range
+    :param shot: ArtellaShot
+    :param sequence_range: list(int, int), start and end frame of shot in sequencer timeline
+    :param timing_table: ShotTimingTable, table to read timing data from. If not given, shot node is read
+    :return: dict
+    """
+
+    shot_timing = get_shot_timing(shot, timing_table=timing_table)
+    shot_data = get_range_data(shot_timing, sequence_range)
+    shot_data.update({
+        'shot_name': shot_timing.name,
+        'track': int(shot_timing.track),
+        'camera': shot.get_camera()
+    })
+
+    return shot_data
+
+
+def get_shots_data(shots, sequence_ranges, timing_table=None, use_numpy=True):
+    """
+    Returns data of all the given shots. Results are the same ones returned by get_shot_data for each shot
+    :param shots: list(ArtellaShot)
+    :param sequence_ranges: list(list(int, int)), start and end frame of each shot in sequencer timeline
+    :param timing_table: ShotTimingTable, table to read timing data from. Shots not stored in it read its shot node
+    :param use_numpy: bool, Whether to use NumPy (if available) or not
+    :return: list(dict)
+    """
+
+    shots = list(shots)
+    shot_timings = [get_shot_timing(shot, timing_table=timing_table) for shot in shots]
+
+    shots_data = get_range_data_many(shot_timings, sequence_ranges, use_numpy=use_numpy)
+    for shot, shot_timing, shot_data in zip(shots, shot_timings, shots_data):
+        shot_data.update({
+            'shot_name': shot_timing.name,
+            'track': int(shot_timing.track),
+            'camera': shot.get_camera()
+        })
+
+    return shots_data
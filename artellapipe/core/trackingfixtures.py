@@ -0,0 +1,406 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for recorded production tracker payloads that can be replayed offline
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import copy
+import json
+import time
+import random
+import shutil
+import logging
+import threading
+
+LOGGER = logging.getLogger('artellapipe')
+
+# Tracker functions whose results are stored in fixtures
+RECORDED_FUNCTIONS = (
+    'get_name', 'needs_login', 'get_user_name', 'get_project_name', 'get_project_fps', 'get_project_resolution',
+    'all_project_assets', 'all_project_sequences', 'all_project_shots', 'all_assets_in_shot',
+    'get_occurrences_of_asset_in_shot', 'get_shots_breakdown', 'get_task_by_id', 'get_tasks_in_shot',
+    'all_task_types', 'all_task_statuses', 'all_task_types_for_assets', 'all_task_types_for_shots', 'get_task_status'
+)
+
+# Attributes used to store data of synthetic assets and shots. Projects can override them to match their configs
+DEFAULT_ATTRIBUTES = {
+    'id': 'id',
+    'name': 'name',
+    'category': 'category',
+    'tags': 'tags',
+    'thumbnail': 'thumbnail',
+    'sequence': 'sequence',
+    'number': 'number'
+}
+
+THUMBNAILS_FOLDER = 'thumbnails'
+
+
+def make_key(function_name, *args):
+    """
+    Returns key used to store the payload of a tracker function call with the given arguments
+    :param function_name: str
+    :param args: list
+    :return: str
+    """
+
+    return '{}({})'.format(function_name, json.dumps(list(args), sort_keys=True, default=str))
+
+
+class TrackingFixtures(object):
+    """
+    Class that stores payloads returned by a production tracker, so they can be replayed without connecting to it.
+    Latency of the tracker can be simulated with a fixed delay per call (optionally different per function)
+    """
+
+    VERSION = 1
+
+    def __init__(self, payloads=None, latency=0.0, root_path=None):
+        """
+        :param payloads: dict(str, object), dictionary that maps call keys with payloads
+        :param latency: float or dict(str, float), seconds each call waits before returning its payload
+        :param root_path: str, folder where files downloaded from the tracker (thumbnails) are stored
+        """
+
+        self._payloads = payloads or dict()
+        self._latency = latency or 0.0
+        self._root_path = root_path
+        self._lock = threading.Lock()
+        self._occurrences_index = None
+
+    def __len__(self):
+        return len(self._payloads)
+
+    def __contains__(self, key):
+        return key in self._payloads
+
+    @property
+    def root_path(self):
+        """
+        Returns folder where files downloaded from the tracker are stored
+        :return: str
+        """
+
+        return self._root_path
+
+    @property
+    def latency(self):
+        """
+        Returns latency simulated in each call
+        :return: float or dict(str, float)
+        """
+
+        return self._latency
+
+    @latency.setter
+    def latency(self, value):
+        self._latency = value or 0.0
+
+    @classmethod
+    def load(cls, fixtures_file, latency=0.0):
+        """
+        Loads fixtures from the given file
+        :param fixtures_file: str
+        :param latency: float or dict(str, float)
+        :return: TrackingFixtures
+        """
+
+        with open(fixtures_file, 'r') as fh:
+            data = json.load(fh)
+
+        if data.get('version', None) != cls.VERSION:
+            LOGGER.warning('Tracking fixtures "{}" version is not supported: {}'.format(
+                fixtures_file, data.get('version', None)))
+
+        return cls(data.get('payloads', dict()), latency=latency, root_path=os.path.dirname(fixtures_file))
+
+    def save(self, fixtures_file):
+        """
+        Stores fixtures in the given file
+        :param fixtures_file: str
+        """
+
+        fixtures_folder = os.path.dirname(fixtures_file)
+        if fixtures_folder and not os.path.isdir(fixtures_folder):
+            os.makedirs(fixtures_folder)
+
+        with self._lock:
+            with open(fixtures_file, 'w') as fh:
+                json.dump({'version': self.VERSION, 'payloads': self._payloads}, fh, sort_keys=True)
+
+    def record(self, function_name, args, payload):
+        """
+        Stores payload returned by the tracker when the given function was called with the given arguments
+        :param function_name: str
+        :param args: list
+        :param payload: object, must be serializable to JSON
+        """
+
+        with self._lock:
+            self._payloads[make_key(function_name, *args)] = payload
+            self._occurrences_index = None
+
+    def has_payload(self, function_name, *args):
+        """
+        Returns whether a payload for the given call is stored
+        :param function_name: str
+        :param args: list
+        :return: bool
+        """
+
+        return make_key(function_name, *args) in self._payloads
+
+    def replay(self, function_name, *args, **kwargs):
+        """
+        Returns payload stored for the given call, waiting the configured latency. A copy is returned, so callers can
+        modify it as they do with the data returned by the tracker
+        :param function_name: str
+        :param args: list
+        :param kwargs: dict, default keyword is used as payload if call was not recorded
+        :return: object
+        """
+
+        self._wait(function_name)
+
+        key = make_key(function_name, *args)
+        if key not in self._payloads:
+            if 'default' in kwargs:
+                return kwargs['default']
+            raise KeyError('No tracking payload recorded for "{}"'.format(key))
+
+        return copy.deepcopy(self._payloads[key])
+
+    def get_occurrences(self, shot_id, asset_name, name_attribute='name'):
+        """
+        Returns the number of occurrences of the given asset in the given shot, waiting the configured latency.
+        Occurrences are retrieved from the recorded occurrences payload of the call. If it was not recorded, they are
+        derived from the recorded shots breakdown or from the recorded assets of the shot. Recorded payloads are
+        indexed the first time occurrences are requested
+        :param shot_id: str
+        :param asset_name: str
+        :param name_attribute: str, attribute that stores the names of the assets of the shot
+        :return: int or None, None if no casting for the given shot was recorded
+        """
+
+        self._wait('get_occurrences_of_asset_in_shot')
+
+        key = make_key('get_occurrences_of_asset_in_shot', shot_id, asset_name)
+        if key in self._payloads:
+            return self._payloads[key]
+
+        with self._lock:
+            if self._occurrences_index is None:
+                self._occurrences_index = self._build_occurrences_index(name_attribute)
+            shot_occurrences = self._occurrences_index.get(shot_id, None)
+
+        if shot_occurrences is None:
+            return None
+
+        return shot_occurrences.get(asset_name, 0)
+
+    def get_thumbnail_path(self, preview_id):
+        """
+        Returns path where recorded thumbnail of the given preview is stored
+        :param preview_id: str
+        :return: str or None
+        """
+
+        relative_path = self._payloads.get(make_key('download_preview_file_thumbnail', preview_id), None)
+        if not relative_path or not self._root_path:
+            return None
+
+        return os.path.join(self._root_path, relative_path)
+
+    def _wait(self, function_name):
+        """
+        Internal function that waits the latency configured for the given function
+        :param function_name: str
+        """
+
+        latency = self._latency.get(function_name, 0.0) if isinstance(self._latency, dict) else self._latency
+        if latency:
+            time.sleep(latency)
+
+    def _build_occurrences_index(self, name_attribute):
+        """
+        Internal function that indexes the occurrences of the assets of each shot stored in the recorded payloads
+        :param name_attribute: str, attribute that stores the names of the assets of a shot
+        :return: dict(str, dict(str, int)), dictionary that maps shot IDs with the occurrences of each asset
+        """
+
+        occurrences_index = dict()
+
+        breakdown_key = make_key('get_shots_breakdown')
+        if breakdown_key in self._payloads:
+            for shot_id, asset_name, occurrences in self._payloads[breakdown_key]:
+                occurrences_index.setdefault(shot_id, dict())[asset_name] = occurrences
+            return occurrences_index
+
+        shot_assets_prefix = 'all_assets_in_shot('
+        for key, shot_assets in self._payloads.items():
+            if not key.startswith(shot_assets_prefix):
+                continue
+            shot_args = json.loads(key[len(shot_assets_prefix):-1])
+            if len(shot_args) != 1:
+                continue
+            shot_occurrences = occurrences_index.setdefault(shot_args[0], dict())
+            for asset_data in shot_assets or list():
+                asset_name = asset_data.get(name_attribute, None) if isinstance(asset_data, dict) else None
+                if asset_name:
+                    shot_occurrences[asset_name] = shot_occurrences.get(asset_name, 0) + 1
+
+        return occurrences_index
+
+
+class TrackingRecorder(object):
+    """
+    Class that wraps a production tracker and stores the payloads it returns into fixtures. Functions that are not
+    recorded are forwarded to the wrapped tracker
+    """
+
+    def __init__(self, tracker, fixtures=None, fixtures_file=None):
+        """
+        :param tracker: TrackingManager, tracker whose traffic is recorded
+        :param fixtures: TrackingFixtures, fixtures where payloads are stored
+        :param fixtures_file: str, file where fixtures are stored when save is called
+        """
+
+        self._tracker = tracker
+        self._fixtures_file = fixtures_file
+        self._fixtures = fixtures or TrackingFixtures(
+            root_path=os.path.dirname(fixtures_file) if fixtures_file else None)
+
+    def __getattr__(self, name):
+        attr = getattr(self._tracker, name)
+        if name not in RECORDED_FUNCTIONS or not callable(attr):
+            return attr
+
+        def _record(*args, **kwargs):
+            payload = attr(*args, **kwargs)
+            # Keyword arguments (such as force_update) do not change the payload, so they are not part of the key
+            self._fixtures.record(name, args, payload)
+            return payload
+
+        return _record
+
+    @property
+    def fixtures(self):
+        """
+        Returns fixtures where payloads are stored
+        :return: TrackingFixtures
+        """
+
+        return self._fixtures
+
+    def download_preview_file_thumbnail(self, preview_id, file_path):
+        """
+        Downloads given preview file thumbnail and stores a copy of it with the fixtures
+        :param preview_id: str
+        :param file_path: str
+        """
+
+        result = self._tracker.download_preview_file_thumbnail(preview_id, file_path)
+        if self._fixtures.root_path and os.path.isfile(file_path):
+            relative_path = '{}/{}{}'.format(THUMBNAILS_FOLDER, preview_id, os.path.splitext(file_path)[-1])
+            thumbnail_path = os.path.join(self._fixtures.root_path, relative_path)
+            if not os.path.isdir(os.path.dirname(thumbnail_path)):
+                os.makedirs(os.path.dirname(thumbnail_path))
+            shutil.copyfile(file_path, thumbnail_path)
+            self._fixtures.record('download_preview_file_thumbnail', [preview_id], relative_path)
+
+        return result
+
+    def save(self, fixtures_file=None):
+        """
+        Stores recorded payloads
+        :param fixtures_file: str, If not given, recorder fixtures file is used
+        """
+
+        fixtures_file = fixtures_file or self._fixtures_file
+        if not fixtures_file:
+            LOGGER.warning('Impossible to store tracking fixtures because no fixtures file was given')
+            return False
+
+        self._fixtures.save(fixtures_file)
+
+        return True
+
+
+def generate_fixtures(
+        num_assets=10000, num_shots=5000, num_sequences=50, assets_per_shot=10, categories=None, seed=0,
+        attributes=None, latency=0.0):
+    """
+    Generates fixtures of a synthetic project. The same arguments always generate the same project
+    :param num_assets: int
+    :param num_shots: int
+    :param num_sequences: int
+    :param assets_per_shot: int, maximum number of assets cast in each shot
+    :param categories: list(str), categories of the assets
+    :param seed: int
+    :param attributes: dict(str, str), attributes used to store assets and shots data (see DEFAULT_ATTRIBUTES)
+    :param latency: float or dict(str, float)
+    :return: TrackingFixtures
+    """
+
+    rand = random.Random(seed)
+    categories = categories or ['Character', 'Prop', 'Background']
+    attrs = dict(DEFAULT_ATTRIBUTES)
+    attrs.update(attributes or dict())
+    num_sequences = max(1, min(num_sequences, num_shots or 1))
+
+    assets = list()
+    for i in range(num_assets):
+        category = categories[i % len(categories)]
+        assets.append({
+            attrs['id']: 'asset_{:06d}'.format(i),
+            attrs['name']: '{}{:06d}'.format(category.lower(), i),
+            attrs['category']: category,
+            attrs['tags']: [category.lower()],
+            attrs['thumbnail']: 'preview_asset_{:06d}'.format(i)
+        })
+
+    sequences = [{attrs['id']: 'seq_{:04d}'.format(i), attrs['name']: 'seq{:04d}'.format(i)}
+                 for i in range(num_sequences)]
+
+    shots = list()
+    breakdown = list()
+    fixtures = TrackingFixtures(latency=latency)
+    for i in range(num_shots):
+        shot_id = 'shot_{:06d}'.format(i)
+        sequence = sequences[i * num_sequences // num_shots]
+        shots.append({
+            attrs['id']: shot_id,
+            attrs['name']: '{}_sh{:04d}'.format(sequence[attrs['name']], i),
+            attrs['sequence']: sequence[attrs['name']],
+            attrs['number']: i,
+            attrs['thumbnail']: 'preview_{}'.format(shot_id)
+        })
+        shot_assets = list()
+        if assets:
+            for asset in rand.sample(assets, min(len(assets), rand.randint(1, max(1, assets_per_shot)))):
+                occurrences = rand.randint(1, 3)
+                shot_assets.append(asset)
+                breakdown.append([shot_id, asset[attrs['name']], occurrences])
+        fixtures.record('all_assets_in_shot', [shot_id], shot_assets)
+
+    fixtures.record('get_name', [], 'Replay Tracker')
+    fixtures.record('needs_login', [], False)
+    fixtures.record('get_user_name', [], 'replay')
+    fixtures.record('get_project_name', [], 'Synthetic Project')
+    fixtures.record('get_project_fps', [], 24)
+    fixtures.record('get_project_resolution', [], '1920x1080')
+    fixtures.record('all_project_assets', [], assets)
+    fixtures.record('all_project_sequences', [], sequences)
+    fixtures.record('all_project_shots', [], shots)
+    fixtures.record('get_shots_breakdown', [], breakdown)
+
+    return fixtures
@@ -0,0 +1,533 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains caches used to resolve current server versions and history of Artella files without
+downloading the full history of the files each time
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import json
+import atexit
+import time
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+
+LOGGER = logging.getLogger('artellapipe')
+
+VERSIONS_CACHE_ENV = 'ARTELLAPIPE_VERSIONS_CACHE'
+
+# Seconds a cached version is valid. Versions are only used to show and report version numbers (Artella server
+# assigns the real version when a file is uploaded), so a version uploaded by other user is detected after this time
+MAX_AGE = 600
+
+# Seconds persisted versions wait before being written to disk, so several uploads are saved together
+SAVE_DELAY = 2
+
+# Number of versions returned by each history page
+PAGE_SIZE = 20
+
+# Number of file histories kept in memory
+MAX_HISTORIES = 256
+
+# Seconds a cached history is valid
+HISTORY_TTL = 300
+
+_VERSION_CACHES = dict()
+_VERSION_CACHES_LOCK = threading.Lock()
+_HISTORY_CACHE = None
+_HISTORY_CACHE_LOCK = threading.Lock()
+
+
+def _replace_file(source_path, target_path):
+    """
+    Internal function that replaces target file with source file. Replacement is atomic where the OS allows it
+    :param source_path: str
+    :param target_path: str
+    """
+
+    replace = getattr(os, 'replace', None)
+    if replace:
+        replace(source_path, target_path)
+        return
+
+    # Python 2 in Windows cannot rename a file over an existing one
+    if os.name == 'nt' and os.path.isfile(target_path):
+        os.remove(target_path)
+    os.rename(source_path, target_path)
+
+
+def get_client(client=None):
+    """
+    Returns object used to communicate with Artella
+    :param client: module, If given, it is returned
+    :return: module
+    """
+
+    if client is not None:
+        return client
+
+    from artellapipe.libs.artella.core import artellalib
+
+    return artellalib
+
+
+def get_cache_key(file_path):
+    """
+    Returns key used to cache the given file. Environment variables are expanded, so paths fixed by the files manager
+    and absolute paths of the same file share the same key
+    :param file_path: str
+    :return: str
+    """
+
+    return os.path.normcase(os.path.normpath(os.path.expandvars(file_path)))
+
+
+def query_current_version(file_path, client=None, use_history=False):
+    """
+    Returns current server version of the given file. Version is read from the status of the file, which is much
+    faster than downloading and scanning the full history of the file
+    :param file_path: str
+    :param client: module, object used to communicate with Artella. If not given, artellalib is used
+    :param use_history: bool, Whether the history of the file is used when its status does not contain its version.
+        Indie projects must use it, because current version of files can only be retrieved in enterprise projects
+    :return: int, 0 if the file has no versions
+    """
+
+    client = get_client(client)
+
+    max_version = None
+    try:
+        status = client.get_status(file_path)
+    except Exception as exc:
+        LOGGER.debug('Impossible to retrieve status of "{}": {}'.format(file_path, exc))
+        status = None
+    references = getattr(status, 'references', None) or dict()
+    reference = references.get(os.path.basename(file_path), None)
+    if reference is not None:
+        max_version = getattr(reference, 'maximum_version', None)
+    if max_version is None and use_history:
+        max_version = query_history_version(file_path, client=client)
+    elif max_version is None:
+        max_version = client.get_current_version(file_path)
+
+    return max(0, int(max_version or 0))
+
+
+def query_history_version(file_path, client=None):
+    """
+    Returns current server version of the given file downloading its full history
+    :param file_path: str
+    :param client: module, object used to communicate with Artella. If not given, artellalib is used
+    :return: int, 0 if the file has no versions
+    """
+
+    history = get_client(client).get_file_history(file_path)
+    file_versions = getattr(history, 'versions', None) or list()
+
+    return max([int(version[0]) for version in file_versions] or [0])
+
+
+class VersionCache(object):
+    """
+    Class that stores current server version of files in a JSON file, so versions are shared between sessions.
+    Cache is updated incrementally each time a new version of a file is uploaded. Only versions stored with persist
+    enabled are written to disk: saves are delayed so several updates are written at once and they are merged with
+    the versions stored by other sessions in the meantime
+    """
+
+    def __init__(self, cache_path=None, max_age=MAX_AGE, save_delay=SAVE_DELAY):
+        """
+        :param cache_path: str, JSON file where versions are stored. If not given, versions are only kept in memory
+        :param max_age: float, seconds a cached version is valid
+        :param save_delay: float, seconds persisted changes wait before being written to disk. If 0, changes are
+            written immediately
+        """
+
+        self._cache_path = cache_path
+        self._max_age = max_age
+        self._save_delay = save_delay
+        self._versions = dict()
+        self._changes = dict()
+        self._cleared = False
+        self._save_timer = None
+        self._lock = threading.RLock()
+
+        self.load()
+
+    @property
+    def cache_path(self):
+        return self._cache_path
+
+    def load(self):
+        """
+        Loads cached versions from cache file
+        """
+
+        versions = self._read()
+        with self._lock:
+            self._versions.update(versions)
+
+    def save(self):
+        """
+        Stores persisted changes into cache file. Changes are merged with the versions currently stored in the file,
+        so versions stored by other sessions are not lost. Expired versions are removed from the file
+        """
+
+        with self._lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._cache_path or (not self._changes and not self._cleared):
+                return
+
+            versions = dict() if self._cleared else self._read()
+            for key, value in self._changes.items():
+                if value is None:
+                    versions.pop(key, None)
+                elif key not in versions or versions[key][1] <= value[1]:
+                    versions[key] = value
+            versions = dict((key, list(value)) for key, value in versions.items() if not self._is_expired(value))
+
+            cache_folder = os.path.dirname(self._cache_path)
+            try:
+                if cache_folder and not os.path.isdir(cache_folder):
+                    os.makedirs(cache_folder)
+                # Cache is written in a temporary file first, so other sessions never read a partial file
+                fd, temp_path = tempfile.mkstemp(dir=cache_folder or None, suffix='.tmp')
+                with os.fdopen(fd, 'w') as fh:
+                    json.dump(versions, fh)
+                _replace_file(temp_path, self._cache_path)
+            except (IOError, OSError) as exc:
+                LOGGER.warning('Impossible to store versions cache "{}": {}'.format(self._cache_path, exc))
+                return
+
+            self._changes.clear()
+            self._cleared = False
+
+    def get(self, file_path):
+        """
+        Returns cached version of the given file
+        :param file_path: str
+        :return: int or None, None if the version is not cached or it is expired
+        """
+
+        with self._lock:
+            value = self._versions.get(get_cache_key(file_path), None)
+        if not value or self._is_expired(value):
+            return None
+
+        return value[0]
+
+    def set(self, file_path, version, persist=True):
+        """
+        Stores current version of the given file
+        :param file_path: str
+        :param version: int
+        :param persist: bool, Whether the version is stored in the cache file or only in memory
+        """
+
+        self.update({file_path: version}, persist=persist)
+
+    def update(self, versions, persist=True):
+        """
+        Stores current version of several files
+        :param versions: dict(str, int)
+        :param persist: bool, Whether the versions are stored in the cache file or only in memory
+        """
+
+        if not versions:
+            return
+
+        updated = time.time()
+        with self._lock:
+            for file_path, version in versions.items():
+                key = get_cache_key(file_path)
+                self._versions[key] = (int(version), updated)
+                if persist:
+                    self._changes[key] = self._versions[key]
+            if persist:
+                self._schedule_save()
+
+    def invalidate(self, file_path=None):
+        """
+        Removes cached version of the given file
+        :param file_path: str, If not given, all cached versions are removed
+        """
+
+        with self._lock:
+            if file_path is None:
+                self._versions.clear()
+                self._changes.clear()
+                self._cleared = True
+            else:
+                key = get_cache_key(file_path)
+                self._versions.pop(key, None)
+                self._changes[key] = None
+            self._schedule_save()
+
+    def get_current_version(self, file_path, client=None, force_update=False, use_history=False):
+        """
+        Returns current server version of the given file. Server is only queried if the version is not cached.
+        Queried versions are only cached in memory
+        :param file_path: str
+        :param client: module, object used to communicate with Artella. If not given, artellalib is used
+        :param force_update: bool, Whether to query the server even if the version is cached
+        :param use_history: bool, Whether the history of the file is used when its status does not contain its version
+        :return: int, 0 if the file has no versions
+        """
+
+        if not force_update:
+            version = self.get(file_path)
+            if version is not None:
+                return version
+
+        version = query_current_version(file_path, client=client, use_history=use_history)
+        self.set(file_path, version, persist=False)
+
+        return version
+
+    def _read(self):
+        """
+        Internal function that returns not expired versions stored in cache file
+        :return: dict(str, tuple(int, float))
+        """
+
+        if not self._cache_path or not os.path.isfile(self._cache_path):
+            return dict()
+
+        try:
+            with open(self._cache_path, 'r') as fh:
+                versions = json.load(fh)
+        except (IOError, OSError, ValueError) as exc:
+            LOGGER.warning('Impossible to load versions cache "{}": {}'.format(self._cache_path, exc))
+            return dict()
+
+        versions = dict((key, (int(version), float(updated))) for key, (version, updated) in versions.items())
+
+        return dict((key, value) for key, value in versions.items() if not self._is_expired(value))
+
+    def _is_expired(self, value):
+        """
+        Internal function that returns whether given cached version is expired
+        :param value: tuple(int, float)
+        :return: bool
+        """
+
+        return self._max_age is not None and time.time() - value[1] > self._max_age
+
+    def _schedule_save(self):
+        """
+        Internal function that saves the cache after save delay. Changes done in the meantime are saved together
+        """
+
+        if not self._cache_path:
+            return
+        if not self._save_delay:
+            self.save()
+            return
+        if self._save_timer:
+            return
+
+        self._save_timer = threading.Timer(self._save_delay, self.save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+
+class HistoryCache(object):
+    """
+    Class that stores history of files in memory and returns it by pages, sorted from newest to oldest version.
+    History of a file is downloaded again when it expires, when it is invalidated (for example, after uploading a
+    new version of the file) or when the cached current version of the file is newer than the cached history
+    """
+
+    def __init__(
+            self, version_cache=None, client=None, page_size=PAGE_SIZE, max_histories=MAX_HISTORIES, ttl=HISTORY_TTL):
+        """
+        :param version_cache: VersionCache, cache used to check current version of the files
+        :param client: module, object used to communicate with Artella. If not given, artellalib is used
+        :param page_size: int, default number of versions returned by each page
+        :param max_histories: int, number of file histories kept in memory
+        :param ttl: float, seconds a cached history is valid. If None, histories never expire
+        """
+
+        self._version_cache = version_cache or VersionCache()
+        self._client = client
+        self._page_size = page_size
+        self._max_histories = max_histories
+        self._ttl = ttl
+        self._histories = OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def version_cache(self):
+        return self._version_cache
+
+    def get_history(self, file_path, force_update=False):
+        """
+        Returns Artella history of the given file
+        :param file_path: str
+        :param force_update: bool
+        :return: ArtellaFileHistory
+        """
+
+        return self._get_entry(file_path, force_update=force_update)[0]
+
+    def get_versions(self, file_path, force_update=False):
+        """
+        Returns all versions of the given file sorted from newest to oldest
+        :param file_path: str
+        :param force_update: bool
+        :return: list(tuple(int, object)), list of (version, version data)
+        """
+
+        return list(self._get_entry(file_path, force_update=force_update)[1])
+
+    def get_page(self, file_path, page=0, page_size=None, force_update=False):
+        """
+        Returns a page of versions of the given file sorted from newest to oldest
+        :param file_path: str
+        :param page: int, index of the page (0 is the page with the newest versions)
+        :param page_size: int, If not given, default page size is used
+        :param force_update: bool
+        :return: list(tuple(int, object)), list of (version, version data)
+        """
+
+        page_size = page_size or self._page_size
+        versions = self._get_entry(file_path, force_update=force_update)[1]
+
+        return list(versions[page * page_size:(page + 1) * page_size])
+
+    def get_num_pages(self, file_path, page_size=None, force_update=False):
+        """
+        Returns number of history pages of the given file
+        :param file_path: str
+        :param page_size: int, If not given, default page size is used
+        :param force_update: bool
+        :return: int
+        """
+
+        page_size = page_size or self._page_size
+        versions = self._get_entry(file_path, force_update=force_update)[1]
+
+        return (len(versions) + page_size - 1) // page_size
+
+    def invalidate(self, file_path=None):
+        """
+        Removes cached history of the given file
+        :param file_path: str, If not given, all cached histories are removed
+        """
+
+        with self._lock:
+            if file_path is None:
+                self._histories.clear()
+            else:
+                self._histories.pop(get_cache_key(file_path), None)
+
+    def _get_entry(self, file_path, force_update=False):
+        """
+        Internal function that returns cached history and sorted versions of the given file, downloading the history
+        if it is not cached, it is expired or if it is older than the cached current version of the file
+        :param file_path: str
+        :param force_update: bool
+        :return: tuple(ArtellaFileHistory, list(tuple(int, object)))
+        """
+
+        key = get_cache_key(file_path)
+        current_version = self._version_cache.get(file_path) or 0
+        with self._lock:
+            entry = self._histories.get(key, None)
+            if entry and not force_update and entry[2] >= current_version and not self._is_expired(entry):
+                self._histories.pop(key)
+                self._histories[key] = entry
+                return entry[0], entry[1]
+
+        history = get_client(self._client).get_file_history(file_path)
+        versions = sorted(
+            getattr(history, 'versions', None) or list(), key=lambda version: int(version[0]), reverse=True)
+        max_version = int(versions[0][0]) if versions else 0
+        if max_version != current_version:
+            self._version_cache.set(file_path, max_version, persist=False)
+
+        with self._lock:
+            self._histories.pop(key, None)
+            self._histories[key] = (history, versions, max_version, time.time())
+            while len(self._histories) > self._max_histories:
+                self._histories.popitem(last=False)
+
+        return history, versions
+
+    def _is_expired(self, entry):
+        """
+        Internal function that returns whether given cached history is expired
+        :param entry: tuple
+        :return: bool
+        """
+
+        return self._ttl is not None and time.time() - entry[3] > self._ttl
+
+
+def get_default_cache_path():
+    """
+    Returns path of the file where versions are cached by default
+    :return: str
+    """
+
+    cache_path = os.environ.get(VERSIONS_CACHE_ENV, None)
+    if cache_path:
+        return cache_path
+
+    return os.path.normpath(os.path.join(os.path.expanduser('~'), 'artellapipe', 'cache', 'versions.json'))
+
+
+def get_version_cache(cache_path=None):
+    """
+    Returns versions cache stored in the given path
+    :param cache_path: str, If not given, default cache path is used
+    :return: VersionCache
+    """
+
+    cache_path = cache_path or get_default_cache_path()
+    with _VERSION_CACHES_LOCK:
+        if cache_path not in _VERSION_CACHES:
+            _VERSION_CACHES[cache_path] = VersionCache(cache_path)
+
+        return _VERSION_CACHES[cache_path]
+
+
+def save_version_caches():
+    """
+    Writes pending changes of all versions caches to disk
+    """
+
+    with _VERSION_CACHES_LOCK:
+        version_caches = list(_VERSION_CACHES.values())
+    for version_cache in version_caches:
+        version_cache.save()
+
+
+def get_history_cache():
+    """
+    Returns history cache shared by the whole process, so all the tools and widgets reuse downloaded histories
+    :return: HistoryCache
+    """
+
+    global _HISTORY_CACHE
+
+    with _HISTORY_CACHE_LOCK:
+        if _HISTORY_CACHE is None:
+            _HISTORY_CACHE = HistoryCache(version_cache=get_version_cache())
+
+        return _HISTORY_CACHE
+
+
+atexit.register(save_version_caches)
@@ -124,6 +124,10 @@ def register_configs():
 
     import tpDcc as tp
     from artellapipe import config
+    from artellapipe.utils import snapshot
+
+    # Configuration snapshots cached by managers are not valid anymore once configurations are registered again
+    snapshot.invalidate_snapshots()
 
     artella_configs_path = os.environ.get('ARTELLA_CONFIGS_PATH', None)
     if artella_configs_path and os.path.isdir(artella_configs_path):
@@ -20,7 +20,7 @@ import importlib
 from collections import OrderedDict
 
 import tpDcc as tp
-from tpDcc.libs.python import python, decorators, strings, path as path_utils
+from tpDcc.libs.python import python, strings, path as path_utils
 
 if python.is_python2():
     import pkgutil as loader
@@ -28,8 +28,8 @@ else:
     import importlib as loader
 
 import artellapipe
-from artellapipe.utils import exceptions
-from artellapipe.core import defines
+from artellapipe.utils import exceptions, snapshot, metrics
+from artellapipe.core import defines, assetindex
 from artellapipe.libs.artella.core import artellalib, artellaclasses
 
 LOGGER = logging.getLogger('artellapipe')
@@ -38,8 +38,10 @@ LOGGER = logging.getLogger('artellapipe')
 class AssetsManager(object):
 
     _assets = list()
+    _asset_index = assetindex.AssetIndex()
     _config = None
     _registered_asset_classes = list()
+    _asset_classes_by_category = dict()
 
     @property
     def config(self):
@@ -53,6 +55,10 @@ class AssetsManager(object):
 
         return self.__class__._config
 
+    @property
+    def config_snapshot(self):
+        return snapshot.get_config_snapshot(self.config)
+
     @property
     def asset_classes(self):
         if not self.__class__._registered_asset_classes:
@@ -60,9 +66,17 @@ class AssetsManager(object):
 
         return self.__class__._registered_asset_classes
 
+    @property
+    def asset_classes_by_category(self):
+        if not self.__class__._asset_classes_by_category:
+            for asset_class in self.asset_classes:
+                self.__class__._asset_classes_by_category.setdefault(asset_class.FILE_TYPE, asset_class)
+
+        return self.__class__._asset_classes_by_category
+
     @property
     def asset_types(self):
-        return self.config.get('types', default=dict()).keys()
+        return self.config_snapshot.get('types', default=dict()).keys()
 
     @property
     def assets(self):
@@ -70,7 +84,7 @@ class AssetsManager(object):
 
     @property
     def must_file_types(self):
-        return self.config.get('must_file_types', default=list())
+        return self.config_snapshot.get('must_file_types', default=list())
 
     def register_asset_class(self, asset_class):
         """
@@ -84,6 +98,7 @@ class AssetsManager(object):
             return False
 
         self.__class__._registered_asset_classes.append(asset_class)
+        self.__class__._asset_classes_by_category.clear()
         return True
 
     def get_asset_categories(self):
@@ -92,7 +107,7 @@ class AssetsManager(object):
         :return: list(str)
         """
 
-        return self.config.get('types', default=list())
+        return self.config_snapshot.get('types', default=list())
 
     def get_asset_id_from_node(self, node):
         """
@@ -136,7 +151,7 @@ class AssetsManager(object):
         :return: list(str)
         """
 
-        asset_types = self.config.get('types', default={})
+        asset_types = self.config_snapshot.get('types', default={})
         return asset_types.keys()
 
     def get_asset_type_files(self, asset_type):
@@ -146,7 +161,7 @@ class AssetsManager(object):
         :return: list(str)
         """
 
-        asset_types = self.config.get('types', default={})
+        asset_types = self.config_snapshot.get('types', default={})
         if asset_type not in asset_types:
             return list()
 
@@ -158,7 +173,7 @@ class AssetsManager(object):
         :return: str
         """
 
-        return self.config.get('default_name', default='New Asset')
+        return self.config_snapshot.get('default_name', default='New Asset')
 
     def get_shading_file_type(self):
         """
@@ -166,7 +181,7 @@ class AssetsManager(object):
         :return: str
         """
 
-        return self.config.get('shading_file_type', default='shading')
+        return self.config_snapshot.get('shading_file_type', default='shading')
 
     def get_shaders_mapping_file_type(self):
         """
@@ -174,7 +189,7 @@ class AssetsManager(object):
         :return: str
         """
 
-        return self.config.get('shaders_mapping_file_type', default='shadersmapping')
+        return self.config_snapshot.get('shaders_mapping_file_type', default='shadersmapping')
 
     def get_default_asset_thumb(self):
         """
@@ -182,7 +197,7 @@ class AssetsManager(object):
         :return: str
         """
 
-        return self.config.get('default_thumb', default='default')
+        return self.config_snapshot.get('default_thumb', default='default')
 
     def get_assets_by_type(self, asset_type):
         """
@@ -235,6 +250,7 @@ class AssetsManager(object):
 
         return True
 
+    @metrics.timed('assets.find_all_assets')
     def find_all_assets(self, force_update=False, force_login=True):
         """
         Returns a list of all assets in the project
@@ -249,6 +265,7 @@ class AssetsManager(object):
             return self.__class__._assets
 
         python.clear_list(self.__class__._assets)
+        self.__class__._asset_index.clear()
 
         if not artellapipe.Tracker().is_logged() and force_login:
             artellapipe.Tracker().login()
@@ -266,6 +283,7 @@ class AssetsManager(object):
             if not new_asset:
                 continue
             self.__class__._assets.append(new_asset)
+            self.__class__._asset_index.add(new_asset)
 
         return self.__class__._assets
 
@@ -282,12 +300,8 @@ class AssetsManager(object):
 
         self._check_project()
 
-        assets_found = list()
-        all_assets = self.find_all_assets(force_update=force) or list()
-        for asset in all_assets:
-            if asset.get_name() == asset_name:
-                assets_found.append(asset)
-
+        self.find_all_assets(force_update=force)
+        assets_found = self.__class__._asset_index.get_assets_by_name(asset_name)
         if not assets_found:
             return None
 
@@ -311,10 +325,21 @@ class AssetsManager(object):
         if not category:
             return artellapipe.Asset(project=self, asset_data=asset_data)
         else:
-            asset_classes = self.asset_classes
-            for asset_class in asset_classes:
-                if asset_class.FILE_TYPE == category:
-                    return asset_class(project=artellapipe.project, asset_data=asset_data)
+            asset_class = self.asset_classes_by_category.get(category, None)
+            if asset_class:
+                return asset_class(project=artellapipe.project, asset_data=asset_data)
+
+    def resolve_asset(self, asset_data):
+        """
+        Returns the asset of the project catalog with the ID stored in the given data. If the asset is not
+        in the catalog, a new asset is created
+        :param asset_data: dict
+        :return: ArtellaAsset or None
+        """
+
+        id_attr = self.config_snapshot.get('data.id_attribute')
+
+        return self.__class__._asset_index.resolve(asset_data, id_attr, self.create_asset)
 
     def create_asset_in_artella(self, asset_name, asset_path, folders_to_create=None):
         """
@@ -371,7 +396,7 @@ class AssetsManager(object):
         :return: str
         """
 
-        filename_attr = self.config.get('data', 'filename')
+        filename_attr = self.config_snapshot.get('data.filename')
         working_folder = artellapipe.project.get_working_folder()
         return os.path.join(asset_path, working_folder, filename_attr)
 
@@ -391,7 +416,7 @@ class AssetsManager(object):
         else:
             return self._get_latest_published_versions_indie(asset_path, file_type=file_type)
 
-    @decorators.timestamp
+    @metrics.timed('assets.get_scene_assets')
     def get_scene_assets(self, as_nodes=True, allowed_types=None, allowed_tags=None, node_id=None):
         """
         Returns a list with all assets in the current scene
@@ -401,11 +426,8 @@ class AssetsManager(object):
         :return: list(str) or list(ArtellaAssetNode)
         """
 
-        if not allowed_types:
-            allowed_types = list()
-
-        if not allowed_tags:
-            allowed_tags = list()
+        allowed_types = frozenset(python.force_list(allowed_types)) if allowed_types else frozenset()
+        allowed_tags = frozenset(python.force_list(allowed_tags)) if allowed_tags else frozenset()
 
         scene_assets = list()
 
@@ -425,10 +447,8 @@ class AssetsManager(object):
                         or asset.FILE_TYPE in allowed_tags:
                     valid_assets.append(asset)
                     continue
-                for tag in asset_tags:
-                    if tag in allowed_tags:
-                        valid_assets.append(asset)
-                        break
+                if not allowed_tags.isdisjoint(asset_tags):
+                    valid_assets.append(asset)
 
         if not valid_assets:
             LOGGER.warning('No valid assets found in current scene!')
@@ -488,6 +508,7 @@ class AssetsManager(object):
 
         return asset_node
 
+    @metrics.timed('assets.get_assets_in_shot')
     def get_assets_in_shot(self, shot, force_login=True):
         """
         Returns all the assets contained in given shot breakdown defined in production tracker
@@ -507,12 +528,41 @@ class AssetsManager(object):
             LOGGER.warning('No assets found in shot breakdown')
             return None
 
-        found_assets = list()
-        for asset_data in assets_in_shots:
-            new_asset = self.create_asset(asset_data)
-            found_assets.append(new_asset)
+        self.find_all_assets(force_login=force_login)
+
+        return [self.resolve_asset(asset_data) for asset_data in assets_in_shots]
+
+    @metrics.timed('assets.get_assets_in_sequence')
+    def get_assets_in_sequence(self, sequence_name, force_login=True):
+        """
+        Returns all the assets contained in the breakdown of each one of the shots of the given sequence. Breakdown
+        entries are resolved by ID against the assets catalog, the same way get_assets_in_shot does
+        :param sequence_name: str
+        :param force_login: bool
+        :return: OrderedDict(str, list(ArtellaAsset)), dictionary that maps shot names with the assets of the shot
+        """
+
+        if not artellapipe.Tracker().is_logged() and force_login:
+            artellapipe.Tracker().login()
+        if not artellapipe.Tracker().is_logged():
+            LOGGER.warning(
+                'Impossible to find assets of current project because user is not log into production tracker')
+            return None
+
+        sequence_shots = artellapipe.ShotsMgr().get_shots_from_sequence(sequence_name, force_login=force_login)
+        if not sequence_shots:
+            LOGGER.warning('No shots found in sequence "{}"'.format(sequence_name))
+            return None
+
+        self.find_all_assets(force_login=force_login)
+
+        tracker = artellapipe.Tracker()
+        assets_in_sequence = OrderedDict()
+        for shot in sequence_shots:
+            assets_in_shot = tracker.all_assets_in_shot(shot.get_id()) or list()
+            assets_in_sequence[shot.get_name()] = [self.resolve_asset(asset_data) for asset_data in assets_in_shot]
 
-        return found_assets
+        return assets_in_sequence
 
     def get_asset_renderable_shapes(self, asset, remove_namespace=False, full_path=True):
         """
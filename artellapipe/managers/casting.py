@@ -15,6 +15,7 @@ __email__ = "tpovedatd@gmail.com"
 import logging
 
 import artellapipe
+from artellapipe.core import casting
 from artellapipe.utils import exceptions
 from artellapipe.managers import shots
 
@@ -23,6 +24,34 @@ LOGGER = logging.getLogger('artellapipe')
 
 class ArtellaCastingManager(object):
 
+    _casting_matrix = None
+
+    def get_casting_matrix(self, force_update=False):
+        """
+        Returns matrix with the casting of the shots of the project. If the tracker supports complete breakdowns, the
+        casting of all the shots is retrieved with a single request. Otherwise, the casting of each shot is retrieved
+        from production tracker the first time it is requested
+        :param force_update: bool, Whether the matrix must be created again or not
+        :return: CastingMatrix
+        """
+
+        if self.__class__._casting_matrix is not None and not force_update:
+            return self.__class__._casting_matrix
+
+        casting_matrix = casting.CastingMatrix()
+        if self._check_tracker():
+            try:
+                breakdown = artellapipe.Tracker().get_shots_breakdown(force_update=force_update)
+            except NotImplementedError:
+                breakdown = None
+            if breakdown is not None:
+                shot_ids = [shot.get_id() for shot in shots.ShotsManager().find_all_shots() or list()]
+                casting_matrix = casting.CastingMatrix.from_breakdown(breakdown, shot_ids=shot_ids)
+
+        self.__class__._casting_matrix = casting_matrix
+
+        return casting_matrix
+
     def get_ocurrences_of_asset_in_shot(self, asset_name, shot_name, force_update=False):
         """
         Returns the number of ocurrences of given asset in given shot
@@ -46,11 +75,89 @@ class ArtellaCastingManager(object):
 
         shot_id = shot.get_id()
 
+        casting_matrix = self.get_casting_matrix()
+        total_occurrences = None if force_update else casting_matrix.get_occurrences(asset_name, shot_id)
+        if total_occurrences is not None:
+            return total_occurrences
+
         tracker = artellapipe.Tracker()
         total_occurrences = tracker.get_occurrences_of_asset_in_shot(shot_id, asset_name, force_update=force_update)
+        if total_occurrences is not None:
+            casting_matrix.set_occurrences(shot_id, asset_name, total_occurrences)
 
         return total_occurrences
 
+    def get_assets_in_shot(self, shot_name, force_update=False):
+        """
+        Returns all the assets cast in the given shot with its number of occurrences
+        :param shot_name: str, name of the shot
+        :param force_update: bool
+        :return: dict(str, int) or None
+        """
+
+        if not self._check_project():
+            return None
+
+        shot = shots.ShotsManager().find_shot(shot_name)
+        if not shot:
+            LOGGER.warning('Impossible to return casting because shot "{}" does not exists!'.format(shot_name))
+            return None
+
+        return self.get_shot_casting(shot.get_id(), force_update=force_update)
+
+    def get_shot_casting(self, shot_id, force_update=False):
+        """
+        Returns all the assets cast in the shot with the given ID with its number of occurrences
+        :param shot_id: str, ID of the shot
+        :param force_update: bool
+        :return: dict(str, int) or None
+        """
+
+        casting_matrix = self.get_casting_matrix()
+        if (force_update or not casting_matrix.is_shot_loaded(shot_id)) and self._check_tracker():
+            self._load_shot_casting(casting_matrix, shot_id, force_update=force_update)
+
+        return casting_matrix.get_assets_in_shot(shot_id)
+
+    def get_shots_of_asset(self, asset_name, force_update=False):
+        """
+        Returns the IDs of all the shots where the given asset is cast with the number of occurrences of the asset in
+        each shot. Only the casting of the shots that are not stored in the casting matrix yet is retrieved
+        :param asset_name: str, name of the asset
+        :param force_update: bool, Whether the casting of all the shots must be retrieved again or not
+        :return: dict(str, int) or None, dictionary that maps shot IDs (not shot names) with occurrences
+        """
+
+        if not self._check_project():
+            return None
+
+        casting_matrix = self.get_casting_matrix()
+        for shot in shots.ShotsManager().find_all_shots() or list():
+            self.get_shot_casting(shot.get_id(), force_update=force_update)
+
+        return casting_matrix.get_shots_of_asset(asset_name)
+
+    def _load_shot_casting(self, casting_matrix, shot_id, force_update=False):
+        """
+        Internal function that retrieves the complete casting of the given shot from production tracker and stores it
+        in the given casting matrix
+        :param casting_matrix: CastingMatrix
+        :param shot_id: str
+        :param force_update: bool
+        """
+
+        tracker = artellapipe.Tracker()
+        name_attr = artellapipe.AssetsMgr().config_snapshot.get('data.name_attribute')
+        occurrences = dict()
+        for asset_data in tracker.all_assets_in_shot(shot_id) or list():
+            asset_name = asset_data.get(name_attr, None)
+            if not asset_name or asset_name in occurrences:
+                continue
+            occurrences[asset_name] = tracker.get_occurrences_of_asset_in_shot(
+                shot_id, asset_name, force_update=force_update)
+
+        casting_matrix.set_shot_occurrences(shot_id, occurrences)
+
     def _check_tracker(self, force_login=True):
         """
         Internal function that checks whether or not production tracking is ready to be used with this manager
@@ -64,6 +171,8 @@ class ArtellaCastingManager(object):
                 'Impossible to find casting of current project because user is not log into production tracker')
             return None
 
+        return True
+
     def _check_project(self):
         """
         Internal function that checks whether or not casting manager has a project set. If not an exception is raised
@@ -18,11 +18,30 @@ import logging
 import tpDcc as tp
 from tpDcc.libs.python import decorators
 
+import artellapipe
+from artellapipe.core import dependencygraph, dependencycrawler
+
 LOGGER = logging.getLogger('artellapipe')
 
 
 class DependenciesManager(object):
 
+    DEPENDENCY_GRAPH_FILE_NAME = 'dependencies_graph.json'
+    MAX_CRAWL_WORKERS = 8
+
+    _dependency_graph = None
+
+    @property
+    def dependency_graph(self):
+        if not self.__class__._dependency_graph:
+            cache_file = None
+            data_path = artellapipe.project.get_data_path() if artellapipe.project else None
+            if data_path:
+                cache_file = os.path.join(data_path, self.DEPENDENCY_GRAPH_FILE_NAME)
+            self.__class__._dependency_graph = dependencygraph.DependencyGraph(cache_file=cache_file)
+
+        return self.__class__._dependency_graph
+
     @decorators.abstractmethod
     def get_dependencies(self, file_path, parent_path=None, found_files=None):
         """
@@ -37,6 +56,17 @@ class DependenciesManager(object):
         raise NotImplementedError(
             'get_dependencies function is not implemented in "{}"'.format(self.__class__.__name__))
 
+    @decorators.abstractmethod
+    def get_file_references(self, file_path):
+        """
+        Returns the files directly referenced by the given file. Used to build the dependency graph
+        :param file_path: str
+        :return: list(str)
+        """
+
+        raise NotImplementedError(
+            'get_file_references function is not implemented in "{}"'.format(self.__class__.__name__))
+
     @decorators.abstractmethod
     def fix_dependencies_paths(self, file_path):
         """
@@ -58,7 +88,104 @@ class DependenciesManager(object):
             LOGGER.warning('Impossible to retrieve dependencies from current scene file: "{}"'.format(file_path))
             return
 
-        return self.get_dependencies(file_path=file_path)
+        return self.get_cached_dependencies(file_path=file_path)
+
+    def get_cached_dependencies(self, file_path, force_update=False):
+        """
+        Returns all dependencies of the given file using the dependency graph. Only files that changed since
+        the last time they were parsed are parsed again
+        :param file_path: str
+        :param force_update: bool, Whether to force the parsing of all the files
+        :return: list(str)
+        """
+
+        if force_update:
+            for reference in self.dependency_graph.get_references(file_path, recursive=True):
+                self.dependency_graph.remove(reference)
+            self.dependency_graph.remove(file_path)
+
+        try:
+            self.dependency_graph.update(file_path, parse_fn=self.get_file_references)
+        except NotImplementedError:
+            return self.get_dependencies(file_path=file_path)
+
+        if self.dependency_graph.is_dirty:
+            self.dependency_graph.save()
+
+        return self.dependency_graph.get_references(file_path, recursive=True)
+
+    def crawl_dependencies(self, file_paths, consumer=None, max_workers=None):
+        """
+        Finds all the dependencies of the given files parsing independent files in parallel. Dependencies are
+        returned as soon as they are found
+        :param file_paths: str or list(str)
+        :param consumer: fn, optional function called with each found dependency
+        :param max_workers: int, maximum number of files parsed at the same time
+        :return: iterator(str)
+        """
+
+        file_paths = [file_paths] if not isinstance(file_paths, (list, tuple, set)) else list(file_paths)
+        dependency_graph = self.dependency_graph
+
+        def _parse(file_path):
+            return dependency_graph.get_direct_references(file_path, parse_fn=self.get_file_references)
+
+        crawler = dependencycrawler.DependencyCrawler(_parse, max_workers=max_workers or self.MAX_CRAWL_WORKERS)
+        try:
+            for dependency in crawler.crawl(file_paths, consumer=consumer):
+                yield dependency
+        finally:
+            if dependency_graph.is_dirty:
+                dependency_graph.save()
+
+    def sync_dependencies(self, file_paths, batch_size=25, max_workers=None):
+        """
+        Synchronizes all the dependencies of the given files. Found dependencies are synchronized in batches
+        while the rest of dependencies are still being searched
+        :param file_paths: str or list(str)
+        :param batch_size: int, number of dependencies synchronized at once
+        :param max_workers: int, maximum number of files parsed at the same time
+        :return: list(str), synchronized dependencies
+        """
+
+        synced_files = list()
+        files_to_sync = list()
+        for dependency in self.crawl_dependencies(file_paths, max_workers=max_workers):
+            files_to_sync.append(dependency)
+            if len(files_to_sync) >= batch_size:
+                artellapipe.FilesMgr().sync_files(files_to_sync)
+                synced_files.extend(files_to_sync)
+                files_to_sync = list()
+        if files_to_sync:
+            artellapipe.FilesMgr().sync_files(files_to_sync)
+            synced_files.extend(files_to_sync)
+
+        return synced_files
+
+    def get_referencing_files(self, file_path, recursive=False):
+        """
+        Returns files of the dependency graph that reference the given file
+        :param file_path: str
+        :param recursive: bool, Whether to return also the files that reference those files
+        :return: list(str)
+        """
+
+        return self.dependency_graph.get_referencing_files(file_path, recursive=recursive)
+
+    def get_update_order(self, file_paths):
+        """
+        Returns given files and their dependencies sorted so dependencies are located before the files using them
+        :param file_paths: list(str)
+        :return: list(str)
+        """
+
+        for file_path in file_paths:
+            try:
+                self.dependency_graph.update(file_path, parse_fn=self.get_file_references)
+            except NotImplementedError:
+                break
+
+        return self.dependency_graph.get_topological_order(file_paths)
 
     @decorators.abstractmethod
     def update_dependencies(self, file_path):
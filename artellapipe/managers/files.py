@@ -31,7 +31,8 @@ else:
 import artellapipe
 from artellapipe.libs import artella as artella_lib
 from artellapipe.libs.artella.core import artellalib
-from artellapipe.utils import exceptions
+from artellapipe.core import localversions, filestransaction, versioncache
+from artellapipe.utils import exceptions, snapshot, paths, metrics
 
 LOGGER = logging.getLogger('artellapipe')
 
@@ -53,9 +54,25 @@ class FilesManager(python.Singleton, object):
 
         return self.__class__._config
 
+    @property
+    def config_snapshot(self):
+        return snapshot.get_config_snapshot(self.config)
+
     @property
     def files(self):
-        return self.config.get('files', default=dict())
+        return self.config_snapshot.get('files', default=dict())
+
+    @property
+    def path_normalizer(self):
+        return paths.get_path_normalizer(artellapipe.project.get_context())
+
+    @property
+    def version_cache(self):
+        return versioncache.get_version_cache()
+
+    @property
+    def history_cache(self):
+        return versioncache.get_history_cache()
 
     @property
     def file_classes(self):
@@ -200,24 +217,19 @@ class FilesManager(python.Singleton, object):
 
         self._check_project()
 
-        project_env_var = artellapipe.project.env_var
-
-        if clean_path:
-            path_to_fix = path_utils.clean_path(path_to_fix)
-
-        project_var = os.environ.get(project_env_var)
-        if not project_var:
-            return path_to_fix
+        return self.path_normalizer.fix_path(path_to_fix, clean_path=clean_path)
 
-        project_type = artellapipe.project.get_project_type()
-        root_prefix = artellapipe.libs.artella.config.get('app', project_type).get('root_prefix', 'ART_LOCAL_ROOT')
+    def fix_paths(self, paths_to_fix, clean_path=True):
+        """
+        Converts all given paths to paths relative to project environment variable
+        :param paths_to_fix: list(str)
+        :param clean_path: bool
+        :return: list(str)
+        """
 
-        if path_to_fix.startswith('${}/'.format(project_env_var)):
-            path_to_fix = path_to_fix.replace('${}/'.format(project_env_var), project_var)
-        elif path_to_fix.startswith('${}/'.format(root_prefix)):
-            path_to_fix = path_to_fix.replace('${}/'.format(root_prefix), project_var)
+        self._check_project()
 
-        return path_to_fix
+        return self.path_normalizer.fix_paths(paths_to_fix, clean_path=clean_path)
 
     def relative_path(self, full_path):
         """
@@ -251,15 +263,18 @@ class FilesManager(python.Singleton, object):
 
         self._check_project()
 
-        path_to_resolve = path_to_resolve.replace('\\', '/')
-        project_var = os.environ.get(artellapipe.project.env_var)
-        if not project_var:
-            return path_to_resolve
+        return self.path_normalizer.resolve_path(path_to_resolve)
+
+    def resolve_paths(self, paths_to_resolve):
+        """
+        Converts all given paths to valid full paths
+        :param paths_to_resolve: list(str)
+        :return: list(str)
+        """
 
-        if path_to_resolve.startswith(project_var):
-            path_to_resolve = path_to_resolve.replace(project_var, '${}/'.format(artellapipe.project.env_var))
+        self._check_project()
 
-        return path_to_resolve
+        return self.path_normalizer.resolve_paths(paths_to_resolve)
 
     def prefix_path_with_project_path(self, path_to_prefix, env_var=False):
         """
@@ -274,25 +289,23 @@ class FilesManager(python.Singleton, object):
         if not path_to_prefix:
             return
 
-        path_to_prefix = path_utils.clean_path(path_to_prefix)
+        normalizer = self._get_prefix_path_normalizer(env_var=env_var)
 
-        production_folder = artellapipe.project.get_production_folder()
-        if production_folder:
-            if path_to_prefix.startswith((production_folder, os.sep + production_folder, '/' + production_folder)):
-                return self.prefix_path_with_artella_env_path(path_to_prefix)
+        return normalizer.prefix_path_with_project_path(path_to_prefix, env_var=env_var)
 
-        if env_var:
-            project_env_var = artellapipe.project.env_var
-            project_var = path_utils.clean_path(os.environ.get(project_env_var))
-            if path_to_prefix.startswith(project_var):
-                return path_to_prefix
-            return path_utils.clean_path(os.path.join(project_var, path_to_prefix))
-        else:
-            project_path = path_utils.clean_path(artellapipe.project.get_path())
-            if path_to_prefix.startswith(project_path):
-                return path_to_prefix
+    def prefix_paths_with_project_path(self, paths_to_prefix, env_var=False):
+        """
+        Adds project path to all given paths as prefix
+        :param paths_to_prefix: list(str)
+        :param env_var: bool
+        :return: list(str)
+        """
+
+        self._check_project()
 
-            return path_utils.clean_path(os.path.join(project_path, path_to_prefix))
+        normalizer = self._get_prefix_path_normalizer(env_var=env_var)
+
+        return normalizer.prefix_paths_with_project_path(paths_to_prefix, env_var=env_var)
 
     def prefix_path_with_artella_env_path(self, path_to_prefix):
         """
@@ -301,14 +314,9 @@ class FilesManager(python.Singleton, object):
         :return: str
         """
 
-        project_type = artellapipe.project.get_project_type()
-        root_prefix = artellapipe.libs.artella.config.get('app', project_type).get('root_prefix', 'ART_LOCAL_ROOT')
-        artella_var = os.environ.get(root_prefix, None)
-        if not artella_var:
-            return path_to_prefix
-
-        return path_utils.join_path(artella_var, path_to_prefix)
+        return self.path_normalizer.prefix_path_with_artella_env_path(path_to_prefix)
 
+    @metrics.timed('files.sync_files')
     def sync_files(self, files):
         """
         Synchronizes given files from Artella server into user hard drive
@@ -318,10 +326,14 @@ class FilesManager(python.Singleton, object):
         self._check_project()
 
         files = python.force_list(files)
+        metrics.increment('files.synced_files', len(files))
 
         sync_dialog = artellapipe.SyncFileDialog(project=artellapipe.project, files=files)
         sync_dialog.sync()
 
+        localversions.invalidate_local_version_indices()
+
+    @metrics.timed('files.sync_paths')
     def sync_paths(self, paths, recursive=False):
         """
         Synchronizes given paths from Artella server into user hard drive
@@ -331,10 +343,13 @@ class FilesManager(python.Singleton, object):
         self._check_project()
 
         paths = python.force_list(paths)
+        metrics.increment('files.synced_paths', len(paths))
 
         sync_dialog = artellapipe.SyncPathDialog(project=artellapipe.project, paths=paths, recursive=recursive)
         sync_dialog.sync()
 
+        localversions.invalidate_local_version_indices()
+
     def sync_latest_published_version(self, file_to_sync):
         """
         Synchronizes given files from Artella server into user hard drive and make sure that the last version of the
@@ -351,6 +366,7 @@ class FilesManager(python.Singleton, object):
         latest_publihsed_path = latest_version[2]
         print(latest_publihsed_path)
 
+    @metrics.timed('files.lock_file')
     def lock_file(self, file_path=None, notify=False):
         """
         Locks given file in Artella
@@ -380,6 +396,7 @@ class FilesManager(python.Singleton, object):
 
         return True
 
+    @metrics.timed('files.unlock_file')
     def unlock_file(self, file_path=None, notify=False, warn_user=True):
         """
         Unlocks current file in Artella
@@ -458,6 +475,7 @@ class FilesManager(python.Singleton, object):
 
         return True
 
+    @metrics.timed('files.upload_working_version')
     def upload_working_version(self, file_path=None, skip_saving=False, notify=False, comment=None, force=False):
         """
         Uploads a new working version of the given file
@@ -484,22 +502,8 @@ class FilesManager(python.Singleton, object):
 
         short_path = file_path.replace(artellapipe.AssetsMgr().get_assets_path(), '')[1:]
 
-        if artellapipe.project.is_enterprise():
-            current_version = artellalib.get_current_version(file_path)
-            if current_version == -1:
-                current_version = 0
-            new_version = current_version + 1
-        else:
-            history = artellalib.get_file_history(file_path)
-            file_versions = history.versions
-            if not file_versions:
-                current_version = -1
-            else:
-                current_version = 0
-                for v in file_versions:
-                    if int(v[0]) > current_version:
-                        current_version = int(v[0])
-            new_version = current_version + 1
+        # Cached versions can be outdated if other users uploaded the file, so server is always queried
+        new_version = self.get_current_version(file_path, force_update=True) + 1
 
         if comment:
             comment = str(comment)
@@ -510,6 +514,8 @@ class FilesManager(python.Singleton, object):
 
         if comment:
             artellalib.upload_new_asset_version(file_path=file_path, comment=comment, skip_saving=skip_saving)
+            self.version_cache.set(file_path, new_version)
+            self.history_cache.invalidate(file_path)
             if notify:
                 artellapipe.project.notify(
                     title='New Working Version',
@@ -519,6 +525,98 @@ class FilesManager(python.Singleton, object):
 
         return False
 
+    def get_current_version(self, file_path, force_update=False):
+        """
+        Returns current server version of the given file without downloading its history. Versions are cached
+        between sessions and updated each time a new version is uploaded
+        :param file_path: str
+        :param force_update: bool, Whether to query Artella server even if the version is cached
+        :return: int, 0 if the file has no versions
+        """
+
+        return self.version_cache.get_current_version(
+            self.fix_path(file_path), client=artellalib, force_update=force_update,
+            use_history=not artellapipe.project.is_enterprise())
+
+    def get_history_page(self, file_path, page=0, page_size=None, force_update=False):
+        """
+        Returns a page of the history of the given file sorted from newest to oldest version. History is only
+        downloaded again when a newer version of the file is available
+        :param file_path: str
+        :param page: int, index of the page (0 is the page with the newest versions)
+        :param page_size: int
+        :param force_update: bool
+        :return: list(tuple(int, object)), list of (version, version data)
+        """
+
+        return self.history_cache.get_page(
+            self.fix_path(file_path), page=page, page_size=page_size, force_update=force_update)
+
+    def transaction(self, files=None, comment=None, skip_saving=True, upload=True):
+        """
+        Returns a transaction that locks all given files at once, uploads them as a new version with a single comment
+        and unlocks them. If no comment is given, user is asked once for the comment of all the files
+            with artellapipe.FilesMgr().transaction(comment='New shaders version') as transaction:
+                transaction.lock(shader_files)
+                ... write shader files ...
+        :param files: list(str)
+        :param comment: str
+        :param skip_saving: bool
+        :param upload: bool, If False, files are only locked and unlocked
+        :return: FilesTransaction
+        """
+
+        self._check_project()
+
+        def _get_comment(new_versions):
+            if comment:
+                return str(comment)
+            if len(new_versions) == 1:
+                file_path, new_version = list(new_versions.items())[0]
+                short_path = file_path.replace(artellapipe.AssetsMgr().get_assets_path(), '')[1:]
+                text_message = 'Make New Version ({}) : {}'.format(new_version, short_path)
+            else:
+                text_message = 'Make New Version of {} files'.format(len(new_versions))
+            return qtutils.get_comment(text_message=text_message, title='Comment', parent=tp.Dcc.get_main_window())
+
+        files = self.fix_paths(python.force_list(files)) if files else None
+
+        return filestransaction.FilesTransaction(
+            files=files, comment=_get_comment, skip_saving=skip_saving, upload=upload, client=artellalib,
+            version_cache=self.version_cache, history_cache=self.history_cache,
+            use_history=not artellapipe.project.is_enterprise())
+
+    @metrics.timed('files.upload_working_versions')
+    def upload_working_versions(self, files, skip_saving=True, notify=False, comment=None):
+        """
+        Uploads a new working version of all the given files with a single comment. All files are locked before
+        uploading them and unlocked afterwards
+        :param files: list(str)
+        :param skip_saving: bool
+        :param notify: bool
+        :param comment: str
+        :return: bool
+        """
+
+        files = self.fix_paths([file_path for file_path in python.force_list(files) if file_path])
+        if not files:
+            return False
+
+        for file_path in files:
+            if not self._check_file_path(file_path):
+                LOGGER.warning('File Path "{}" is not valid!'.format(file_path))
+                return False
+
+        transaction = self.transaction(files=files, comment=comment, skip_saving=skip_saving)
+        valid_upload = transaction.commit()
+        metrics.increment('files.uploaded_files', len(transaction.uploaded_files))
+        if notify and transaction.uploaded_files:
+            artellapipe.project.notify(
+                title='New Working Version',
+                msg='{} files uploaded to Artella server successfully!'.format(len(transaction.uploaded_files)))
+
+        return valid_upload
+
     def _check_project(self):
         """
         Internal function that checks whether or not assets manager has a project set. If not an exception is raised
@@ -529,6 +627,21 @@ class FilesManager(python.Singleton, object):
 
         return True
 
+    def _get_prefix_path_normalizer(self, env_var=False):
+        """
+        Internal function that returns path normalizer used to prefix paths with project path
+        :param env_var: bool
+        :return: PathNormalizer
+        """
+
+        normalizer = self.path_normalizer
+        if not normalizer.project_path and not env_var:
+            # Project path is not available yet, so we force the setup of the project environment variables
+            artellapipe.project.get_path()
+            normalizer = self.path_normalizer
+
+        return normalizer
+
     def _check_file_path(self, file_path):
         """
         Returns whether given path is a valid project path or not
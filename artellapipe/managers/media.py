@@ -21,6 +21,8 @@ import tpDcc
 from tpDcc.libs.python import yamlio, path as path_utils
 
 import artellapipe
+from artellapipe.core import mediaprofiles
+from artellapipe.utils import snapshot, orderedset, stamp
 
 LOGGER = logging.getLogger('artellapipe')
 
@@ -31,6 +33,7 @@ class MediaManager(object):
     TEMP_SUFFIX = 'tmp'
 
     _config = None
+    _profile_registry = None
 
     @property
     def config(self):
@@ -44,24 +47,41 @@ class MediaManager(object):
 
         return self.__class__._config
 
+    @property
+    def config_snapshot(self):
+        return snapshot.get_config_snapshot(self.config)
+
+    @property
+    def profile_registry(self):
+        media_paths = self.get_media_profiles_paths()
+        extensions = self.get_media_profiles_extensions()
+        if not self.__class__._profile_registry:
+            self.__class__._profile_registry = mediaprofiles.MediaProfileRegistry(
+                media_paths=media_paths, extensions=extensions, load_fn=self._load_media_profile,
+                path_utils=path_utils)
+        else:
+            # Profiles are indexed again if media profiles paths were changed (for example, in project configuration)
+            self.__class__._profile_registry.set_media_paths(media_paths, extensions=extensions)
+
+        return self.__class__._profile_registry
+
     def get_media_profiles_paths(self):
         """
         Returns all used to search media profiles in
         :return: list(str)
         """
 
-        paths_found = list()
-        media_profile_paths = self.config.get('media_profiles_paths', default=list())
+        paths_found = orderedset.OrderedSet()
+        media_profile_paths = self.config_snapshot.get('media_profiles_paths', default=list())
         for media_profile_path in media_profile_paths:
             if os.path.isdir(media_profile_path):
-                if media_profile_path not in paths_found:
-                    paths_found.append(media_profile_path)
+                paths_found.add(media_profile_path)
             else:
                 project_path = path_utils.clean_path(os.path.join(artellapipe.project.get_path(), media_profile_path))
-                if os.path.isdir(project_path) and project_path not in paths_found:
-                    paths_found.append(project_path)
+                if os.path.isdir(project_path):
+                    paths_found.add(project_path)
 
-        return paths_found
+        return paths_found.to_list()
 
     def get_media_profiles_extensions(self):
         """
@@ -69,7 +89,7 @@ class MediaManager(object):
         :return: list(str)
         """
 
-        return self.config.get('media_profiles_extensions', default=['.yml'])
+        return self.config_snapshot.get('media_profiles_extensions', default=['.yml'])
 
     def get_media_profiles_file_paths(self):
         """
@@ -77,24 +97,11 @@ class MediaManager(object):
         :return: list(str)
         """
 
-        media_paths = self.get_media_profiles_paths()
-        if not media_paths:
+        if not self.profile_registry.media_paths:
             LOGGER.warning('No media profiles paths found!')
             return list()
 
-        supported_extensions = self.get_media_profiles_extensions()
-
-        paths_found = list()
-        for media_path in media_paths:
-            for root, _, files in os.walk(media_path):
-                for file_name in files:
-                    file_ext = os.path.splitext(file_name)[-1].lower()
-                    if file_ext in supported_extensions:
-                        media_profile_path = path_utils.clean_path(os.path.join(root, file_name))
-                        if media_profile_path not in paths_found:
-                            paths_found.append(media_profile_path)
-
-        return paths_found
+        return self.profile_registry.get_paths()
 
     def get_media_profile_path(self, media_profile_name):
         """
@@ -103,19 +110,7 @@ class MediaManager(object):
         :return: str
         """
 
-        media_profile_paths = self.get_media_profiles_file_paths()
-        if not media_profile_paths:
-            return None
-
-        for media_profile_path in media_profile_paths:
-            profile_name = os.path.basename(media_profile_path)
-            if profile_name == media_profile_name:
-                return media_profile_path
-            profile_name = os.path.splitext(profile_name)[0]
-            if profile_name == media_profile_name:
-                return media_profile_path
-
-        return None
+        return self.profile_registry.get_path(media_profile_name)
 
     def get_media_profile_data(self, media_profile_name):
         """
@@ -124,28 +119,14 @@ class MediaManager(object):
         :return: dict
         """
 
-        media_profile_path = self.get_media_profile_path(media_profile_name)
-        if not media_profile_path or not os.path.isfile(media_profile_path):
-            return dict()
-
-        config_data = yamlio.read_file(media_profile_path)
+        return self.profile_registry.get_data(media_profile_name)
 
-        # We try to update config files with proper reosurce paths
-        profile_resource_folders = config_data.get('resources_folders', list())
-        if profile_resource_folders:
-            for profile_resource_folder in profile_resource_folders:
-                for key, value in config_data.items():
-                    try:
-                        if value and os.path.isfile(value):
-                            continue
-                        resource_path = tpDcc.ResourcesMgr().get(profile_resource_folder, value, key='project')
-                    except Exception:
-                        continue
-                    if resource_path and os.path.isfile(resource_path):
-                        config_data[key] = resource_path
-                        continue
+    def refresh_media_profiles(self):
+        """
+        Forces media profiles to be indexed again next time they are requested
+        """
 
-        return config_data
+        self.__class__._profile_registry = None
 
     def create_temp_path(self, prefix=None, suffix=None):
         """
@@ -183,11 +164,7 @@ class MediaManager(object):
             extra_dict = dict()
 
         if not config_dict:
-            default_profile = self.config.get('default_profile', default=None)
-            if default_profile:
-                config_dict = self.get_media_profile_data(default_profile)
-        if config_dict is None:
-            config_dict = dict()
+            config_dict = self.get_stamp_profile_data()
 
         extra_dict.update(config_dict)
 
@@ -222,4 +199,95 @@ class MediaManager(object):
         # frame.stamp_frame(output=output, resolution_x=res_x, resolution_y=res_y, config_dict=config_dict)
 
     def stamp_image(self, source, output, config_dict=None):
-        pass
+        if not stamp.PIL_AVAILABLE:
+            LOGGER.error('Impossible to stamp image "{}" because Pillow is not available!'.format(source))
+            return False
+
+        return stamp.stamp_image(source=source, output=output, config_dict=config_dict)
+
+    def stamp_many(self, sources, outputs, profile=None, extra_dict=None, processes=None):
+        """
+        Stamps all the given image frames with the same media profile. Profile is loaded once, its static overlay is
+        rendered once and frames are stamped in a pool of threads. A pool of processes is only used in standalone
+        sessions (or if multiprocessing executable is a Python interpreter), because inside DCCs worker processes
+        would be launched with the DCC executable
+        :param sources: list(str), paths to the image frames to stamp
+        :param outputs: list(str), paths where stamped frames are stored
+        :param profile: str or dict, name of the media profile or its data. If not given, default profile is used
+        :param extra_dict: dict, extra data used to resolve profile tokens
+        :param processes: int, number of processes used. If not given, it is retrieved from media configuration
+        :return: list(str), paths of the stamped frames
+        """
+
+        sources = list(sources or list())
+        outputs = list(outputs or list())
+        if len(sources) != len(outputs):
+            LOGGER.error('Impossible to stamp. Number of sources and outputs does not match!')
+            return list()
+        if not sources:
+            return list()
+
+        if not stamp.PIL_AVAILABLE:
+            LOGGER.error('Impossible to stamp images because Pillow is not available!')
+            return list()
+
+        for source in sources:
+            mime_type = mimetypes.guess_type(source)[0] or ''
+            if mime_type.split('/')[0] != 'image':
+                LOGGER.error('Impossible to stamp file: "{}"({}). Only images can be stamped in batch'.format(
+                    source, mime_type))
+                return list()
+
+        config_dict = dict(extra_dict or dict())
+        config_dict.update(self.get_stamp_profile_data(profile))
+        template = stamp.StampTemplate(config_dict)
+
+        if processes is None:
+            processes = self.config_snapshot.get('stamp_processes', default=None)
+        if processes and not tpDcc.is_standalone() and not stamp.can_use_processes():
+            LOGGER.debug('Frames are stamped using threads because no Python interpreter is available')
+            processes = None
+
+        return list(stamp.stamp_many(sources, outputs, config_dict=template, processes=processes))
+
+    def get_stamp_profile_data(self, profile=None):
+        """
+        Returns data of the given media profile used to stamp media
+        :param profile: str or dict, name of the media profile or its data. If not given, default profile is used
+        :return: dict
+        """
+
+        if isinstance(profile, dict):
+            return profile
+
+        profile = profile or self.config_snapshot.get('default_profile', default=None)
+        if not profile:
+            return dict()
+
+        return self.get_media_profile_data(profile)
+
+    def _load_media_profile(self, media_profile_path):
+        """
+        Internal function that parses given media profile file and resolves its resource paths
+        :param media_profile_path: str
+        :return: dict
+        """
+
+        config_data = yamlio.read_file(media_profile_path) or dict()
+
+        # We try to update config files with proper resource paths
+        profile_resource_folders = config_data.get('resources_folders', list())
+        if profile_resource_folders:
+            for profile_resource_folder in profile_resource_folders:
+                for key, value in config_data.items():
+                    try:
+                        if value and os.path.isfile(value):
+                            continue
+                        resource_path = tpDcc.ResourcesMgr().get(profile_resource_folder, value, key='project')
+                    except Exception:
+                        continue
+                    if resource_path and os.path.isfile(resource_path):
+                        config_data[key] = resource_path
+                        continue
+
+        return config_data
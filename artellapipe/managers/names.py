@@ -17,6 +17,7 @@ from tpDcc.libs.python import python
 from tpDcc.libs.nameit.core import namelib
 
 import artellapipe
+from artellapipe.utils import snapshot
 
 
 class NamesManager(object):
@@ -37,6 +38,10 @@ class NamesManager(object):
 
         return self.__class__._config
 
+    @property
+    def config_snapshot(self):
+        return snapshot.get_config_snapshot(self.config)
+
     @property
     def naming_config(self):
         if not self.__class__._naming_config:
@@ -72,10 +77,10 @@ class NamesManager(object):
             if v is None:
                 return False
 
-        auto_suffix = self.config.get('auto_suffixes', default=dict()) if self.config else None
+        auto_suffix = self.config_snapshot.get('auto_suffixes', default=dict()) if self.config else None
         obj_type = self._get_object_type(node_name)
 
-        if self.config and auto_suffix:
+        if auto_suffix:
             if obj_type not in auto_suffix:
                 return True if obj_type == parsed_name['node_type'] else False
             else:
@@ -122,7 +127,7 @@ class NamesManager(object):
                 'Impossible to generate name from node because not naming configuration was found!')
             return None
 
-        auto_suffix = self.config.get('auto_suffixes', default=dict())
+        auto_suffix = self.config_snapshot.get('auto_suffixes', default=dict())
         if not auto_suffix:
             artellapipe.logger.warning(
                 'Impossible to launch auto suffix functionality because no auto suffixes are defined!')
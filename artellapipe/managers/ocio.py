@@ -18,6 +18,7 @@ import traceback
 import tpDcc as tp
 
 import artellapipe
+from artellapipe.utils import snapshot
 
 LOGGER = logging.getLogger('artellapipe')
 
@@ -39,6 +40,10 @@ class OCIOManager(object):
 
         return self.__class__._config
 
+    @property
+    def config_snapshot(self):
+        return snapshot.get_config_snapshot(self.config)
+
     @property
     def plugins(self):
         if not self.__class__._available_plugins:
@@ -58,7 +63,7 @@ class OCIOManager(object):
         Loads all OCIO related plugins
         """
 
-        ocio_plugins = self.config.get('ocio_plugins', default=dict())
+        ocio_plugins = self.config_snapshot.get('ocio_plugins', default=dict())
         if not ocio_plugins:
             LOGGER.warning('No OCIO plugins found in configuration file: "{}"'.format(self.config.get_path()))
             return
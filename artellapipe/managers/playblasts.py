@@ -15,11 +15,14 @@ __email__ = "tpovedatd@gmail.com"
 import os
 import logging
 import tempfile
+from functools import partial
 
 import tpDcc as tp
 from tpDcc.libs.python import decorators, path as path_utils
 
 import artellapipe
+from artellapipe.core import playblastqueue
+from artellapipe.utils import snapshot, tokens
 
 LOGGER = logging.getLogger('artellapipe')
 
@@ -28,6 +31,7 @@ class PlayblastsManager(object):
 
     _config = None
     _registered_tokens = dict()
+    _token_formatter = None
 
     @property
     def config(self):
@@ -41,17 +45,28 @@ class PlayblastsManager(object):
 
         return self.__class__._config
 
+    @property
+    def config_snapshot(self):
+        return snapshot.get_config_snapshot(self.config)
+
     @property
     def tokens(self):
         return self.__class__._registered_tokens
 
+    @property
+    def token_formatter(self):
+        if not self.__class__._token_formatter:
+            self.__class__._token_formatter = tokens.TokenFormatter(self.tokens)
+
+        return self.__class__._token_formatter
+
     def get_presets_paths(self):
         """
         Returns paths where playblasts presets are located
         :return: str
         """
 
-        playblasts_paths = self.config.get('presets_paths')
+        playblasts_paths = self.config_snapshot.get('presets_paths')
         return [path_utils.clean_path(
             os.path.join(artellapipe.project.get_path(), p)) for p in playblasts_paths]
 
@@ -63,23 +78,38 @@ class PlayblastsManager(object):
 
         return self.tokens.keys()
 
-    def format_tokens(self, token_str, attrs_dict):
+    def format_tokens(self, token_str, attrs_dict=None, context=None):
         """
         Replace the tokens with the given strings
         :param token_str: str, filename of the playbalst with tokens
-        :param attrs_dict: dict, parsed capture options
+        :param attrs_dict: dict, parsed capture options. Ignored if a context is given
+        :param context: TokenContext, context created with create_token_context. Tokens already evaluated in the
+            context are not evaluated again
         :return: str, formatted filename with all tokens resolved
         """
 
-        if not token_str:
-            return token_str
+        return self.token_formatter.format(token_str, attrs_dict, context=context)
 
-        for token, value in self.tokens.items():
-            if token in token_str:
-                fn = value['fn']
-                token_str = token_str.replace(token, fn(attrs_dict))
+    def format_tokens_many(self, token_strs, attrs_dict=None, context=None):
+        """
+        Replace the tokens of all the given strings. Tokens are evaluated only once for all the given strings
+        :param token_strs: list(str), filenames of the playblasts with tokens
+        :param attrs_dict: dict, parsed capture options. Ignored if a context is given
+        :param context: TokenContext, context created with create_token_context. Tokens already evaluated in the
+            context are not evaluated again
+        :return: list(str), formatted filenames with all tokens resolved
+        """
 
-        return token_str
+        return self.token_formatter.format_many(token_strs, attrs_dict, context=context)
+
+    def create_token_context(self, attrs_dict):
+        """
+        Returns a new context that can be used to evaluate tokens only once during a capture
+        :param attrs_dict: dict, parsed capture options
+        :return: TokenContext
+        """
+
+        return tokens.TokenContext(attrs_dict)
 
     def register_token(self, token, fn, label=''):
         """
@@ -92,6 +122,7 @@ class PlayblastsManager(object):
         assert token.startswith('<') and token.endswith('>')
         assert callable(fn)
         self.tokens[token] = {'fn': fn, 'label': label}
+        self.__class__._token_formatter = None
 
     def get_camera_token(self, attrs_dict):
         """
@@ -187,12 +218,12 @@ class PlayblastsManager(object):
 
         camera = kwargs.get('camera', 'persp')
         sound = kwargs.get('sound', None)
-        width = kwargs.get('width', tp.Dcc.get_default_render_resolution_width())
-        height = kwargs.get('height', tp.Dcc.get_default_render_resolution_height())
+        width = kwargs.get('width', None)
+        height = kwargs.get('height', None)
         maintain_aspect_ratio = kwargs.get('maintain_aspect_ratio', True)
         frame = kwargs.get('frame', None)
-        start_frame = kwargs.get('start_frame', tp.Dcc.get_start_frame())
-        end_frame = kwargs.get('end_frame', tp.Dcc.get_end_frame())
+        start_frame = kwargs.get('start_frame', None)
+        end_frame = kwargs.get('end_frame', None)
         complete_filename = kwargs.get('complete_filename', None)
         raw_frame_numbers = kwargs.get('raw_frame_numbers', False)
 
@@ -240,6 +271,50 @@ class PlayblastsManager(object):
 
         return output
 
+    def capture_shots(self, shots=None, filename=None, stamp=True, stamp_profile=None, **kwargs):
+        """
+        Creates a playblast of each one of the given shots reusing the same capture panel for all of them
+        :param shots: list(ArtellaShot), shots to capture. If not given, all non muted shots of the scene are captured
+        :param filename: str, playblast filename. Can contain tokens (such as <camera>) that are resolved per shot
+        :param stamp: bool, Whether captured frames should be stamped or not
+        :param stamp_profile: str or dict, media profile used to stamp frames. If not given, default one is used
+        :param kwargs: dict, capture options shared by all the shots
+        :return: OrderedDict(str, str), dictionary that maps each captured shot name with its playblast path. Stamped
+            frames are stored in a stamped folder next to the captured frames and their path is returned
+        """
+
+        # Render resolution is resolved once for all the captures
+        options = dict(kwargs)
+        width = options.get('width', None) or tp.Dcc.get_default_render_resolution_width()
+        height = options.get('height', None) or tp.Dcc.get_default_render_resolution_height()
+        if options.pop('maintain_aspect_ratio', True):
+            height = round(width / tp.Dcc.get_default_render_resolution_aspect_ratio())
+        options.update({'width': width, 'height': height, 'maintain_aspect_ratio': False})
+
+        stamp_fn = None
+        if stamp:
+            stamp_fn = partial(
+                artellapipe.MediaMgr().stamp_many,
+                profile=artellapipe.MediaMgr().get_stamp_profile_data(stamp_profile))
+
+        capture_queue = playblastqueue.PlayblastCaptureQueue(self, stamp_fn=stamp_fn, **options)
+        if shots is None:
+            shots = artellapipe.ShotsMgr().find_non_muted_shots()
+        timing_table = artellapipe.ShotsMgr().get_timing_table()
+        for shot in shots or list():
+            capture_queue.add_shot(shot, filename=filename, timing_table=timing_table)
+
+        return capture_queue.run()
+
+    def get_playblast_frames(self, playblast_path):
+        """
+        Returns paths of the image frames generated by a playblast
+        :param playblast_path: str, path returned by capture. Image sequences can use # characters as frame padding
+        :return: list(str)
+        """
+
+        return playblastqueue.get_playblast_frames(playblast_path)
+
     def stamp_playblast(self, file_name, output_file, extra_dict=None):
         if extra_dict is None:
             extra_dict = dict()
@@ -250,14 +325,37 @@ class PlayblastsManager(object):
 
         return artellapipe.MediaMgr().stamp(file_name, output_file, extra_dict=extra_dict)
 
-    def _generate_playblast(self, width, height, off_screen, **kwargs):
+    def _generate_playblast(self, width, height, off_screen, panel=None, **kwargs):
         """
         Internal function that calls the DCC function to generate playblast
+        :param width: int
+        :param height: int
+        :param off_screen: bool
+        :param panel: str, capture panel created by _create_capture_panel. If given, DCC implementation must capture
+            using this panel (and its viewport setup) instead of creating a new one
         :return: str
         """
 
         raise NotImplementedError('_generate_playblast function is not implemented!')
 
+    def _create_capture_panel(self, width, height, **kwargs):
+        """
+        Internal function that creates the panel used to capture several playblasts. Must be implemented in DCC
+        specific managers to setup the viewport only once. Created panel is given to _generate_playblast of each
+        capture of the queue
+        :return: str or None, None if the DCC does not support capture panels reuse
+        """
+
+        return None
+
+    def _delete_capture_panel(self, panel):
+        """
+        Internal function that deletes panel created by _create_capture_panel
+        :param panel: str
+        """
+
+        pass
+
 
 @decorators.Singleton
 class ArtellaPlayblastsSingleton(PlayblastsManager, object):
@@ -0,0 +1,185 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tracking manager that replays recorded production tracker payloads
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import shutil
+import logging
+
+import artellapipe
+from artellapipe.core import trackingfixtures
+from artellapipe.managers import tracking
+
+LOGGER = logging.getLogger('artellapipe')
+
+
+class ReplayTrackingManager(tracking.TrackingManager, object):
+    """
+    Tracking manager that returns payloads stored in fixtures instead of connecting to a production tracker.
+    Fixtures can be recorded from a real tracker (see TrackingRecorder) or generated (see generate_fixtures), so
+    tools and performance tests can be run offline and deterministically
+    """
+
+    _fixtures = None
+
+    @classmethod
+    def set_fixtures(cls, fixtures):
+        """
+        Sets fixtures replayed by the tracker
+        :param fixtures: TrackingFixtures
+        """
+
+        cls._fixtures = fixtures
+        cls._updated = False
+
+    @classmethod
+    def load_fixtures(cls, fixtures_file, latency=0.0):
+        """
+        Loads fixtures replayed by the tracker from the given file
+        :param fixtures_file: str
+        :param latency: float or dict(str, float), seconds each call waits before returning its payload
+        :return: TrackingFixtures
+        """
+
+        fixtures = trackingfixtures.TrackingFixtures.load(fixtures_file, latency=latency)
+        cls.set_fixtures(fixtures)
+
+        return fixtures
+
+    @classmethod
+    def generate_fixtures(cls, num_assets=10000, num_shots=5000, latency=0.0, **kwargs):
+        """
+        Generates fixtures of a synthetic project and sets them as replayed fixtures
+        :param num_assets: int
+        :param num_shots: int
+        :param latency: float or dict(str, float), seconds each call waits before returning its payload
+        :param kwargs: dict, extra arguments passed to trackingfixtures.generate_fixtures
+        :return: TrackingFixtures
+        """
+
+        fixtures = trackingfixtures.generate_fixtures(
+            num_assets=num_assets, num_shots=num_shots, latency=latency, **kwargs)
+        cls.set_fixtures(fixtures)
+
+        return fixtures
+
+    @property
+    def fixtures(self):
+        if self.__class__._fixtures is None:
+            self.__class__._fixtures = trackingfixtures.TrackingFixtures()
+
+        return self.__class__._fixtures
+
+    def get_name(self):
+        return self.fixtures.replay('get_name', default='Replay Tracker')
+
+    def needs_login(self):
+        return self.fixtures.replay('needs_login', default=False)
+
+    def update_tracking_info(self):
+        self.__class__._updated = True
+
+    def is_tracking_available(self):
+        return True
+
+    def login(self, *args, **kwargs):
+        self.__class__._logged = True
+        self.logged.emit()
+        return True
+
+    def logout(self, *args, **kwargs):
+        self.__class__._logged = False
+        self.unlogged.emit()
+        return True
+
+    def get_user_name(self):
+        return self.fixtures.replay('get_user_name', default=None)
+
+    def download_preview_file_thumbnail(self, preview_id, file_path):
+        """
+        Copies thumbnail recorded for the given preview into the given location
+        :param preview_id: str
+        :param file_path: str
+        :return: bool
+        """
+
+        thumbnail_path = self.fixtures.get_thumbnail_path(preview_id)
+        if not thumbnail_path or not os.path.isfile(thumbnail_path):
+            LOGGER.debug('No thumbnail recorded for preview "{}"'.format(preview_id))
+            return False
+
+        file_folder = os.path.dirname(file_path)
+        if file_folder and not os.path.isdir(file_folder):
+            os.makedirs(file_folder)
+        shutil.copyfile(thumbnail_path, file_path)
+
+        return True
+
+    def get_project_name(self):
+        return self.fixtures.replay('get_project_name', default=None)
+
+    def get_project_fps(self):
+        return self.fixtures.replay('get_project_fps', default=None)
+
+    def get_project_resolution(self):
+        return self.fixtures.replay('get_project_resolution', default=None)
+
+    def all_project_assets(self):
+        return self.fixtures.replay('all_project_assets', default=list())
+
+    def all_project_sequences(self):
+        return self.fixtures.replay('all_project_sequences', default=list())
+
+    def all_project_shots(self):
+        return self.fixtures.replay('all_project_shots', default=list())
+
+    def all_assets_in_shot(self, shot):
+        return self.fixtures.replay('all_assets_in_shot', shot, default=list())
+
+    def get_occurrences_of_asset_in_shot(self, shot_id, asset_name, force_update=False):
+        name_attr = artellapipe.AssetsMgr().config_snapshot.get(
+            'data.name_attribute') or trackingfixtures.DEFAULT_ATTRIBUTES['name']
+        occurrences = self.fixtures.get_occurrences(shot_id, asset_name, name_attribute=name_attr)
+
+        return occurrences or 0
+
+    def get_shots_breakdown(self, force_update=False):
+        if not self.fixtures.has_payload('get_shots_breakdown'):
+            return super(ReplayTrackingManager, self).get_shots_breakdown(force_update=force_update)
+
+        return self.fixtures.replay('get_shots_breakdown')
+
+    def get_task_by_id(self, task_id):
+        return self.fixtures.replay('get_task_by_id', task_id, default=None)
+
+    def get_tasks_in_shot(self, shot_id):
+        return self.fixtures.replay('get_tasks_in_shot', shot_id, default=list())
+
+    def upload_shot_task_preview(self, task_id, preview_file_path, comment='', status=None):
+        LOGGER.info('Replay tracker does not upload previews: "{}"'.format(preview_file_path))
+        return False
+
+    def all_task_types(self):
+        return self.fixtures.replay('all_task_types', default=list())
+
+    def all_task_statuses(self):
+        return self.fixtures.replay('all_task_statuses', default=list())
+
+    def all_task_types_for_assets(self):
+        return self.fixtures.replay('all_task_types_for_assets', default=list())
+
+    def all_task_types_for_shots(self):
+        return self.fixtures.replay('all_task_types_for_shots', default=list())
+
+    def get_task_status(self, task_id):
+        return self.fixtures.replay('get_task_status', task_id, default=None)
@@ -20,7 +20,7 @@ import importlib
 from collections import OrderedDict
 
 import tpDcc
-from tpDcc.libs.python import decorators, python, path as path_utils
+from tpDcc.libs.python import python, path as path_utils
 
 if python.is_python2():
     import pkgutil as loader
@@ -28,7 +28,7 @@ else:
     import importlib as loader
 
 import artellapipe
-from artellapipe.utils import exceptions
+from artellapipe.utils import exceptions, snapshot, metrics
 from artellapipe.libs.artella.core import artellalib, artellaclasses
 
 LOGGER = logging.getLogger('artellapipe')
@@ -51,6 +51,10 @@ class SequencesManager(object):
 
         return self.__class__._config
 
+    @property
+    def config_snapshot(self):
+        return snapshot.get_config_snapshot(self.config)
+
     @property
     def sequence_classes(self):
         if not self.__class__._registered_sequence_classes:
@@ -60,7 +64,7 @@ class SequencesManager(object):
 
     @property
     def sequence_types(self):
-        return self.config.get('types', default=dict()).keys()
+        return self.config_snapshot.get('types', default=dict()).keys()
 
     @property
     def sequences(self):
@@ -81,7 +85,7 @@ class SequencesManager(object):
 
         return True
 
-    @decorators.timestamp
+    @metrics.timed('sequences.find_all_sequences')
     def find_all_sequences(self, force_update=False, force_login=True):
         """
         Returns a list of all sequences in the current project
@@ -250,7 +254,7 @@ class SequencesManager(object):
         :return: str
         """
 
-        return self.config.get('default_name', default='New Sequence')
+        return self.config_snapshot.get('default_name', default='New Sequence')
 
     def get_default_sequence_thumb(self):
         """
@@ -258,7 +262,7 @@ class SequencesManager(object):
         :return: str
         """
 
-        return self.config.get('default_thumb', default='default')
+        return self.config_snapshot.get('default_thumb', default='default')
 
     def _check_project(self):
         """
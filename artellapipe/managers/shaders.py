@@ -19,6 +19,7 @@ import tpDcc as tp
 from tpDcc.libs.python import decorators, python, path as path_utils
 
 import artellapipe
+from artellapipe.utils import snapshot, orderedset
 from artellapipe.core import defines
 
 if tp.is_maya():
@@ -47,13 +48,17 @@ class ShadersManager(object):
 
         return self.__class__._config
 
+    @property
+    def config_snapshot(self):
+        return snapshot.get_config_snapshot(self.config)
+
     def get_shaders_path_file_type(self):
         """
         Returns file type used to define shaders
         :return: str
         """
 
-        return self.config.get('path_file_type', default='shaders')
+        return self.config_snapshot.get('path_file_type', default='shaders')
 
     def get_shaders_asset_file_type(self):
         """
@@ -61,7 +66,7 @@ class ShadersManager(object):
         :return: str
         """
 
-        return self.config.get('file_type', default='shader')
+        return self.config_snapshot.get('file_type', default='shader')
 
     def get_shaders_extensions(self):
         """
@@ -118,7 +123,7 @@ class ShadersManager(object):
         :return: str
         """
 
-        shaders_paths = self.config.get('paths')
+        shaders_paths = self.config_snapshot.get('paths')
         return [path_utils.clean_path(
             os.path.join(artellapipe.AssetsMgr().get_assets_path(), p)) for p in shaders_paths]
 
@@ -374,9 +379,8 @@ class ShadersManager(object):
 
         shader_names = shaders_mapping_file.get_shaders(force=True, status=defines.ArtellaFileStatus.PUBLISHED)
         working_shader_names = shaders_mapping_file.get_shaders(force=True, status=defines.ArtellaFileStatus.WORKING)
-        for working_shader_name in working_shader_names:
-            if working_shader_name not in shader_names:
-                shader_names.append(working_shader_name)
+        shader_names = orderedset.OrderedSet(shader_names or list())
+        shader_names.update(working_shader_names or list())
         if not shader_names:
             LOGGER.warning('No shaders to unload found!')
             return False
@@ -485,7 +489,7 @@ class ShadersManager(object):
             return
 
         asset_shaders = dict()
-        only_shaders = list()
+        only_shaders = orderedset.OrderedSet()
 
         renderable_shapes = artellapipe.AssetsMgr().get_asset_renderable_shapes(asset, full_path=False)
         if not renderable_shapes:
@@ -507,9 +511,7 @@ class ShadersManager(object):
                         if mat in default_scene_shaders:
                             continue
 
-                for mat in shading_grp_mat:
-                    if mat not in only_shaders:
-                        only_shaders.append(mat)
+                only_shaders.update(shading_grp_mat)
                 asset_shaders[shape][shading_grp] = shading_grp_mat
 
         if not asset_shaders:
@@ -517,7 +519,7 @@ class ShadersManager(object):
             return None
 
         if return_only_shaders:
-            return only_shaders
+            return only_shaders.to_list()
 
         return asset_shaders
 
@@ -572,14 +574,8 @@ class ShadersManager(object):
         shaders_mapping_file = shaders_mapping_file_class(asset, file_path=file_path)
         shaders_mapping_file.export_file()
 
-        if new_version:
-            if os.path.isfile(file_path):
-                artellapipe.FilesMgr().lock_file(file_path)
-                valid_upload = artellapipe.FilesMgr().upload_working_version(
-                    file_path=file_path, skip_saving=True, comment=comment
-                )
-                if valid_upload:
-                    artellapipe.FilesMgr().unlock_file(file_path, warn_user=False)
+        if new_version and os.path.isfile(file_path):
+            artellapipe.FilesMgr().upload_working_versions([file_path], skip_saving=True, comment=comment)
 
     def export_asset_shaders(
             self, asset, comment=None, new_version=False, shader_swatch=None, shaders_to_export=None):
@@ -667,14 +663,9 @@ class ShadersManager(object):
             return None
 
         if new_version:
-            for file_path in exported_shader:
-                if os.path.isfile(file_path):
-                    artellapipe.FilesMgr().lock_file(file_path)
-                    valid_upload = artellapipe.FilesMgr().upload_working_version(
-                        file_path=file_path, skip_saving=True, comment=comment
-                    )
-                    if valid_upload:
-                        artellapipe.FilesMgr().unlock_file(file_path, warn_user=False)
+            artellapipe.FilesMgr().upload_working_versions(
+                [file_path for file_path in exported_shader if os.path.isfile(file_path)], skip_saving=True,
+                comment=comment)
 
         return exported_shader
 
@@ -697,10 +688,16 @@ class ShadersManager(object):
         if not shaders_names:
             return exported_shaders
 
+        # New versions of all exported shaders files are uploaded at once with a single comment
         for shader_name in shaders_names:
             exported_shader = self.export_shader(
                 shader_name=shader_name, export_path=export_path, comment=comment,
-                new_version=new_version, asset=asset, shader_swatch=shader_swatch)
+                new_version=False, asset=asset, shader_swatch=shader_swatch)
             exported_shaders.append(exported_shader)
 
+        if new_version:
+            shader_files = [file_path for exported_shader in exported_shaders if exported_shader
+                            for file_path in exported_shader if os.path.isfile(file_path)]
+            artellapipe.FilesMgr().upload_working_versions(shader_files, skip_saving=True, comment=comment)
+
         return exported_shaders
@@ -20,7 +20,7 @@ import importlib
 from collections import OrderedDict
 
 import tpDcc
-from tpDcc.libs.python import decorators, python, path as path_utils
+from tpDcc.libs.python import python, path as path_utils
 
 if python.is_python2():
     import pkgutil as loader
@@ -28,7 +28,8 @@ else:
     import importlib as loader
 
 import artellapipe
-from artellapipe.utils import exceptions
+from artellapipe.core import timing, shotindex
+from artellapipe.utils import exceptions, snapshot, metrics
 from artellapipe.libs.artella.core import artellalib, artellaclasses
 
 LOGGER = logging.getLogger('artellapipe')
@@ -39,6 +40,7 @@ class ShotsManager(object):
     _config = None
     _shots = list()
     _registered_shot_classes = list()
+    _shot_index = None
 
     @property
     def config(self):
@@ -51,6 +53,10 @@ class ShotsManager(object):
 
         return self.__class__._config
 
+    @property
+    def config_snapshot(self):
+        return snapshot.get_config_snapshot(self.config)
+
     @property
     def shot_classes(self):
         if not self.__class__._registered_shot_classes:
@@ -60,7 +66,7 @@ class ShotsManager(object):
 
     @property
     def shot_types(self):
-        return self.config.get('types', default=dict()).keys()
+        return self.config_snapshot.get('types', default=dict()).keys()
 
     @property
     def shots(self):
@@ -81,7 +87,7 @@ class ShotsManager(object):
 
         return True
 
-    @decorators.timestamp
+    @metrics.timed('shots.find_all_shots')
     def find_all_shots(self, force_update=False, force_login=True):
         """
         Returns all shots of the project
@@ -96,6 +102,7 @@ class ShotsManager(object):
             return self.shots
 
         python.clear_list(self.__class__._shots)
+        self.invalidate_shot_index()
 
         if not artellapipe.Tracker().is_logged() and force_login:
             artellapipe.Tracker().login()
@@ -109,14 +116,52 @@ class ShotsManager(object):
             LOGGER.warning('No shots found in current project!')
             return None
 
-        for shot_data in shots_list:
-            new_shot = self.create_shot(shot_data)
-            self.__class__._shots.append(new_shot)
+        new_shots = [self.create_shot(shot_data) for shot_data in shots_list]
 
-        self.__class__._shots.sort(key=lambda x: x.get_start_frame(), reverse=True)
+        # Shots attributes are read only once, when the index is built
+        self.__class__._shot_index = shotindex.ShotIndex.from_shots(new_shots)
+        self.__class__._shots.extend(self.__class__._shot_index.get_shots(reverse=True))
 
         return self.shots
 
+    def get_shot_index(self, force_update=False, force_login=True):
+        """
+        Returns index of all the shots of the project. Index allows to query shots by name, sequence or frame range
+        :param force_update: bool, Whether shots cache updated must be forced or not
+        :param force_login: bool, Whether logging to production tracker is forced or not
+        :return: ShotIndex
+        """
+
+        all_shots = self.find_all_shots(force_update=force_update, force_login=force_login)
+        if self.__class__._shot_index is None:
+            self.__class__._shot_index = shotindex.ShotIndex.from_shots(all_shots or list())
+            python.clear_list(self.__class__._shots)
+            self.__class__._shots.extend(self.__class__._shot_index.get_shots(reverse=True))
+
+        return self.__class__._shot_index
+
+    def invalidate_shot_index(self):
+        """
+        Removes cached shot index, so it is built again next time it is requested. Must be called each time the
+        frame range of a shot is modified
+        """
+
+        self.__class__._shot_index = None
+
+    def get_shots_in_range(self, start_frame, end_frame, force_update=False, force_login=True):
+        """
+        Returns all shots whose frame range overlaps the given one
+        :param start_frame: int
+        :param end_frame: int
+        :param force_update: bool, Whether shots cache updated must be forced or not
+        :param force_login: bool, Whether logging to production tracker is forced or not
+        :return: list(ArtellaShot)
+        """
+
+        shot_index = self.get_shot_index(force_update=force_update, force_login=force_login)
+
+        return shot_index.get_shots_in_range(start_frame, end_frame)
+
     def find_all_shots_in_current_scene(self, force_update=False, force_login=True):
         """
         Returns all nodes that are in current scene
@@ -141,6 +186,34 @@ class ShotsManager(object):
 
         return non_muted_shots
 
+    def get_timing_table(self, force_login=True):
+        """
+        Returns table with the timing data of all the non muted shots of the current scene. Table is built in a single
+        pass and it is not cached, so it must be built once per operation and passed to the functions that need it
+        :param force_login: bool, Whether logging to production tracker is forced or not
+        :return: ShotTimingTable
+        """
+
+        non_muted_shots = self.find_non_muted_shots(force_login=force_login) or list()
+
+        return timing.ShotTimingTable.from_shots(non_muted_shots)
+
+    def get_data_many(self, shots, sequence_ranges, timing_table=None):
+        """
+        Returns data of all the given shots. Same as calling ArtellaShot.get_data in each shot but shots attributes
+        are read in a single pass and ranges are computed at once
+        :param shots: list(ArtellaShot)
+        :param sequence_ranges: list(list(int, int)), start and end frame of each shot in sequencer timeline
+        :param timing_table: ShotTimingTable, table to read timing data from. If not given, a new one is built
+        :return: list(dict)
+        """
+
+        shots = list(shots)
+        if timing_table is None:
+            timing_table = timing.ShotTimingTable.from_shots(shots)
+
+        return timing.get_shots_data(shots, sequence_ranges, timing_table=timing_table)
+
     def find_shot(self, shot_name=None, force_update=False, force_login=True):
         """
         Returns shot of the project if found
@@ -152,12 +225,8 @@ class ShotsManager(object):
 
         self._check_project()
 
-        shots_found = list()
-        all_shots = self.find_all_shots(force_update=force_update, force_login=force_login) or list()
-        for shot in all_shots:
-            if shot.get_name() == shot_name:
-                shots_found.append(shot)
-
+        shot_index = self.get_shot_index(force_update=force_update, force_login=force_login)
+        shots_found = shot_index.get_shots_by_name(shot_name)
         if not shots_found:
             return None
 
@@ -212,13 +281,9 @@ class ShotsManager(object):
         :return:
         """
 
-        sequence_shots = list()
-        all_shots = self.find_all_shots(force_update=force_update, force_login=force_login)
-        for shot in all_shots:
-            if shot.get_sequence() == sequence_name:
-                sequence_shots.append(shot)
+        shot_index = self.get_shot_index(force_update=force_update, force_login=force_login)
 
-        return sequence_shots
+        return shot_index.get_sequence_shots(sequence_name, reverse=True)
 
     def is_valid_shot_type(self, shot_type):
         """
@@ -308,7 +373,7 @@ class ShotsManager(object):
         :return: str
         """
 
-        return self.config.get('default_name', default='New Shot')
+        return self.config_snapshot.get('default_name', default='New Shot')
 
     def get_default_shot_thumb(self):
         """
@@ -316,7 +381,7 @@ class ShotsManager(object):
         :return: str
         """
 
-        return self.config.get('default_thumb', default='default')
+        return self.config_snapshot.get('default_thumb', default='default')
 
     def export_shot(self, shot_name, start_frame=101, new_version=False, comment=None):
         """
@@ -328,7 +393,7 @@ class ShotsManager(object):
         :return:
         """
 
-        shot_layout_file_type = self.config.get('shot_layout_file_type', default='shot_layout')
+        shot_layout_file_type = self.config_snapshot.get('shot_layout_file_type', default='shot_layout')
         shot = self.find_shot(shot_name)
         file_type = shot.get_file_type(shot_layout_file_type)
         if not file_type:
@@ -350,9 +415,8 @@ class ShotsManager(object):
         if not comment:
             comment = 'Shot "{}" exported!'.format(shot_name)
         if new_version:
-            artellapipe.FilesMgr().lock_file(file_path=shot_file_path, notify=False)
-            valid_version = artellapipe.FilesMgr().upload_working_version(
-                file_path=shot_file_path, skip_saving=True, notify=True, comment=comment)
+            valid_version = artellapipe.FilesMgr().upload_working_versions(
+                [shot_file_path], skip_saving=True, notify=True, comment=comment)
             if not valid_version:
                 LOGGER.warning('Was not possible to upload new version of shot file: {}'.format(shot_file_path))
 
@@ -15,6 +15,7 @@ __email__ = "tpovedatd@gmail.com"
 import tpDcc as tp
 
 import artellapipe
+from artellapipe.utils import snapshot
 
 
 class TagsManager(object):
@@ -33,6 +34,10 @@ class TagsManager(object):
 
         return self.__class__._config
 
+    @property
+    def config_snapshot(self):
+        return snapshot.get_config_snapshot(self.config)
+
     # Basic definitions for tag attributes
     class TagDefinitions(object):
         SCENE_SELECTION_NAME = 'scene'
@@ -49,7 +54,7 @@ class TagsManager(object):
         :return: list(str)
         """
 
-        tag_types = self.config.get('types') or list()
+        tag_types = self.config_snapshot.get('types', default=list())
         return tag_types
 
     def get_tag_node(self, project, node):
@@ -15,13 +15,14 @@ __email__ = "tpovedatd@gmail.com"
 import tpDcc
 
 import artellapipe
+from artellapipe.utils import plugin
 
 
 class ToolsManager(object):
 
     def run_tool(self, tool_id, do_reload=False, debug=False, project=None, *args, **kwargs):
         """
-        Launches artellapipe tool
+        Launches artellapipe tool. Launch time of the tool is stored in tools statistics database
         :param tool_id: str
         :param do_reload: bool
         :param debug: bool
@@ -31,5 +32,6 @@ class ToolsManager(object):
         if not project:
             project = artellapipe.project
 
-        return tpDcc.ToolsMgr().launch_tool_by_id(
-            tool_id, do_reload=do_reload, debug=debug, project=project, *args, **kwargs)
+        with plugin.PluginStats(plugin_id=tool_id):
+            return tpDcc.ToolsMgr().launch_tool_by_id(
+                tool_id, do_reload=do_reload, debug=debug, project=project, *args, **kwargs)
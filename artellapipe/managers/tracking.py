@@ -191,6 +191,28 @@ class TrackingManager(QObject, object):
         raise NotImplementedError(
             'all_assets_in_shot function for {} is not implemented!'.format(self.__class__.__name__))
 
+    def get_occurrences_of_asset_in_shot(self, shot_id, asset_name, force_update=False):
+        """
+        Returns the number of occurrences of the given asset in the given shot
+        :param shot_id: str
+        :param asset_name: str
+        :param force_update: bool
+        :return: int
+        """
+
+        raise NotImplementedError(
+            'get_occurrences_of_asset_in_shot function for {} is not implemented!'.format(self.__class__.__name__))
+
+    def get_shots_breakdown(self, force_update=False):
+        """
+        Returns the casting of all the shots of the current project in a single request
+        :param force_update: bool
+        :return: list(tuple(str, str, int)), list of (shot ID, asset name, occurrences) tuples
+        """
+
+        raise NotImplementedError(
+            'get_shots_breakdown function for {} is not implemented!'.format(self.__class__.__name__))
+
     def get_task_by_id(self, task_id):
         """
         Returns task with the given ID
@@ -0,0 +1,56 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains utilities to execute blocking queries concurrently
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+# Maximum number of threads used by default to execute concurrent queries
+MAX_WORKERS = 8
+
+
+def map_concurrent(fn, items, max_workers=None):
+    """
+    Calls given function with each one of the given items using a bounded pool of threads. Only useful for functions
+    that block on I/O (disk access or Artella client requests)
+    :param fn: fn, function that receives a single item
+    :param items: list, items to process
+    :param max_workers: int, maximum number of threads used. If not given, MAX_WORKERS is used
+    :return: list, results of the function in the same order as the given items
+    """
+
+    items = list(items)
+    num_workers = min(max_workers or MAX_WORKERS, len(items))
+    if num_workers <= 1:
+        return [fn(item) for item in items]
+
+    pool = ThreadPool(processes=num_workers)
+    try:
+        return pool.map(fn, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def map_concurrent_dict(fn, keys, max_workers=None):
+    """
+    Calls given function with each one of the given keys concurrently and returns a dictionary with the results
+    :param fn: fn, function that receives a single key
+    :param keys: list, keys to process
+    :param max_workers: int, maximum number of threads used. If not given, MAX_WORKERS is used
+    :return: OrderedDict, dictionary that maps each key with its result, keeping the order of the given keys
+    """
+
+    keys = list(keys)
+
+    return OrderedDict(zip(keys, map_concurrent(fn, keys, max_workers=max_workers)))
@@ -0,0 +1,591 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains an in-process stand-in of Artella Drive client that can be used in tests and benchmarks
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import re
+import time
+import shutil
+import logging
+import tempfile
+import datetime
+import threading
+import contextlib
+from collections import Counter, namedtuple
+
+LOGGER = logging.getLogger('artellapipe')
+
+# artellalib functions replaced by FakeArtellaDrive.patch
+PATCHED_FUNCTIONS = (
+    'get_status', 'get_file_history', 'get_current_version', 'lock_file', 'unlock_file', 'is_locked',
+    'upload_new_asset_version', 'synchronize_file', 'synchronize_path_with_folders', 'get_synchronization_progress',
+    'new_folder'
+)
+
+FakeVersionData = namedtuple('FakeVersionData', ['version', 'comment', 'author', 'date', 'size'])
+
+
+class FakeReferenceData(object):
+    """
+    Class that stores the Artella status of a file, with the same attributes used from Artella references metadata
+    """
+
+    def __init__(self, name, path, maximum_version, view_version, locked, locked_view, is_locked_by_me, size):
+        self.name = name
+        self.path = path
+        self.maximum_version = maximum_version
+        self.view_version = view_version
+        self.locked = locked
+        self.locked_view = locked_view
+        self.is_locked_by_me = is_locked_by_me
+        self.size = size
+        self.deleted = False
+        self.maximum_version_deleted = False
+
+    def __repr__(self):
+        return 'FakeReferenceData({}, max_version={}, local_version={}, locked={})'.format(
+            self.name, self.maximum_version, self.view_version, self.locked)
+
+
+class FakeStatus(object):
+    """
+    Class that stores the Artella status of a path
+    """
+
+    def __init__(self, path, references):
+        self.path = path
+        self.references = references
+
+
+class FakeHistory(object):
+    """
+    Class that stores the Artella history of a file
+    """
+
+    def __init__(self, path, versions):
+        self.path = path
+        self.versions = versions
+
+
+class FakeArtellaDrive(object):
+    """
+    Class that simulates an Artella Drive client working over a temporary directory tree. Server files are stored in
+    version folders (server/<path>/__<version>__/<file name>) and local files in local/<path>. Each call waits the
+    configured latency, so caching, batching and parallel synchronization can be measured without Artella server
+    """
+
+    def __init__(self, root_path=None, latency=0.0, user='fake_user', sync_bytes_per_second=None):
+        """
+        :param root_path: str, folder where server and local files are stored. If not given, a temp folder is used
+        :param latency: float or dict(str, float), seconds each call waits (optionally different per function)
+        :param user: str, name of the user that locks and uploads files
+        :param sync_bytes_per_second: int, simulated download speed. If not given, synchronization is immediate
+        """
+
+        self._root_path = root_path or tempfile.mkdtemp(prefix='artella_drive_')
+        self._server_path = os.path.join(self._root_path, 'server')
+        self._local_path = os.path.join(self._root_path, 'local')
+        self._latency = latency or 0.0
+        self._user = user
+        self._sync_bytes_per_second = sync_bytes_per_second
+        self._locks = dict()
+        self._comments = dict()
+        self._progress = [100, 0, 0, 0, 0]
+        self._calls = Counter()
+        self._lock = threading.RLock()
+
+        for folder in (self._server_path, self._local_path):
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+
+    @property
+    def root_path(self):
+        return self._root_path
+
+    @property
+    def local_path(self):
+        """
+        Returns local root folder (the folder that Artella local root variable points to)
+        :return: str
+        """
+
+        return self._local_path
+
+    @property
+    def calls(self):
+        """
+        Returns number of calls done to each function
+        :return: Counter
+        """
+
+        return Counter(self._calls)
+
+    @property
+    def latency(self):
+        return self._latency
+
+    @latency.setter
+    def latency(self, value):
+        self._latency = value or 0.0
+
+    # ==========================================================================================================
+    # SERVER
+    # ==========================================================================================================
+
+    def add_file(self, file_path, versions=1, contents=None, comment='', author=None, sync=False):
+        """
+        Adds a new file to the server with the given number of versions
+        :param file_path: str, local path or path relative to local root
+        :param versions: int
+        :param contents: str or bytes, contents of each version. If not given, a small text is used
+        :param comment: str
+        :param author: str
+        :param sync: bool, Whether to synchronize latest version into local folder
+        :return: str, local path of the file
+        """
+
+        local_path = self._get_local_path(file_path)
+        for _ in range(versions):
+            version_contents = contents if contents is not None else '{} | version {}\n'.format(
+                local_path, self._get_max_version(local_path) + 1)
+            self._add_version(local_path, version_contents, comment=comment, author=author)
+        if sync:
+            self._sync(local_path)
+
+        return local_path
+
+    def clear(self):
+        """
+        Removes all the server and local files
+        """
+
+        with self._lock:
+            for folder in (self._server_path, self._local_path):
+                shutil.rmtree(folder, ignore_errors=True)
+                os.makedirs(folder)
+            self._locks.clear()
+            self._comments.clear()
+            self._calls.clear()
+            self._progress = [100, 0, 0, 0, 0]
+
+    def reset_calls(self):
+        """
+        Resets calls counter
+        """
+
+        with self._lock:
+            self._calls.clear()
+
+    # ==========================================================================================================
+    # ARTELLALIB
+    # ==========================================================================================================
+
+    def get_status(self, file_path, as_json=False, **kwargs):
+        """
+        Returns Artella status of the given file or folder
+        :param file_path: str
+        :param as_json: bool
+        :return: FakeStatus or dict
+        """
+
+        self._call('get_status')
+
+        local_path = self._get_local_path(file_path)
+        server_path = self._get_server_path(local_path)
+        if self._is_server_file(local_path):
+            file_paths = [local_path]
+        elif os.path.isdir(server_path):
+            file_paths = [os.path.join(local_path, name) for name in sorted(os.listdir(server_path))
+                          if not self._is_version_folder(name)]
+        else:
+            return dict() if as_json else None
+
+        references = dict()
+        for child_path in file_paths:
+            references[os.path.basename(child_path)] = self._get_reference_data(child_path)
+
+        if as_json:
+            return {'data': dict((name, ref.__dict__.copy()) for name, ref in references.items())}
+
+        return FakeStatus(local_path, references)
+
+    def get_file_history(self, file_path, **kwargs):
+        """
+        Returns Artella history of the given file
+        :param file_path: str
+        :return: FakeHistory
+        """
+
+        self._call('get_file_history')
+
+        local_path = self._get_local_path(file_path)
+        versions = list()
+        for version in self._get_versions(local_path):
+            version_file = self._get_version_file(local_path, version)
+            comment, author = self._comments.get((local_path, version), ('', self._user))
+            versions.append((version, FakeVersionData(
+                version, comment, author, datetime.datetime.fromtimestamp(os.path.getmtime(version_file)),
+                os.path.getsize(version_file))))
+
+        return FakeHistory(local_path, versions)
+
+    def get_current_version(self, file_path, **kwargs):
+        """
+        Returns latest server version of the given file
+        :param file_path: str
+        :return: int, -1 if file does not exist in server
+        """
+
+        self._call('get_current_version')
+
+        max_version = self._get_max_version(self._get_local_path(file_path))
+
+        return max_version if max_version else -1
+
+    def lock_file(self, file_path=None, force=False, **kwargs):
+        """
+        Locks given file
+        :param file_path: str
+        :param force: bool, Whether to lock files locked by other users
+        :return: bool
+        """
+
+        self._call('lock_file')
+
+        local_path = self._get_local_path(file_path)
+        with self._lock:
+            lock_owner = self._locks.get(local_path, None)
+            if lock_owner and lock_owner != self._user and not force:
+                return False
+            self._locks[local_path] = self._user
+
+        return True
+
+    def unlock_file(self, file_path=None, **kwargs):
+        """
+        Unlocks given file
+        :param file_path: str
+        :return: bool
+        """
+
+        self._call('unlock_file')
+
+        with self._lock:
+            return self._locks.pop(self._get_local_path(file_path), None) is not None
+
+    def is_locked(self, file_path=None, **kwargs):
+        """
+        Returns whether given file is locked and whether it is locked by current user
+        :param file_path: str
+        :return: tuple(bool, bool)
+        """
+
+        self._call('is_locked')
+
+        lock_owner = self._locks.get(self._get_local_path(file_path), None)
+
+        return bool(lock_owner), lock_owner == self._user
+
+    def lock_file_by(self, file_path, user):
+        """
+        Locks given file by another user
+        :param file_path: str
+        :param user: str
+        """
+
+        with self._lock:
+            self._locks[self._get_local_path(file_path)] = user
+
+    def upload_new_asset_version(self, file_path=None, comment='Published new version with Artella Pipeline',
+                                 skip_saving=False, **kwargs):
+        """
+        Uploads local file as a new version
+        :param file_path: str
+        :param comment: str
+        :param skip_saving: bool
+        :return: bool
+        """
+
+        self._call('upload_new_asset_version')
+
+        local_path = self._get_local_path(file_path)
+        if not os.path.isfile(local_path):
+            LOGGER.warning('Impossible to upload "{}" because file does not exist!'.format(local_path))
+            return False
+
+        lock_owner = self._locks.get(local_path, None)
+        if lock_owner and lock_owner != self._user:
+            LOGGER.warning('Impossible to upload "{}" because file is locked by "{}"'.format(local_path, lock_owner))
+            return False
+
+        with open(local_path, 'rb') as fh:
+            self._add_version(local_path, fh.read(), comment=comment, author=self._user)
+
+        return True
+
+    def synchronize_file(self, file_path, **kwargs):
+        """
+        Synchronizes latest version of the given file into local folder
+        :param file_path: str
+        :return: bool
+        """
+
+        self._call('synchronize_file')
+
+        return self._sync_paths([self._get_local_path(file_path)])
+
+    def synchronize_path_with_folders(self, file_path, recursive=False, **kwargs):
+        """
+        Synchronizes all the files in the given folder
+        :param file_path: str
+        :param recursive: bool
+        :return: bool
+        """
+
+        self._call('synchronize_path_with_folders')
+
+        local_path = self._get_local_path(file_path)
+        if self._is_server_file(local_path):
+            return self._sync_paths([local_path])
+
+        server_path = self._get_server_path(local_path)
+        if not os.path.isdir(server_path):
+            return False
+
+        file_paths = self._get_server_files(server_path, recursive=recursive)
+
+        return self._sync_paths(file_paths)
+
+    def get_synchronization_progress(self, **kwargs):
+        """
+        Returns progress of the last synchronization
+        :return: tuple(int, int, int, int, int), progress, downloaded files, total files, downloaded bytes and
+            total bytes
+        """
+
+        self._call('get_synchronization_progress')
+
+        return tuple(self._progress)
+
+    def new_folder(self, root_path, folder_name, **kwargs):
+        """
+        Creates a new folder in server and in local folder
+        :param root_path: str
+        :param folder_name: str
+        :return: bool
+        """
+
+        self._call('new_folder')
+
+        local_path = os.path.join(self._get_local_path(root_path), folder_name)
+        for folder in (local_path, self._get_server_path(local_path)):
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+
+        return True
+
+    @staticmethod
+    def split_version(name, next_version=False):
+        """
+        Splits version from the given name, using the same convention as artellalib (name_v001)
+        :param name: str
+        :param next_version: bool
+        :return: tuple(str, int)
+        """
+
+        found = re.search(r'v(\d+)', name)
+        if not found:
+            return None, None
+        version = int(found.group(1))
+        if next_version:
+            version += 1
+
+        return 'v{}'.format(str(version).zfill(len(found.group(1)))), version
+
+    @contextlib.contextmanager
+    def patch(self, module=None):
+        """
+        Context manager that replaces artellalib functions with the ones of this drive
+        :param module: module, module to patch. If not given, artellalib is used
+        """
+
+        if module is None:
+            from artellapipe.libs.artella.core import artellalib as module
+
+        original_functions = dict()
+        for function_name in PATCHED_FUNCTIONS:
+            if hasattr(module, function_name):
+                original_functions[function_name] = getattr(module, function_name)
+            setattr(module, function_name, getattr(self, function_name))
+        try:
+            yield self
+        finally:
+            for function_name in PATCHED_FUNCTIONS:
+                if function_name in original_functions:
+                    setattr(module, function_name, original_functions[function_name])
+                else:
+                    delattr(module, function_name)
+
+    # ==========================================================================================================
+    # INTERNAL
+    # ==========================================================================================================
+
+    def _call(self, function_name):
+        """
+        Internal function that registers a call and waits the latency of the function
+        :param function_name: str
+        """
+
+        with self._lock:
+            self._calls[function_name] += 1
+
+        latency = self._latency.get(function_name, 0.0) if isinstance(self._latency, dict) else self._latency
+        if latency:
+            time.sleep(latency)
+
+    def _get_local_path(self, file_path):
+        file_path = os.path.normpath(file_path)
+        if not os.path.isabs(file_path):
+            file_path = os.path.join(self._local_path, file_path)
+
+        return file_path
+
+    def _get_server_path(self, local_path):
+        return os.path.join(self._server_path, os.path.relpath(local_path, self._local_path))
+
+    def _get_version_file(self, local_path, version):
+        return os.path.join(
+            self._get_server_path(local_path), '__{}__'.format(version), os.path.basename(local_path))
+
+    def _get_versions(self, local_path):
+        server_path = self._get_server_path(local_path)
+        if not os.path.isdir(server_path):
+            return list()
+
+        return sorted(int(name[2:-2]) for name in os.listdir(server_path) if self._is_version_folder(name))
+
+    def _get_max_version(self, local_path):
+        versions = self._get_versions(local_path)
+        return versions[-1] if versions else 0
+
+    def _is_server_file(self, local_path):
+        return bool(self._get_versions(local_path))
+
+    @staticmethod
+    def _is_version_folder(name):
+        return name.startswith('__') and name.endswith('__') and name[2:-2].isdigit()
+
+    def _get_server_files(self, server_path, recursive=False):
+        """
+        Internal function that returns local paths of the server files located in the given server folder
+        :param server_path: str
+        :param recursive: bool
+        :return: list(str)
+        """
+
+        file_paths = list()
+        for name in sorted(os.listdir(server_path)):
+            child_path = os.path.join(server_path, name)
+            if self._is_version_folder(name) or not os.path.isdir(child_path):
+                continue
+            local_path = os.path.join(self._local_path, os.path.relpath(child_path, self._server_path))
+            if self._is_server_file(local_path):
+                file_paths.append(local_path)
+            elif recursive:
+                file_paths.extend(self._get_server_files(child_path, recursive=recursive))
+
+        return file_paths
+
+    def _get_local_version(self, local_path):
+        """
+        Internal function that returns the server version that is synchronized in local folder
+        :param local_path: str
+        :return: int, 0 if file is not synchronized
+        """
+
+        if not os.path.isfile(local_path):
+            return 0
+
+        local_size = os.path.getsize(local_path)
+        with open(local_path, 'rb') as fh:
+            local_contents = fh.read()
+        for version in reversed(self._get_versions(local_path)):
+            version_file = self._get_version_file(local_path, version)
+            if os.path.getsize(version_file) != local_size:
+                continue
+            with open(version_file, 'rb') as fh:
+                if fh.read() == local_contents:
+                    return version
+
+        return 0
+
+    def _get_reference_data(self, local_path):
+        max_version = self._get_max_version(local_path)
+        lock_owner = self._locks.get(local_path, None)
+        size = os.path.getsize(self._get_version_file(local_path, max_version)) if max_version else 0
+
+        return FakeReferenceData(
+            name=os.path.basename(local_path), path=local_path, maximum_version=max_version,
+            view_version=self._get_local_version(local_path), locked=bool(lock_owner), locked_view=lock_owner,
+            is_locked_by_me=lock_owner == self._user, size=size)
+
+    def _add_version(self, local_path, contents, comment='', author=None):
+        """
+        Internal function that stores a new server version of the given file
+        :param local_path: str
+        :param contents: str or bytes
+        :param comment: str
+        :param author: str
+        :return: int, new version
+        """
+
+        with self._lock:
+            version = self._get_max_version(local_path) + 1
+            version_file = self._get_version_file(local_path, version)
+            os.makedirs(os.path.dirname(version_file))
+            with open(version_file, 'wb') as fh:
+                fh.write(contents.encode('utf-8') if not isinstance(contents, bytes) else contents)
+            self._comments[(local_path, version)] = (comment, author or self._user)
+
+        return version
+
+    def _sync_paths(self, local_paths):
+        """
+        Internal function that synchronizes latest version of the given files updating synchronization progress
+        :param local_paths: list(str)
+        :return: bool
+        """
+
+        local_paths = [local_path for local_path in local_paths if self._is_server_file(local_path)]
+        if not local_paths:
+            return False
+
+        sizes = [os.path.getsize(self._get_version_file(path, self._get_max_version(path))) for path in local_paths]
+        total_bytes = sum(sizes)
+        downloaded_bytes = 0
+        for i, (local_path, size) in enumerate(zip(local_paths, sizes)):
+            self._sync(local_path)
+            downloaded_bytes += size
+            if self._sync_bytes_per_second:
+                time.sleep(size / float(self._sync_bytes_per_second))
+            progress = int(100 * downloaded_bytes / total_bytes) if total_bytes else 100
+            self._progress = [progress, i + 1, len(local_paths), downloaded_bytes, total_bytes]
+
+        return True
+
+    def _sync(self, local_path):
+        version_file = self._get_version_file(local_path, self._get_max_version(local_path))
+        local_folder = os.path.dirname(local_path)
+        if not os.path.isdir(local_folder):
+            os.makedirs(local_folder)
+        shutil.copyfile(version_file, local_path)
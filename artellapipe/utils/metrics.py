@@ -0,0 +1,492 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for metrics (spans, counters and histograms) of pipeline hot paths.
+Metrics are disabled by default and disabled metrics have almost no overhead. They can be enabled with
+ARTELLAPIPE_METRICS environment variable, that contains a comma separated list of sinks:
+    - log: each span is logged when it finishes
+    - json:<file path>: metrics are appended to the given file (one JSON document per line) on flush
+    - prometheus:<file path>: metrics are written in Prometheus text format to the given file on flush
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import re
+import json
+import time
+import atexit
+import socket
+import logging
+import threading
+import functools
+
+LOGGER = logging.getLogger('artellapipe')
+
+METRICS_ENV = 'ARTELLAPIPE_METRICS'
+
+# Histogram buckets (in seconds) used for spans
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float('inf'))
+
+
+class Counter(object):
+    """
+    Class that stores a value that only increases
+    """
+
+    def __init__(self):
+        self.value = 0
+
+    def increment(self, value=1):
+        self.value += value
+
+    def to_dict(self):
+        return {'value': self.value}
+
+
+class Histogram(object):
+    """
+    Class that stores the distribution of observed values in fixed buckets
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        for i, bucket in enumerate(self.buckets):
+            if value <= bucket:
+                self.bucket_counts[i] += 1
+                break
+
+    def to_dict(self):
+        return {
+            'count': self.count, 'sum': self.sum, 'min': self.min, 'max': self.max,
+            'buckets': [[bucket if bucket != float('inf') else '+Inf', count]
+                        for bucket, count in zip(self.buckets, self.bucket_counts)]
+        }
+
+
+class _NullSpan(object):
+    """
+    Span returned when metrics are disabled
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span(object):
+    """
+    Class that measures the time spent in a block of code. Elapsed time is stored in the <name>.seconds histogram and
+    errors raised inside the block are counted in <name>.errors counter
+    """
+
+    def __init__(self, registry, name, labels):
+        self._registry = registry
+        self._name = name
+        self._labels = labels
+        self._start = None
+        self.elapsed = None
+
+    def __enter__(self):
+        self._start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.elapsed = time.time() - self._start
+        self._registry.record_span(self._name, self.elapsed, self._labels, failed=exc_type is not None)
+        return False
+
+
+class MetricsRegistry(object):
+    """
+    Class that stores metrics and sends them to the registered sinks
+    """
+
+    def __init__(self):
+        self._enabled = False
+        self._counters = dict()
+        self._histograms = dict()
+        self._sinks = list()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @property
+    def sinks(self):
+        return list(self._sinks)
+
+    def enable(self):
+        self._enabled = True
+
+    def disable(self):
+        self._enabled = False
+
+    def add_sink(self, sink):
+        """
+        Registers a new sink. Metrics are enabled when a sink is added
+        :param sink: MetricsSink
+        """
+
+        with self._lock:
+            if sink not in self._sinks:
+                self._sinks.append(sink)
+        self._enabled = True
+
+    def remove_sink(self, sink):
+        with self._lock:
+            if sink in self._sinks:
+                self._sinks.remove(sink)
+
+    def span(self, name, **labels):
+        """
+        Returns context manager that measures the time spent inside it
+        :param name: str
+        :param labels: dict
+        :return: Span
+        """
+
+        if not self._enabled:
+            return _NULL_SPAN
+
+        return Span(self, name, labels)
+
+    def increment(self, name, value=1, **labels):
+        """
+        Increments counter with the given name
+        :param name: str
+        :param value: int or float
+        :param labels: dict
+        """
+
+        if not self._enabled:
+            return
+
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            counter = self._counters.get(key, None)
+            if counter is None:
+                counter = self._counters[key] = Counter()
+            counter.increment(value)
+
+    def observe(self, name, value, **labels):
+        """
+        Stores given value in the histogram with the given name
+        :param name: str
+        :param value: int or float
+        :param labels: dict
+        """
+
+        if not self._enabled:
+            return
+
+        self._observe(name, value, labels)
+
+    def record_span(self, name, elapsed, labels, failed=False):
+        """
+        Stores the elapsed time of a finished span and notifies the sinks
+        :param name: str
+        :param elapsed: float, seconds
+        :param labels: dict
+        :param failed: bool, Whether an error was raised inside the span
+        """
+
+        self._observe('{}.seconds'.format(name), elapsed, labels)
+        if failed:
+            self.increment('{}.errors'.format(name), **labels)
+        for sink in self._sinks:
+            sink.record_span(name, elapsed, labels)
+
+    def snapshot(self):
+        """
+        Returns current value of all the metrics
+        :return: dict
+        """
+
+        with self._lock:
+            return {
+                'counters': [{'name': name, 'labels': dict(labels), 'value': counter.value}
+                             for (name, labels), counter in sorted(self._counters.items())],
+                'histograms': [dict(histogram.to_dict(), name=name, labels=dict(labels))
+                               for (name, labels), histogram in sorted(self._histograms.items())]
+            }
+
+    def flush(self):
+        """
+        Sends current metrics to all the sinks
+        """
+
+        if not self._sinks:
+            return
+
+        metrics_snapshot = self.snapshot()
+        for sink in self._sinks:
+            try:
+                sink.flush(metrics_snapshot)
+            except Exception as exc:
+                LOGGER.warning('Error while flushing metrics into "{}": {}'.format(sink, exc))
+
+    def reset(self):
+        """
+        Removes all stored metrics
+        """
+
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _observe(self, name, value, labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key, None)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+
+class MetricsSink(object):
+    """
+    Base class for metrics sinks
+    """
+
+    def record_span(self, name, elapsed, labels):
+        """
+        Called each time a span finishes
+        :param name: str
+        :param elapsed: float
+        :param labels: dict
+        """
+
+        pass
+
+    def flush(self, metrics_snapshot):
+        """
+        Called when metrics are flushed
+        :param metrics_snapshot: dict
+        """
+
+        pass
+
+
+class LogSink(MetricsSink):
+    """
+    Sink that logs spans when they finish
+    """
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self._logger = logger or LOGGER
+        self._level = level
+
+    def record_span(self, name, elapsed, labels):
+        self._logger.log(self._level, '<{}> Elapsed time : {:.4f}s{}'.format(
+            name, elapsed, ' | {}'.format(labels) if labels else ''))
+
+
+class JsonFileSink(MetricsSink):
+    """
+    Sink that appends metrics to a file, one JSON document per flush. Documents contain the host and process, so
+    files of different machines can be aggregated
+    """
+
+    def __init__(self, file_path):
+        self._file_path = file_path
+
+    def flush(self, metrics_snapshot):
+        document = dict(metrics_snapshot, host=socket.gethostname(), pid=os.getpid(), time=time.time())
+        file_folder = os.path.dirname(self._file_path)
+        if file_folder and not os.path.isdir(file_folder):
+            os.makedirs(file_folder)
+        with open(self._file_path, 'a') as fh:
+            fh.write(json.dumps(document, sort_keys=True) + '\n')
+
+
+class PrometheusSink(MetricsSink):
+    """
+    Sink that writes metrics in Prometheus text exposition format, so they can be collected by a node exporter
+    textfile collector
+    """
+
+    def __init__(self, file_path, prefix='artellapipe'):
+        self._file_path = file_path
+        self._prefix = prefix
+
+    def flush(self, metrics_snapshot):
+        temp_file = '{}.tmp'.format(self._file_path)
+        with open(temp_file, 'w') as fh:
+            fh.write(self.format(metrics_snapshot))
+        if os.path.isfile(self._file_path):
+            os.remove(self._file_path)
+        os.rename(temp_file, self._file_path)
+
+    def format(self, metrics_snapshot):
+        """
+        Returns given metrics in Prometheus text format
+        :param metrics_snapshot: dict
+        :return: str
+        """
+
+        lines = list()
+        declared = set()
+        for counter in metrics_snapshot['counters']:
+            name = self._get_name(counter['name']) + '_total'
+            if name not in declared:
+                declared.add(name)
+                lines.append('# TYPE {} counter'.format(name))
+            lines.append('{}{} {}'.format(name, self._format_labels(counter['labels']), counter['value']))
+
+        for histogram in metrics_snapshot['histograms']:
+            name = self._get_name(histogram['name'])
+            if name not in declared:
+                declared.add(name)
+                lines.append('# TYPE {} histogram'.format(name))
+            cumulative_count = 0
+            for bucket, count in histogram['buckets']:
+                cumulative_count += count
+                labels = dict(histogram['labels'], le=bucket)
+                lines.append('{}_bucket{} {}'.format(name, self._format_labels(labels), cumulative_count))
+            labels = self._format_labels(histogram['labels'])
+            lines.append('{}_sum{} {}'.format(name, labels, histogram['sum']))
+            lines.append('{}_count{} {}'.format(name, labels, histogram['count']))
+
+        return '\n'.join(lines) + '\n'
+
+    def _get_name(self, name):
+        name = '{}_{}'.format(self._prefix, name) if self._prefix else name
+        return re.sub(r'[^a-zA-Z0-9_:]', '_', name)
+
+    @staticmethod
+    def _format_labels(labels):
+        if not labels:
+            return ''
+        return '{{{}}}'.format(','.join(
+            '{}="{}"'.format(key, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+            for key, value in sorted(labels.items())))
+
+
+_REGISTRY = MetricsRegistry()
+
+
+def get_registry():
+    """
+    Returns metrics registry used by the pipeline
+    :return: MetricsRegistry
+    """
+
+    return _REGISTRY
+
+
+def span(name, **labels):
+    """
+    Returns context manager that measures the time spent inside it
+    :param name: str
+    :param labels: dict
+    :return: Span
+    """
+
+    return _REGISTRY.span(name, **labels)
+
+
+def increment(name, value=1, **labels):
+    """
+    Increments counter with the given name
+    :param name: str
+    :param value: int or float
+    :param labels: dict
+    """
+
+    _REGISTRY.increment(name, value, **labels)
+
+
+def observe(name, value, **labels):
+    """
+    Stores given value in the histogram with the given name
+    :param name: str
+    :param value: int or float
+    :param labels: dict
+    """
+
+    _REGISTRY.observe(name, value, **labels)
+
+
+def timed(name):
+    """
+    Decorator that measures the time spent in the decorated function in a span with the given name
+    :param name: str
+    """
+
+    def _decorator(fn):
+
+        @functools.wraps(fn)
+        def _wrapper(*args, **kwargs):
+            if not _REGISTRY._enabled:
+                return fn(*args, **kwargs)
+            with _REGISTRY.span(name):
+                return fn(*args, **kwargs)
+
+        return _wrapper
+
+    return _decorator
+
+
+def flush():
+    """
+    Sends current metrics to all the registered sinks
+    """
+
+    _REGISTRY.flush()
+
+
+def configure(sinks_config=None):
+    """
+    Registers the sinks defined in the given configuration string (see module documentation)
+    :param sinks_config: str, If not given, ARTELLAPIPE_METRICS environment variable is used
+    :return: list(MetricsSink), registered sinks
+    """
+
+    sinks_config = sinks_config if sinks_config is not None else os.environ.get(METRICS_ENV, '')
+    sinks = list()
+    for sink_config in sinks_config.split(','):
+        sink_config = sink_config.strip()
+        if not sink_config:
+            continue
+        sink_type, _, sink_path = sink_config.partition(':')
+        if sink_type == 'log':
+            sinks.append(LogSink())
+        elif sink_type == 'json' and sink_path:
+            sinks.append(JsonFileSink(os.path.expandvars(os.path.expanduser(sink_path))))
+        elif sink_type == 'prometheus' and sink_path:
+            sinks.append(PrometheusSink(os.path.expandvars(os.path.expanduser(sink_path))))
+        else:
+            LOGGER.warning('Metrics sink "{}" is not valid!'.format(sink_config))
+
+    for sink in sinks:
+        _REGISTRY.add_sink(sink)
+
+    return sinks
+
+
+if configure():
+    atexit.register(flush)
@@ -0,0 +1,98 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for a set that keeps insertion order
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+from collections import OrderedDict
+
+try:
+    from collections.abc import MutableSet
+except ImportError:
+    from collections import MutableSet
+
+
+class OrderedSet(MutableSet):
+    """
+    Set that remembers the order in which items were added. Membership checks and insertions are O(1), so it can
+    be used instead of lists when collecting unique items (such as paths) in the order they were found
+    """
+
+    def __init__(self, iterable=None):
+        self._items = OrderedDict()
+        if iterable is not None:
+            self.update(iterable)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __reversed__(self):
+        return reversed(self._items)
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, list(self._items))
+
+    def __eq__(self, other):
+        if isinstance(other, OrderedSet):
+            return len(self) == len(other) and list(self) == list(other)
+        return set(self) == set(other) if isinstance(other, (set, frozenset, MutableSet)) else False
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def add(self, item):
+        """
+        Adds given item at the end of the set if it is not already in the set
+        :param item: hashable
+        """
+
+        if item not in self._items:
+            self._items[item] = None
+
+    def discard(self, item):
+        """
+        Removes given item from the set if it is in the set
+        :param item: hashable
+        """
+
+        self._items.pop(item, None)
+
+    def update(self, iterable):
+        """
+        Adds all the given items at the end of the set keeping their order
+        :param iterable: iterable
+        """
+
+        for item in iterable:
+            self.add(item)
+
+    def clear(self):
+        """
+        Removes all items of the set
+        """
+
+        self._items.clear()
+
+    def to_list(self):
+        """
+        Returns the items of the set as a list
+        :return: list
+        """
+
+        return list(self._items)
@@ -0,0 +1,298 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains path normalization utilities used during Artella files resolution
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import threading
+from collections import OrderedDict
+
+# Normalizer of the current project context
+_PATH_NORMALIZER = None
+
+
+class LRUCache(object):
+    """
+    Thread safe dictionary that only keeps the latest accessed items
+    """
+
+    def __init__(self, max_size=4096):
+        self._max_size = max_size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        """
+        Returns cached value stored with the given key
+        :param key: hashable
+        :param default: variant
+        :return: variant
+        """
+
+        with self._lock:
+            if key not in self._items:
+                return default
+            value = self._items.pop(key)
+            self._items[key] = value
+
+        return value
+
+    def set(self, key, value):
+        """
+        Stores given value in the cache. If the cache is full, least recently used value is removed
+        :param key: hashable
+        :param value: variant
+        """
+
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            if len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all cached values
+        """
+
+        with self._lock:
+            self._items.clear()
+
+
+class PathNormalizer(object):
+    """
+    Class that converts paths between its environment variable form and its full form. It is built once from an
+    ArtellaProjectContext so environment variables and configuration values are not read each time a path is solved
+    """
+
+    _MISSING = object()
+
+    def __init__(self, context, max_size=4096, path_utils=None):
+        """
+        :param context: ArtellaProjectContext
+        :param max_size: int, maximum number of cached paths
+        :param path_utils: module, object with clean_path and join_path functions. If not given,
+            tpDcc.libs.python.path is used
+        """
+
+        if path_utils is None:
+            from tpDcc.libs.python import path as path_utils
+
+        self._context = context
+        self._cache = LRUCache(max_size=max_size)
+        self._path_utils = path_utils
+
+        self._project_var = context.project_path or None
+        self._clean_project_var = path_utils.clean_path(self._project_var) if self._project_var else None
+        self._artella_var = context.artella_root or None
+        self._env_var_prefix = '${}/'.format(context.env_var)
+        self._root_prefix = '${}/'.format(context.root_prefix)
+
+        production_folder = context.production_folder
+        self._production_prefixes = (
+            production_folder, os.sep + production_folder, '/' + production_folder) if production_folder else None
+
+    @property
+    def context(self):
+        """
+        Returns project context this normalizer was built from
+        :return: ArtellaProjectContext
+        """
+
+        return self._context
+
+    @property
+    def project_path(self):
+        """
+        Returns cleaned project path
+        :return: str or None
+        """
+
+        return self._clean_project_var
+
+    def clear(self):
+        """
+        Removes all cached paths
+        """
+
+        self._cache.clear()
+
+    def fix_path(self, path_to_fix, clean_path=True):
+        """
+        Converts path to a path relative to project environment variable
+        :param path_to_fix: str
+        :param clean_path: bool
+        :return: str
+        """
+
+        key = ('fix', path_to_fix, clean_path)
+        result = self._cache.get(key, self._MISSING)
+        if result is self._MISSING:
+            result = self._fix_path(path_to_fix, clean_path)
+            self._cache.set(key, result)
+
+        return result
+
+    def resolve_path(self, path_to_resolve):
+        """
+        Converts given path to a path that uses project environment variable
+        :param path_to_resolve: str
+        :return: str
+        """
+
+        key = ('resolve', path_to_resolve)
+        result = self._cache.get(key, self._MISSING)
+        if result is self._MISSING:
+            result = self._resolve_path(path_to_resolve)
+            self._cache.set(key, result)
+
+        return result
+
+    def prefix_path_with_project_path(self, path_to_prefix, env_var=False):
+        """
+        Adds project path to given path as prefix
+        :param path_to_prefix: str
+        :param env_var: bool
+        :return: str
+        """
+
+        if not path_to_prefix:
+            return
+
+        key = ('prefix', path_to_prefix, env_var)
+        result = self._cache.get(key, self._MISSING)
+        if result is self._MISSING:
+            result = self._prefix_path_with_project_path(path_to_prefix, env_var)
+            self._cache.set(key, result)
+
+        return result
+
+    def prefix_path_with_artella_env_path(self, path_to_prefix):
+        """
+        Adds Artella environment variable path to given path as prefix
+        :param path_to_prefix: str
+        :return: str
+        """
+
+        if not self._artella_var:
+            return path_to_prefix
+
+        key = ('artella', path_to_prefix)
+        result = self._cache.get(key, self._MISSING)
+        if result is self._MISSING:
+            result = self._path_utils.join_path(self._artella_var, path_to_prefix)
+            self._cache.set(key, result)
+
+        return result
+
+    def fix_paths(self, paths_to_fix, clean_path=True):
+        """
+        Converts all given paths to paths relative to project environment variable
+        :param paths_to_fix: list(str)
+        :param clean_path: bool
+        :return: list(str)
+        """
+
+        return [self.fix_path(path_to_fix, clean_path=clean_path) for path_to_fix in paths_to_fix]
+
+    def resolve_paths(self, paths_to_resolve):
+        """
+        Converts all given paths to paths that use project environment variable
+        :param paths_to_resolve: list(str)
+        :return: list(str)
+        """
+
+        return [self.resolve_path(path_to_resolve) for path_to_resolve in paths_to_resolve]
+
+    def prefix_paths_with_project_path(self, paths_to_prefix, env_var=False):
+        """
+        Adds project path to all given paths as prefix
+        :param paths_to_prefix: list(str)
+        :param env_var: bool
+        :return: list(str)
+        """
+
+        return [
+            self.prefix_path_with_project_path(path_to_prefix, env_var=env_var) for path_to_prefix in paths_to_prefix]
+
+    def _fix_path(self, path_to_fix, clean_path):
+        """
+        Internal function that implements fix_path without caching
+        """
+
+        if clean_path:
+            path_to_fix = self._path_utils.clean_path(path_to_fix)
+
+        if not self._project_var:
+            return path_to_fix
+
+        if path_to_fix.startswith(self._env_var_prefix):
+            path_to_fix = path_to_fix.replace(self._env_var_prefix, self._project_var)
+        elif path_to_fix.startswith(self._root_prefix):
+            path_to_fix = path_to_fix.replace(self._root_prefix, self._project_var)
+
+        return path_to_fix
+
+    def _resolve_path(self, path_to_resolve):
+        """
+        Internal function that implements resolve_path without caching
+        """
+
+        path_to_resolve = path_to_resolve.replace('\\', '/')
+        if not self._project_var:
+            return path_to_resolve
+
+        if path_to_resolve.startswith(self._project_var):
+            path_to_resolve = path_to_resolve.replace(self._project_var, self._env_var_prefix)
+
+        return path_to_resolve
+
+    def _prefix_path_with_project_path(self, path_to_prefix, env_var):
+        """
+        Internal function that implements prefix_path_with_project_path without caching
+        """
+
+        path_to_prefix = self._path_utils.clean_path(path_to_prefix)
+
+        if self._production_prefixes and path_to_prefix.startswith(self._production_prefixes):
+            return self.prefix_path_with_artella_env_path(path_to_prefix)
+
+        project_path = self._clean_project_var or ''
+        if path_to_prefix.startswith(project_path):
+            return path_to_prefix
+
+        return self._path_utils.clean_path(os.path.join(project_path, path_to_prefix))
+
+
+def get_path_normalizer(context, path_utils=None):
+    """
+    Returns path normalizer built from the given project context. Normalizer (and its cached paths) is only reused
+    while the same context is given, so a new one is built each time project context changes
+    :param context: ArtellaProjectContext
+    :param path_utils: module, object with clean_path and join_path functions used when a new normalizer is built
+    :return: PathNormalizer
+    """
+
+    global _PATH_NORMALIZER
+
+    normalizer = _PATH_NORMALIZER
+    if not normalizer or normalizer.context is not context:
+        normalizer = PathNormalizer(context, path_utils=path_utils)
+        _PATH_NORMALIZER = normalizer
+
+    return normalizer
@@ -15,19 +15,23 @@ __email__ = "tpovedatd@gmail.com"
 
 import time
 import inspect
+import traceback
 
 import tpDcc as tp
 from tpDcc.libs.python import osplatform
 
+from artellapipe.utils import stats
+
 
 class PluginStats(object):
     """
-    Class used to get info about a plugin and its environment
+    Class used to get info about a plugin and its environment. It can also be used to get info about the launch of
+    a tool that is not loaded yet, giving the ID of the tool instead of a plugin
     """
 
-    def __init__(self, plugin):
+    def __init__(self, plugin=None, plugin_id=None):
         self._plugin = plugin
-        self._id = self._plugin.id
+        self._id = plugin_id or getattr(plugin, 'id', None)
         self._start_time = 0.0
         self._end_time = 0.0
         self._execution_time = 0.0
@@ -35,19 +39,41 @@ class PluginStats(object):
         self._info = dict()
         self._init()
 
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.finish(
+            trace_back=''.join(traceback.format_exception(exc_type, exc_val, exc_tb)) if exc_type else None,
+            record=True)
+        return False
+
+    @property
+    def info(self):
+        return self._info
+
+    @property
+    def execution_time(self):
+        return self._execution_time
+
     def _init(self):
         """
         Internal function that initializes plugin statistics data
         """
 
         self._info.update({
-            'name': self._plugin.__class__.__name__,
-            'constructor': self._plugin.constructor,
-            'module': self._plugin.__class__.__module__,
-            'filepath': inspect.getfile(self._plugin.__class__),
+            # Tools are launched by ID before they are loaded, so ID is used as name to group all their executions
+            'name': self._id or self._plugin.__class__.__name__,
             'id': self._id,
             'application': tp.Dcc.get_name()
         })
+        if self._plugin is not None:
+            self._info.update({
+                'constructor': getattr(self._plugin, 'constructor', None),
+                'module': self._plugin.__class__.__module__,
+                'filepath': inspect.getfile(self._plugin.__class__)
+            })
 
         self._info.update(osplatform.machine_info())
 
@@ -58,10 +84,13 @@ class PluginStats(object):
 
         self._start_time = time.time()
 
-    def finish(self, trace_back=None):
+    def finish(self, trace_back=None, record=False):
         """
         Function that is called when a plugin finish its execution
         :param trace_back: optional traceback
+        :param record: bool, Whether to store the execution in tools statistics database. Execution is stored by a
+            background thread, so the caller never waits for the database. Executions measured using the stats as
+            a context manager are always recorded
         """
 
         self._end_time = time.time()
@@ -70,6 +99,11 @@ class PluginStats(object):
         self._info['lastUsed'] = self._end_time
         if trace_back:
             self._info['traceback'] = trace_back
+        else:
+            self._info.pop('traceback', None)
+
+        if record:
+            stats.record(self)
 
 
 class Plugin(object):
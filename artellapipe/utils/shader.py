@@ -21,6 +21,7 @@ from tpDcc.libs.qt.core import image
 
 import artellapipe
 from artellapipe.libs.artella.core import artellalib
+from artellapipe.core import filestransaction, versioncache
 
 
 IGNORED_SHADERS = list()
@@ -99,7 +100,7 @@ class ShadingNetwork(object):
         if shaders is None:
             shaders = tp.Dcc.list_materials()
 
-        exported_shaders = list()
+        shader_networks = list()
         for shader in shaders:
             if shader not in IGNORE_SHADERS:
                 shading_group = cls.get_shading_group(shader_node=shader)
@@ -113,37 +114,44 @@ class ShadingNetwork(object):
                 # Store shader icon in base64 format
                 shader_network['icon'] = image.image_to_base64(icon_path)
 
-                # Export the shader in the given path and with the proper format
                 out_file = os.path.join(shaders_path, shader + shader_extension)
-                LOGGER.debug('Generating Shader %s in %s', (shader, out_file))
-
-                # if os.path.isfile(out_file):
-                #     temp_file, temp_filename = tempfile.mkstemp()
-                #     cls.write(shader_network, temp_filename)
-                #     if filecmp.cmp(out_file, temp_filename):
-                #         logger.debug(
-                #         'Shader file already exists and have same size. No new shader file will be generated!')
-                #         result = qtutils.show_question(None, 'New Shader File Version',
-                #         'Shader File {} already exists with same file size!
-                #         Do you want to upload it to Artella anyways?'.format(shader))
-                #         if result == QMessageBox.No:
-                #             upload_new_version = False
-                #     else:
-                #         logger.debug('Writing shader file: {}'.format(out_file))
-                #         cls.write(shader_network, out_file)
-                # else:
-                artellalib.lock_file(out_file, force=True)
-                LOGGER.debug('Writing shader file: {}'.format(out_file))
-                cls.write(shader_network, out_file)
+                shader_networks.append((shader, out_file, shader_network))
 
-                if publish:
-                    LOGGER.debug('Creating new shader version in Artella: {}'.format(out_file))
-                    if not comment:
-                        comment = 'New Shader {} version'.format(shader)
-                    artellalib.upload_new_asset_version(out_file, comment=comment, skip_saving=True)
-                artellalib.unlock_file(out_file)
+        if not shader_networks:
+            return list()
 
+        if not comment:
+            if len(shader_networks) == 1:
+                comment = 'New Shader {} version'.format(shader_networks[0][0])
+            else:
+                comment = 'New Shaders version: {}'.format(', '.join(shader for shader, _, _ in shader_networks))
+
+        # All shader files are locked, uploaded (with a single comment) and unlocked together
+        transaction = filestransaction.FilesTransaction(
+            comment=comment, skip_saving=True, upload=publish, client=artellalib,
+            version_cache=versioncache.get_version_cache(), history_cache=versioncache.get_history_cache(),
+            use_history=not artellapipe.project.is_enterprise())
+        if not transaction.lock([out_file for _, out_file, _ in shader_networks]):
+            LOGGER.warning('Impossible to lock shader files. Aborting shaders export!')
+            transaction.rollback()
+            return
+
+        exported_shaders = list()
+        try:
+            for shader, out_file, shader_network in shader_networks:
+                # Export the shader in the given path and with the proper format
+                LOGGER.debug('Writing shader file: {}'.format(out_file))
+                cls.write(shader_network, out_file)
                 exported_shaders.append(out_file)
+        except Exception:
+            transaction.rollback()
+            raise
+
+        if publish:
+            LOGGER.debug('Creating new shaders versions in Artella: {}'.format(exported_shaders))
+        if not transaction.commit():
+            LOGGER.warning('Impossible to upload new version of shader files: {}'.format(exported_shaders))
+            return
 
         return exported_shaders
 
@@ -0,0 +1,125 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains read-only snapshots of configuration data with dotted-key access
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import copy
+
+# Snapshots registry. Each entry stores the configuration object the snapshot was built from (to avoid id reuse)
+_SNAPSHOTS = dict()
+
+
+class ConfigSnapshot(object):
+    """
+    Frozen and pre-flattened copy of configuration data.
+    Nested values can be accessed directly using dotted keys (for example "data.id_attribute") so hot paths do not
+    need to walk nested dictionaries or go through configuration default handling each time a value is read.
+    NOTE: Containers returned by the snapshot are shared between all callers and must not be modified.
+    """
+
+    __slots__ = ('_name', '_values', '_keys')
+
+    def __init__(self, data, name=None):
+        self._name = name
+        self._values = dict()
+
+        data = copy.deepcopy(data) if data else dict()
+        self._flatten(data)
+
+        # NOTE: This must be the last attribute set, after it the snapshot becomes read-only
+        self._keys = tuple(data.keys())
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __setattr__(self, name, value):
+        if hasattr(self, '_keys'):
+            raise AttributeError('{} is read-only'.format(self.__class__.__name__))
+        super(ConfigSnapshot, self).__setattr__(name, value)
+
+    def __repr__(self):
+        return '<{}({})>'.format(self.__class__.__name__, self._name or '')
+
+    @property
+    def name(self):
+        """
+        Returns the name of the configuration this snapshot was built from
+        :return: str
+        """
+
+        return self._name
+
+    def keys(self):
+        """
+        Returns top level keys of the snapshot
+        :return: tuple(str)
+        """
+
+        return self._keys
+
+    def get(self, key, default=None):
+        """
+        Returns value stored in the given dotted key
+        :param key: str, dotted key (for example: "data.id_attribute")
+        :param default: variant, value returned if the key is not stored in the snapshot or its value is None
+        :return: variant
+        """
+
+        value = self._values.get(key, None)
+        if value is None:
+            return default
+
+        return value
+
+    def _flatten(self, data, prefix=''):
+        """
+        Internal function that stores all the values of the given dictionary using dotted keys
+        :param data: dict
+        :param prefix: str
+        """
+
+        for key, value in data.items():
+            dotted_key = '{}{}'.format(prefix, key)
+            self._values[dotted_key] = value
+            if isinstance(value, dict):
+                self._flatten(value, prefix='{}.'.format(dotted_key))
+
+
+def get_config_snapshot(config):
+    """
+    Returns snapshot of the given configuration. Snapshot is only built the first time it is requested
+    :param config: DccConfig
+    :return: ConfigSnapshot
+    """
+
+    config_id = id(config)
+    snapshot_entry = _SNAPSHOTS.get(config_id, None)
+    if snapshot_entry and snapshot_entry[0] is config:
+        return snapshot_entry[1]
+
+    config_data = getattr(config, 'data', None) if config is not None else None
+    config_name = getattr(config, 'name', None) if config is not None else None
+    new_snapshot = ConfigSnapshot(config_data, name=config_name)
+    _SNAPSHOTS[config_id] = (config, new_snapshot)
+
+    return new_snapshot
+
+
+def invalidate_snapshots():
+    """
+    Removes all cached configuration snapshots. Must be called each time configurations are reloaded
+    """
+
+    _SNAPSHOTS.clear()
@@ -0,0 +1,420 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the engine used to stamp media profiles information on top of image frames
+
+Stamp profiles are dictionaries with the following (optional) keys:
+    - top_left, top_center, top_right, bottom_left, bottom_center, bottom_right: text drawn in each corner. Text can
+      contain tokens such as {frame} or {source_name} (resolved per frame) or any other key of the profile
+    - border_height: int, height in pixels of the top and bottom bars where text is drawn
+    - border_color: list(int), RGBA color of the bars
+    - font_path: str, path to the TrueType font used to draw text
+    - font_size: int
+    - font_color: list(int), RGBA color of the text
+    - logo: str, path to an image drawn in the top right corner of the frame
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import re
+import sys
+import string
+import logging
+import itertools
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+PIL_AVAILABLE = True
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    PIL_AVAILABLE = False
+
+from artellapipe.utils import concurrency
+
+LOGGER = logging.getLogger('artellapipe')
+
+STAMP_POSITIONS = ('top_left', 'top_center', 'top_right', 'bottom_left', 'bottom_center', 'bottom_right')
+FRAME_TOKENS = ('frame', 'source_name')
+FRAME_NUMBER_REGEX = re.compile(r'(\d+)(?=\.[^.]+$)')
+
+# Overlay used by the worker processes. It is sent once per process, not once per frame
+_WORKER_TEMPLATE = None
+
+
+class StampTemplate(object):
+    """
+    Class that renders the static part of a stamp profile (bars, logo and text without per frame tokens) once.
+    Rendered overlays are cached per resolution so they can be composited on top of any number of frames
+    """
+
+    def __init__(self, config_dict=None):
+        config_dict = dict(config_dict or dict())
+
+        self._border_height = int(config_dict.get('border_height', 0) or 0)
+        self._border_color = tuple(config_dict.get('border_color', None) or (0, 0, 0, 255))
+        self._font_path = config_dict.get('font_path', None)
+        self._font_size = int(config_dict.get('font_size', 14) or 14)
+        self._font_color = tuple(config_dict.get('font_color', None) or (255, 255, 255, 255))
+        self._logo = config_dict.get('logo', None)
+        self._static_texts = dict()
+        self._frame_texts = dict()
+        self._overlays = dict()
+        self._font = None
+
+        static_values = dict((k, v) for k, v in config_dict.items() if k not in FRAME_TOKENS)
+        for position in STAMP_POSITIONS:
+            text = config_dict.get(position, None)
+            if not text:
+                continue
+            text = str(text)
+            field_names = set(_get_field_root(field[1]) for field in string.Formatter().parse(text) if field[1])
+            if field_names.intersection(FRAME_TOKENS):
+                # Frame tokens are kept untouched (with their format spec), so they are resolved per frame
+                self._frame_texts[position] = format_text(text, static_values, escape=True)
+            else:
+                self._static_texts[position] = format_text(text, static_values)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_font'] = None
+        state['_overlays'] = dict(
+            (size, (overlay.mode, overlay.size, overlay.tobytes())) for size, overlay in self._overlays.items())
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._overlays = dict(
+            (size, Image.frombytes(*overlay)) for size, overlay in self._overlays.items())
+
+    @property
+    def frame_texts(self):
+        """
+        Returns texts that must be resolved per frame
+        :return: dict(str, str)
+        """
+
+        return dict(self._frame_texts)
+
+    @property
+    def static_texts(self):
+        """
+        Returns texts that are drawn once in the overlay
+        :return: dict(str, str)
+        """
+
+        return dict(self._static_texts)
+
+    def get_overlay(self, size):
+        """
+        Returns overlay image for the given resolution. Overlay is only rendered the first time a resolution is used
+        :param size: tuple(int, int)
+        :return: PIL.Image
+        """
+
+        size = tuple(size)
+        overlay = self._overlays.get(size, None)
+        if overlay is None:
+            overlay = self._render_overlay(size)
+            self._overlays[size] = overlay
+
+        return overlay
+
+    def stamp(self, source, output, frame=None):
+        """
+        Stamps given source frame and stores the result in the given output path
+        :param source: str, path to the source image
+        :param output: str, path where stamped image is stored
+        :param frame: int, frame number. If not given, it is retrieved from the source file name
+        :return: str, output path
+        """
+
+        if frame is None:
+            frame = get_frame_number(source)
+
+        with Image.open(source) as source_image:
+            stamped = source_image.convert('RGBA')
+        stamped.alpha_composite(self.get_overlay(stamped.size))
+
+        if self._frame_texts:
+            frame_values = {'frame': frame, 'source_name': os.path.basename(source)}
+            draw = ImageDraw.Draw(stamped)
+            for position, text in self._frame_texts.items():
+                self._draw_text(draw, stamped.size, position, format_text(text, frame_values))
+
+        output_folder = os.path.dirname(output)
+        if output_folder and not os.path.isdir(output_folder):
+            try:
+                os.makedirs(output_folder)
+            except OSError:
+                pass
+
+        if os.path.splitext(output)[-1].lower() in ('.jpg', '.jpeg', '.bmp'):
+            stamped = stamped.convert('RGB')
+        stamped.save(output)
+
+        return output
+
+    def _get_font(self):
+        """
+        Internal function that returns the font used to draw text
+        :return: PIL.ImageFont
+        """
+
+        if self._font is None:
+            font = None
+            if self._font_path and os.path.isfile(self._font_path):
+                try:
+                    font = ImageFont.truetype(self._font_path, self._font_size)
+                except (IOError, OSError):
+                    LOGGER.warning('Impossible to load stamp font: "{}"'.format(self._font_path))
+            self._font = font or ImageFont.load_default()
+
+        return self._font
+
+    def _render_overlay(self, size):
+        """
+        Internal function that renders the static part of the stamp for the given resolution
+        :param size: tuple(int, int)
+        :return: PIL.Image
+        """
+
+        width, height = size
+        overlay = Image.new('RGBA', size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+
+        if self._border_height:
+            draw.rectangle((0, 0, width, self._border_height), fill=self._border_color)
+            draw.rectangle((0, height - self._border_height, width, height), fill=self._border_color)
+
+        if self._logo and os.path.isfile(self._logo):
+            with Image.open(self._logo) as logo_image:
+                logo = logo_image.convert('RGBA')
+            max_height = self._border_height or logo.size[1]
+            if logo.size[1] > max_height:
+                logo = logo.resize((max(1, int(logo.size[0] * max_height / logo.size[1])), max_height))
+            overlay.alpha_composite(logo, (max(0, width - logo.size[0]), 0))
+
+        for position, text in self._static_texts.items():
+            self._draw_text(draw, size, position, text)
+
+        return overlay
+
+    def _draw_text(self, draw, size, position, text):
+        """
+        Internal function that draws given text in the given stamp position
+        :param draw: PIL.ImageDraw
+        :param size: tuple(int, int)
+        :param position: str, one of STAMP_POSITIONS
+        :param text: str
+        """
+
+        width, height = size
+        font = self._get_font()
+        if hasattr(draw, 'textbbox'):
+            left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+        else:
+            # ImageDraw.textbbox is only available in Pillow 8 or newer
+            left, top = 0, 0
+            right, bottom = draw.textsize(text, font=font)
+        text_width, text_height = right - left, bottom - top
+        margin = max(2, self._border_height - text_height) // 2
+
+        vertical, horizontal = position.split('_')
+        y = margin if vertical == 'top' else height - text_height - margin
+        if horizontal == 'left':
+            x = margin
+        elif horizontal == 'center':
+            x = (width - text_width) // 2
+        else:
+            x = width - text_width - margin
+
+        draw.text((x - left, y - top), text, font=font, fill=self._font_color)
+
+
+def format_text(text, values, escape=False):
+    """
+    Formats given stamp text with the given values. Fields without a value are kept untouched (with their conversion
+    and format spec), so they can be resolved later. Fields whose value is None are skipped
+    :param text: str
+    :param values: dict
+    :param escape: bool, Whether braces of the resolved text are escaped, so returned text can be formatted again
+    :return: str
+    """
+
+    formatter = string.Formatter()
+    text_parts = list()
+    for literal_text, field_name, format_spec, conversion in formatter.parse(text):
+        if literal_text:
+            text_parts.append(_escape(literal_text) if escape else literal_text)
+        if field_name is None:
+            continue
+        if _get_field_root(field_name) not in values:
+            text_parts.append('{{{}{}{}}}'.format(
+                field_name, '!' + conversion if conversion else '', ':' + format_spec if format_spec else ''))
+            continue
+        value = formatter.get_field(field_name, (), values)[0]
+        if value is None:
+            continue
+        value = formatter.format_field(formatter.convert_field(value, conversion), format_spec)
+        text_parts.append(_escape(value) if escape else value)
+
+    return ''.join(text_parts)
+
+
+def _get_field_root(field_name):
+    """
+    Internal function that returns the name of the value used by a format field (for example, frame for frame.real)
+    :param field_name: str
+    :return: str
+    """
+
+    return re.split(r'[.\[]', field_name, 1)[0]
+
+
+def _escape(text):
+    """
+    Internal function that escapes braces of the given text
+    :param text: str
+    :return: str
+    """
+
+    return text.replace('{', '{{').replace('}', '}}')
+
+
+def get_frame_number(file_path):
+    """
+    Returns frame number of the given file path (for example, playblast.0012.png returns 12)
+    :param file_path: str
+    :return: int or None
+    """
+
+    match = FRAME_NUMBER_REGEX.search(os.path.basename(file_path))
+
+    return int(match.group(1)) if match else None
+
+
+def stamp_image(source, output, config_dict=None, frame=None):
+    """
+    Stamps a single image with the given stamp profile
+    :param source: str
+    :param output: str
+    :param config_dict: dict or StampTemplate
+    :param frame: int
+    :return: str, output path
+    """
+
+    if not PIL_AVAILABLE:
+        raise RuntimeError('Impossible to stamp images because Pillow is not available!')
+
+    template = config_dict if isinstance(config_dict, StampTemplate) else StampTemplate(config_dict)
+
+    return template.stamp(source, output, frame=frame)
+
+
+def can_use_processes():
+    """
+    Returns whether or not frames can be stamped in a pool of processes. Worker processes are launched with the
+    current executable, so a pool can only be used if it is a Python interpreter (and not a DCC executable) or if
+    multiprocessing.set_executable was used to set a Python interpreter
+    :return: bool
+    """
+
+    executable = sys.executable
+    try:
+        from multiprocessing import spawn
+        executable = spawn.get_executable()
+    except ImportError:
+        try:
+            from multiprocessing import forking
+            executable = getattr(forking, '_python_exe', executable)
+        except ImportError:
+            pass
+
+    return bool(executable) and os.path.basename(executable).lower().startswith('python')
+
+
+def stamp_many(sources, outputs, config_dict=None, processes=None, threads=None, chunksize=4):
+    """
+    Stamps all the given images with the same stamp profile. Static overlay is rendered once and frames are streamed
+    to a pool of threads (or processes), so only the frames being stamped are loaded in memory
+    :param sources: iterable(str), paths to the source images
+    :param outputs: iterable(str), paths where stamped images are stored. Must match the number of sources
+    :param config_dict: dict or StampTemplate
+    :param processes: int, number of processes used to stamp frames. If not given, frames are stamped in the current
+        process using a pool of threads. Processes must only be used when can_use_processes returns True
+    :param threads: int, number of threads used when processes are not used. If not given, concurrency.MAX_WORKERS
+        is used. If 1 or lower, frames are stamped one by one
+    :param chunksize: int, number of frames sent to each worker in a single batch
+    :return: iterator(str), output path of each stamped frame, in the same order as the given sources
+    """
+
+    if not PIL_AVAILABLE:
+        raise RuntimeError('Impossible to stamp images because Pillow is not available!')
+
+    template = config_dict if isinstance(config_dict, StampTemplate) else StampTemplate(config_dict)
+    tasks = ((source, output, get_frame_number(source)) for source, output in zip(sources, outputs))
+
+    num_workers = processes if processes is not None else (threads or concurrency.MAX_WORKERS)
+    if num_workers <= 1:
+        for source, output, frame in tasks:
+            yield template.stamp(source, output, frame=frame)
+        return
+
+    # Overlay and font are created before the pool, so they are shared by all the workers
+    first_task = next(tasks, None)
+    if first_task is None:
+        return
+    with Image.open(first_task[0]) as first_image:
+        template.get_overlay(first_image.size)
+    template._get_font()
+    tasks = itertools.chain([first_task], tasks)
+
+    def _stamp_task(task):
+        source, output, frame = task
+        return template.stamp(source, output, frame=frame)
+
+    if processes is not None:
+        pool = multiprocessing.Pool(processes=processes, initializer=_init_worker, initargs=(template,))
+        worker = _stamp_worker
+    else:
+        pool = ThreadPool(processes=num_workers)
+        worker = _stamp_task
+    try:
+        for output in pool.imap(worker, tasks, chunksize=chunksize):
+            yield output
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+def _init_worker(template):
+    """
+    Internal function that stores the stamp template in the worker process
+    :param template: StampTemplate
+    """
+
+    global _WORKER_TEMPLATE
+    _WORKER_TEMPLATE = template
+
+
+def _stamp_worker(task):
+    """
+    Internal function that stamps a single frame in a worker process
+    :param task: tuple(str, str, int), source path, output path and frame number
+    :return: str
+    """
+
+    source, output, frame = task
+
+    return _WORKER_TEMPLATE.stamp(source, output, frame=frame)
@@ -0,0 +1,398 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation for a local database that aggregates execution statistics of tools.
+Slowest tools can be listed with: python -m artellapipe.utils.stats --limit 10
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import sys
+import time
+import atexit
+import socket
+import sqlite3
+import logging
+import argparse
+import threading
+import contextlib
+
+try:
+    from Queue import Queue, Empty
+except ImportError:
+    from queue import Queue, Empty
+
+LOGGER = logging.getLogger('artellapipe')
+
+STATS_DB_ENV = 'ARTELLAPIPE_STATS_DB'
+
+# Number of runs stored for each tool and DCC. Older runs are removed when new ones are added
+MAX_RUNS = 1000
+
+SORT_KEYS = ('p50', 'p95', 'mean', 'max', 'runs', 'failures')
+
+# Maximum number of executions stored in a single database transaction by the background writer
+BATCH_SIZE = 100
+
+_DATABASES = dict()
+_DATABASES_LOCK = threading.Lock()
+
+
+def percentile(values, pct):
+    """
+    Returns the given percentile of the given values using linear interpolation between closest ranks
+    :param values: list(float), sorted values
+    :param pct: float, percentile (from 0 to 100)
+    :return: float or None
+    """
+
+    if not values:
+        return None
+
+    rank = (len(values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+class PluginStatsDatabase(object):
+    """
+    Class that stores tools executions in a SQLite database. Only the latest runs of each tool and DCC are kept, so
+    the database does not grow forever and statistics reflect the current performance of the tools
+    """
+
+    def __init__(self, db_path, max_runs=MAX_RUNS):
+        self._db_path = db_path
+        self._max_runs = max_runs
+        self._lock = threading.Lock()
+
+        db_folder = os.path.dirname(db_path)
+        if db_folder and not os.path.isdir(db_folder):
+            os.makedirs(db_folder)
+
+        with self._connect() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS runs ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, tool TEXT NOT NULL, tool_id TEXT, dcc TEXT NOT NULL, '
+                'execution_time REAL NOT NULL, finished REAL, machine TEXT, failed INTEGER NOT NULL DEFAULT 0)')
+            connection.execute('CREATE INDEX IF NOT EXISTS runs_tool_dcc ON runs (tool, dcc, id)')
+
+    @property
+    def db_path(self):
+        return self._db_path
+
+    def add_run(self, tool, execution_time, dcc=None, tool_id=None, finished=None, machine=None, failed=False):
+        """
+        Stores a new execution of a tool
+        :param tool: str, name of the tool
+        :param execution_time: float, seconds
+        :param dcc: str
+        :param tool_id: str
+        :param finished: float, timestamp when the execution finished
+        :param machine: str
+        :param failed: bool
+        """
+
+        self._add_runs([(
+            tool, tool_id, dcc or 'standalone', execution_time, finished or time.time(),
+            machine or socket.gethostname(), int(bool(failed)))])
+
+    def add_info(self, info):
+        """
+        Stores a new execution of a tool from the info of its PluginStats
+        :param info: dict
+        """
+
+        self.add_infos([info])
+
+    def add_infos(self, infos):
+        """
+        Stores executions of tools from the info of their PluginStats in a single transaction
+        :param infos: list(dict)
+        """
+
+        runs = list()
+        for info in infos:
+            if 'executionTime' not in info:
+                LOGGER.debug('Plugin "{}" stats are not stored because its execution did not finish'.format(
+                    info.get('name', None)))
+                continue
+            runs.append((
+                info.get('name', None) or info.get('id', 'unknown'), info.get('id', None),
+                info.get('application', None) or 'standalone', info['executionTime'],
+                info.get('lastUsed', None) or time.time(), info.get('node', None) or socket.gethostname(),
+                int(bool(info.get('traceback', None)))))
+
+        if runs:
+            self._add_runs(runs)
+
+    def get_tool_stats(self, tool=None, dcc=None):
+        """
+        Returns execution statistics of each tool and DCC
+        :param tool: str, If given, only statistics of this tool are returned
+        :param dcc: str, If given, only statistics of tools executed in this DCC are returned
+        :return: list(dict), dictionaries with tool, dcc, runs, failures, mean, p50, p95 and max keys
+        """
+
+        query = 'SELECT tool, dcc, execution_time, failed FROM runs'
+        conditions = list()
+        values = list()
+        if tool:
+            conditions.append('tool = ?')
+            values.append(tool)
+        if dcc:
+            conditions.append('dcc = ?')
+            values.append(dcc)
+        if conditions:
+            query += ' WHERE {}'.format(' AND '.join(conditions))
+        query += ' ORDER BY tool, dcc, execution_time'
+
+        runs = dict()
+        with self._connect() as connection:
+            for run_tool, run_dcc, execution_time, failed in connection.execute(query, values):
+                tool_runs = runs.setdefault((run_tool, run_dcc), [list(), 0])
+                tool_runs[0].append(execution_time)
+                tool_runs[1] += failed
+
+        tool_stats = list()
+        for (run_tool, run_dcc), (execution_times, failures) in runs.items():
+            tool_stats.append({
+                'tool': run_tool,
+                'dcc': run_dcc,
+                'runs': len(execution_times),
+                'failures': failures,
+                'mean': sum(execution_times) / len(execution_times),
+                'p50': percentile(execution_times, 50),
+                'p95': percentile(execution_times, 95),
+                'max': execution_times[-1]
+            })
+
+        return tool_stats
+
+    def get_slowest_tools(self, limit=10, sort_by='p95', dcc=None):
+        """
+        Returns statistics of the slowest tools
+        :param limit: int
+        :param sort_by: str, statistic used to sort the tools (see SORT_KEYS)
+        :param dcc: str, If given, only tools executed in this DCC are returned
+        :return: list(dict)
+        """
+
+        if sort_by not in SORT_KEYS:
+            raise ValueError('Tools cannot be sorted by "{}". Valid keys: {}'.format(sort_by, SORT_KEYS))
+
+        tool_stats = sorted(self.get_tool_stats(dcc=dcc), key=lambda stats: stats[sort_by], reverse=True)
+
+        return tool_stats[:limit] if limit else tool_stats
+
+    def clear(self):
+        """
+        Removes all stored runs
+        """
+
+        with self._connect() as connection:
+            connection.execute('DELETE FROM runs')
+
+    def _add_runs(self, runs):
+        """
+        Internal function that stores given runs and removes the oldest runs of their tools
+        :param runs: list(tuple), (tool, tool_id, dcc, execution_time, finished, machine, failed) tuples
+        """
+
+        with self._connect() as connection:
+            connection.executemany(
+                'INSERT INTO runs (tool, tool_id, dcc, execution_time, finished, machine, failed) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)', runs)
+            for tool, dcc in set((run[0], run[2]) for run in runs):
+                connection.execute(
+                    'DELETE FROM runs WHERE tool = ? AND dcc = ? AND id NOT IN '
+                    '(SELECT id FROM runs WHERE tool = ? AND dcc = ? ORDER BY id DESC LIMIT ?)',
+                    (tool, dcc, tool, dcc, self._max_runs))
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """
+        Internal context manager that opens a connection to the database and commits changes when it finishes
+        """
+
+        with self._lock:
+            connection = sqlite3.connect(self._db_path, timeout=10)
+            try:
+                with connection:
+                    yield connection
+            finally:
+                connection.close()
+
+
+def get_default_db_path():
+    """
+    Returns path of the database where tools statistics are stored by default
+    :return: str
+    """
+
+    db_path = os.environ.get(STATS_DB_ENV, None)
+    if db_path:
+        return db_path
+
+    return os.path.normpath(os.path.join(os.path.expanduser('~'), 'artellapipe', 'stats', 'plugin_stats.db'))
+
+
+def get_database(db_path=None):
+    """
+    Returns tools statistics database stored in the given path
+    :param db_path: str, If not given, default database path is used
+    :return: PluginStatsDatabase
+    """
+
+    db_path = db_path or get_default_db_path()
+    with _DATABASES_LOCK:
+        if db_path not in _DATABASES:
+            _DATABASES[db_path] = PluginStatsDatabase(db_path)
+
+        return _DATABASES[db_path]
+
+
+class StatsWriter(object):
+    """
+    Class that stores executions of tools in a background thread, so tools (and the UI thread that launches them)
+    never wait for the database. Queued executions are stored in batches, one transaction per database
+    """
+
+    def __init__(self, batch_size=BATCH_SIZE):
+        self._batch_size = batch_size
+        self._queue = Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def put(self, info, db_path=None):
+        """
+        Queues the given execution info to be stored in the given database
+        :param info: dict, info of a PluginStats. A copy is stored, so the plugin can be executed again
+        :param db_path: str, If not given, default database path is used
+        """
+
+        self._queue.put((db_path or get_default_db_path(), dict(info)))
+        with self._lock:
+            if not self._thread or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='PluginStatsWriter')
+                self._thread.daemon = True
+                self._thread.start()
+
+    def flush(self):
+        """
+        Waits until all queued executions are stored
+        """
+
+        self._queue.join()
+
+    def _run(self):
+        """
+        Internal function executed by the writer thread
+        """
+
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+
+            infos_by_db = dict()
+            for db_path, info in batch:
+                infos_by_db.setdefault(db_path, list()).append(info)
+            try:
+                for db_path, infos in infos_by_db.items():
+                    try:
+                        get_database(db_path).add_infos(infos)
+                    except (sqlite3.Error, IOError, OSError) as exc:
+                        LOGGER.warning('Impossible to store plugin stats: {}'.format(exc))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+_WRITER = StatsWriter()
+
+
+def record(plugin_stats, db_path=None, background=True):
+    """
+    Stores the execution of the given PluginStats in the statistics database. Errors are only logged, so a
+    problem with the database never breaks the tool
+    :param plugin_stats: PluginStats
+    :param db_path: str
+    :param background: bool, If True, execution is queued and stored by a background thread
+    :return: bool
+    """
+
+    if background:
+        _WRITER.put(plugin_stats.info, db_path=db_path)
+        return True
+
+    try:
+        get_database(db_path).add_info(plugin_stats.info)
+    except (sqlite3.Error, IOError, OSError) as exc:
+        LOGGER.warning('Impossible to store plugin stats: {}'.format(exc))
+        return False
+
+    return True
+
+
+def flush():
+    """
+    Waits until all the executions recorded in background are stored
+    """
+
+    _WRITER.flush()
+
+
+def format_tool_stats(tool_stats):
+    """
+    Returns a table with the given tools statistics
+    :param tool_stats: list(dict)
+    :return: str
+    """
+
+    lines = ['{:<40} {:<12} {:>6} {:>8} {:>10} {:>10} {:>10} {:>10}'.format(
+        'tool', 'dcc', 'runs', 'failures', 'mean (s)', 'p50 (s)', 'p95 (s)', 'max (s)')]
+    for stats in tool_stats:
+        lines.append('{:<40} {:<12} {:>6} {:>8} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f}'.format(
+            stats['tool'][:40], stats['dcc'][:12], stats['runs'], stats['failures'], stats['mean'], stats['p50'],
+            stats['p95'], stats['max']))
+
+    return '\n'.join(lines)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Lists the slowest tools stored in tools statistics database')
+    parser.add_argument('--db', default=None, help='Database path. Default: {}'.format(get_default_db_path()))
+    parser.add_argument('--limit', type=int, default=10, help='Number of tools to list (0 lists all the tools)')
+    parser.add_argument('--sort', default='p95', choices=SORT_KEYS, help='Statistic used to sort the tools')
+    parser.add_argument('--dcc', default=None, help='Only list tools executed in this DCC')
+    parsed_args = parser.parse_args(args)
+
+    db_path = parsed_args.db or get_default_db_path()
+    if not os.path.isfile(db_path):
+        print('Tools statistics database "{}" does not exist'.format(db_path))
+        return 1
+
+    tool_stats = get_database(db_path).get_slowest_tools(
+        limit=parsed_args.limit, sort_by=parsed_args.sort, dcc=parsed_args.dcc)
+    print(format_tool_stats(tool_stats))
+
+    return 0
+
+
+atexit.register(flush)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
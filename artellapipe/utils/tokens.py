@@ -0,0 +1,172 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains utilities to format strings that contain tokens (such as <camera> or <scene>)
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import re
+import threading
+
+
+class TokenContext(object):
+    """
+    Class that stores the values of the tokens evaluated during a capture. Each token function is evaluated at most
+    once per context
+    """
+
+    def __init__(self, attrs_dict=None):
+        self._attrs_dict = attrs_dict if attrs_dict is not None else dict()
+        self._values = dict()
+
+    @property
+    def attrs_dict(self):
+        """
+        Returns capture options used to evaluate tokens
+        :return: dict
+        """
+
+        return self._attrs_dict
+
+    def get_value(self, token, fn):
+        """
+        Returns value of the given token. Token function is only called the first time the token is requested
+        :param token: str
+        :param fn: fn, function that receives capture options and returns token value
+        :return: str
+        """
+
+        if token not in self._values:
+            value = fn(self._attrs_dict)
+            self._values[token] = '' if value is None else str(value)
+
+        return self._values[token]
+
+
+class CompiledTemplate(object):
+    """
+    Class that stores a string with tokens split in literal and token segments
+    """
+
+    def __init__(self, template, token_regex=None):
+        self._template = template
+        self._segments = list()
+
+        if not token_regex:
+            self._segments.append((False, template))
+            return
+
+        last_index = 0
+        for match in token_regex.finditer(template):
+            if match.start() > last_index:
+                self._segments.append((False, template[last_index:match.start()]))
+            self._segments.append((True, match.group(0)))
+            last_index = match.end()
+        if last_index < len(template):
+            self._segments.append((False, template[last_index:]))
+
+    @property
+    def template(self):
+        """
+        Returns original template string
+        :return: str
+        """
+
+        return self._template
+
+    @property
+    def tokens(self):
+        """
+        Returns tokens used by the template in order of appearance
+        :return: list(str)
+        """
+
+        return [segment for is_token, segment in self._segments if is_token]
+
+    def format(self, tokens, context):
+        """
+        Returns template with all its tokens resolved
+        :param tokens: dict, dictionary containing registered tokens data
+        :param context: TokenContext
+        :return: str
+        """
+
+        return ''.join(
+            context.get_value(segment, tokens[segment]['fn']) if is_token else segment
+            for is_token, segment in self._segments)
+
+
+class TokenFormatter(object):
+    """
+    Class that formats strings with registered tokens. Strings are parsed once and reused while the registered
+    tokens do not change
+    """
+
+    def __init__(self, tokens):
+        self._tokens = dict(tokens)
+        self._templates = dict()
+        self._lock = threading.Lock()
+
+        # Longer tokens first, so tokens that contain other tokens are matched properly
+        token_names = sorted(self._tokens.keys(), key=len, reverse=True)
+        self._token_regex = re.compile('|'.join(re.escape(token) for token in token_names)) if token_names else None
+
+    @property
+    def tokens(self):
+        """
+        Returns tokens data used by this formatter
+        :return: dict
+        """
+
+        return self._tokens
+
+    def compile(self, template):
+        """
+        Returns compiled version of the given template
+        :param template: str
+        :return: CompiledTemplate
+        """
+
+        compiled_template = self._templates.get(template, None)
+        if compiled_template is None:
+            compiled_template = CompiledTemplate(template, self._token_regex)
+            with self._lock:
+                self._templates[template] = compiled_template
+
+        return compiled_template
+
+    def format(self, template, attrs_dict=None, context=None):
+        """
+        Replaces the tokens of the given string
+        :param template: str
+        :param attrs_dict: dict, parsed capture options. Ignored if a context is given
+        :param context: TokenContext, context used to evaluate the tokens. If not given, a new one is created
+        :return: str
+        """
+
+        if not template:
+            return template
+
+        context = context or TokenContext(attrs_dict)
+
+        return self.compile(template).format(self._tokens, context)
+
+    def format_many(self, templates, attrs_dict=None, context=None):
+        """
+        Replaces the tokens of all the given strings. Each token is evaluated only once for all the strings
+        :param templates: list(str)
+        :param attrs_dict: dict, parsed capture options. Ignored if a context is given
+        :param context: TokenContext, context used to evaluate the tokens. If not given, a new one is created
+        :return: list(str)
+        """
+
+        context = context or TokenContext(attrs_dict)
+
+        return [self.format(template, context=context) for template in templates]
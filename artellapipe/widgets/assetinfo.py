@@ -23,8 +23,7 @@ from tpDcc.libs.qt.core import base
 from tpDcc.libs.qt.widgets import breadcrumb, stack, dividers, grid
 
 import artellapipe
-from artellapipe.core import defines
-from artellapipe.libs.artella.core import artellalib
+from artellapipe.core import defines, versioncache
 
 
 class AssetInfoWidget(base.BaseWidget, object):
@@ -234,7 +233,9 @@ class AssetFileButton(base.BaseWidget, object):
 
     checkVersions = Signal(str, object)
 
-    def __init__(self, asset_widget, status, asset_file_type, asset_file_type_name, asset_file_icon, parent=None):
+    def __init__(
+            self, asset_widget, status, asset_file_type, asset_file_type_name, asset_file_icon, file_path=None,
+            parent=None):
 
         self._asset_file_icon = asset_file_icon
         self._status = status
@@ -244,7 +245,7 @@ class AssetFileButton(base.BaseWidget, object):
 
         super(AssetFileButton, self).__init__(parent=parent)
 
-        self._check_availability()
+        self._check_availability(file_path=file_path)
 
     def get_main_layout(self):
         main_layout = QHBoxLayout()
@@ -277,15 +278,16 @@ class AssetFileButton(base.BaseWidget, object):
         self._file_btn.clicked.connect(partial(self._on_open_asset_file, self._asset_file_type))
         self._versions_btn.clicked.connect(partial(self._on_check_working_versions, self._asset_file_type))
 
-    def _check_availability(self):
+    def _check_availability(self, file_path=None):
         """
         Internal function that updates enabled status of the buttons depending of the asset file availability
+        :param file_path: str, asset file path already retrieved by the caller. If not given, it is retrieved
         """
 
         if not self._asset_widget:
             return
 
-        file_path = self._get_file_path()
+        file_path = file_path or self._get_file_path()
         if not file_path or not os.path.exists(file_path):
             self._disable_state()
             return
@@ -343,7 +345,7 @@ class AssetFileButton(base.BaseWidget, object):
             return
 
         file_path = self._get_file_path()
-        asset_history = artellalib.get_file_history(file_path)
+        asset_history = versioncache.get_history_cache().get_history(file_path)
         asset_versions = asset_history.versions
         if not asset_versions:
             return
@@ -453,14 +455,19 @@ class WorkingAssetInfo(base.BaseWidget, object):
 
         files_btn = list()
         must_file_types = artellapipe.AssetsMgr().must_file_types
-        for file_type in self._asset_widget.asset.FILES:
-            if must_file_types:
-                if file_type not in must_file_types:
-                    continue
+        file_types = [
+            file_type for file_type in self._asset_widget.asset.FILES
+            if not must_file_types or file_type in must_file_types]
+
+        # Files of all types are retrieved at once so the panel waits for a single round trip
+        files_paths = self._asset_widget.asset.get_files(self.STATUS, file_types=file_types, concurrent=True)
+
+        for file_type in file_types:
             file_type_name = artellapipe.FilesMgr().get_file_type_name(file_type)
             file_btn = AssetFileButton(
                 self._asset_widget, self.STATUS,
-                file_type, file_type_name, tpDcc.ResourcesMgr().icon(file_type))
+                file_type, file_type_name, tpDcc.ResourcesMgr().icon(file_type),
+                file_path=files_paths.get(file_type, None))
             files_btn.append(file_btn)
             file_btn.checkVersions.connect(self._on_check_versions)
             self._file_buttons[file_type] = file_btn
@@ -23,8 +23,7 @@ from tpDcc.libs.qt.core import base
 from tpDcc.libs.qt.widgets import breadcrumb, stack, dividers, grid
 
 import artellapipe.register
-from artellapipe.core import defines
-from artellapipe.libs.artella.core import artellalib
+from artellapipe.core import defines, versioncache
 
 
 class ShotInfoWidget(base.BaseWidget, object):
@@ -315,7 +314,7 @@ class ShotFileButton(base.BaseWidget, object):
             return
 
         file_path = self._get_file_path()
-        asset_history = artellalib.get_file_history(file_path)
+        asset_history = versioncache.get_history_cache().get_history(file_path)
         asset_versions = asset_history.versions
         if not asset_versions:
             return
@@ -0,0 +1,14 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Minimal Artella project used by artellapipe benchmarks. It does not define any configuration, so default
+artellapipe configurations are used
+"""
+
+from artellapipe.core import project
+
+
+class BenchmarkProject(project.ArtellaProject, object):
+    def __init__(self):
+        super(BenchmarkProject, self).__init__(name='BenchmarkProject')
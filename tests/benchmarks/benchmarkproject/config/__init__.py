@@ -0,0 +1,6 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Configuration module of the benchmarks project. Default artellapipe configurations are used
+"""
@@ -0,0 +1,37 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for project catalog queries.
+Run them with: python -m pytest tests/benchmarks/catalog_benchmark.py
+"""
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+
+def _sample(items, num_samples=100):
+    return items[::max(1, len(items) // num_samples)]
+
+
+def test_tracker_assets_payload(benchmark, tracking_fixtures, num_assets):
+    assets = benchmark(tracking_fixtures.replay, 'all_project_assets')
+    assert len(assets) == num_assets
+
+
+def test_find_all_assets(benchmark, replay_project, num_assets):
+    import artellapipe
+
+    assets = benchmark(artellapipe.AssetsMgr().find_all_assets, force_update=True)
+    assert 0 < len(assets) <= num_assets
+
+
+def test_find_asset(benchmark, replay_project):
+    import artellapipe
+
+    assets_mgr = artellapipe.AssetsMgr()
+    asset_names = [asset.get_name() for asset in _sample(assets_mgr.find_all_assets(force_update=True))]
+
+    found_assets = benchmark(lambda: [assets_mgr.find_asset(asset_name) for asset_name in asset_names])
+    assert all(found_assets)
@@ -0,0 +1,137 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Fixtures used by artellapipe benchmarks. Benchmark modules are not collected by the default test run, they must be
+given explicitly:
+
+    python -m pytest tests/benchmarks/*_benchmark.py --benchmark-storage=tests/benchmarks/baselines
+        --benchmark-compare=0001 --benchmark-compare-fail=mean:15%
+
+Baselines are stored in tests/benchmarks/baselines. To record one use --benchmark-save=baseline instead of
+--benchmark-compare.
+
+Benchmarks run against synthetic projects of 1k, 10k and 50k assets (ARTELLAPIPE_BENCHMARK_SIZES environment
+variable can be used to change them, for example "1000,10000"). Production tracker is replaced with a
+ReplayTrackingManager and Artella Drive with a FakeArtellaDrive, so no DCC or Artella server is needed.
+Benchmarks that use project managers also need tpDcc. They load the minimal project stored in the benchmarkproject
+folder, using default artellapipe configurations. Other project class can be loaded defining
+ARTELLAPIPE_BENCHMARK_PROJECT environment variable ("package.module.ProjectClass").
+
+Baselines are machine specific, so they are not committed: regressions must be checked comparing against a baseline
+recorded in the same machine (with tpDcc installed, so project benchmarks are recorded too). CI only runs the
+benchmarks once with --benchmark-disable, to check that they still work.
+"""
+
+import os
+import sys
+import importlib
+
+import pytest
+
+from artellapipe.core import trackingfixtures
+from artellapipe.utils import fakeartella
+
+DEFAULT_SIZES = (1000, 10000, 50000)
+DEFAULT_PROJECT = 'benchmarkproject.BenchmarkProject'
+
+_FIXTURES_CACHE = dict()
+
+
+def _get_fixtures(num_assets, attributes=None, categories=None):
+    key = (num_assets, tuple(sorted((attributes or dict()).items())), tuple(categories or list()))
+    if key not in _FIXTURES_CACHE:
+        _FIXTURES_CACHE[key] = trackingfixtures.generate_fixtures(
+            num_assets=num_assets, num_shots=max(1, num_assets // 2), attributes=attributes, categories=categories)
+
+    return _FIXTURES_CACHE[key]
+
+
+def get_sizes():
+    sizes = os.environ.get('ARTELLAPIPE_BENCHMARK_SIZES', None)
+    if not sizes:
+        return DEFAULT_SIZES
+
+    return tuple(int(size) for size in sizes.split(',') if size.strip())
+
+
+def pytest_generate_tests(metafunc):
+    if 'num_assets' in metafunc.fixturenames:
+        metafunc.parametrize('num_assets', get_sizes(), ids=lambda size: '{}_assets'.format(size))
+
+
+@pytest.fixture
+def tracking_fixtures(num_assets):
+    """
+    Returns tracker payloads of a synthetic project with the given number of assets (and half of shots)
+    """
+
+    return _get_fixtures(num_assets)
+
+
+@pytest.fixture
+def artella_drive(tmpdir):
+    """
+    Returns a fake Artella Drive working in a temporary folder
+    """
+
+    return fakeartella.FakeArtellaDrive(root_path=str(tmpdir.mkdir('artella_drive')))
+
+
+@pytest.fixture(scope='session')
+def artella_project():
+    """
+    Loads the project defined in ARTELLAPIPE_BENCHMARK_PROJECT (or the benchmarks project) using the replay tracker
+    """
+
+    pytest.importorskip('tpDcc')
+
+    project_class_path = os.environ.get('ARTELLAPIPE_BENCHMARK_PROJECT', None)
+    if not project_class_path:
+        project_class_path = DEFAULT_PROJECT
+        benchmarks_folder = os.path.dirname(os.path.abspath(__file__))
+        if benchmarks_folder not in sys.path:
+            sys.path.insert(0, benchmarks_folder)
+
+    import artellapipe
+    import artellapipe.register
+    from artellapipe import loader
+    from artellapipe.managers import replaytracking
+
+    artellapipe.register.register_class('Tracker', replaytracking.ReplayTrackingManager)
+    module_name, class_name = project_class_path.rsplit('.', 1)
+    loader.set_project(getattr(importlib.import_module(module_name), class_name))
+
+    return artellapipe.project
+
+
+@pytest.fixture
+def replay_project(artella_project, num_assets, artella_drive, monkeypatch):
+    """
+    Returns loaded project with the tracker replaying the synthetic project and artellalib patched with a fake drive.
+    Synthetic assets data is stored in the attributes and categories defined in project assets configuration.
+    Project is located in the root of the fake drive
+    """
+
+    import artellapipe
+    from artellapipe.managers import replaytracking
+
+    assets_config = artellapipe.AssetsMgr().config_snapshot
+    attributes = dict()
+    for attribute in ('id', 'name', 'thumb'):
+        attribute_name = assets_config.get('data.{}_attribute'.format(attribute))
+        if attribute_name:
+            attributes['thumbnail' if attribute == 'thumb' else attribute] = attribute_name
+    categories = sorted(artellapipe.AssetsMgr().get_asset_categories() or list()) or None
+
+    replaytracking.ReplayTrackingManager.set_fixtures(
+        _get_fixtures(num_assets, attributes=attributes, categories=categories))
+    artellapipe.Tracker().login()
+
+    project_env_var = getattr(artella_project, 'env_var', None)
+    if project_env_var:
+        monkeypatch.setenv(project_env_var, artella_drive.local_path)
+        artella_project.invalidate_context()
+
+    with artella_drive.patch():
+        yield artella_project
@@ -0,0 +1,51 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark that compares list based paths deduplication with OrderedSet based deduplication.
+Run it with: python -m tests.benchmarks.orderedset_benchmark
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from artellapipe.utils import orderedset
+
+
+def _generate_paths(num_paths):
+    # Half of the paths are duplicated, as it happens when working and published paths of several file types are
+    # collected for the same asset
+    return ['P:/project/assets/Props/asset_{0:05d}/__working__/model'.format(i % (num_paths // 2)) for i in range(
+        num_paths)]
+
+
+def dedupe_with_list(paths):
+    paths_found = list()
+    for path in paths:
+        if path not in paths_found:
+            paths_found.append(path)
+
+    return paths_found
+
+
+def dedupe_with_ordered_set(paths):
+    paths_found = orderedset.OrderedSet()
+    for path in paths:
+        paths_found.add(path)
+
+    return paths_found.to_list()
+
+
+def run(sizes=(1000, 2500, 5000, 10000), repeat=3):
+    print('{:>8} {:>12} {:>12} {:>9}'.format('paths', 'list (s)', 'set (s)', 'speedup'))
+    for size in sizes:
+        paths = _generate_paths(size)
+        assert dedupe_with_list(paths) == dedupe_with_ordered_set(paths)
+        list_time = min(timeit.repeat(lambda: dedupe_with_list(paths), number=1, repeat=repeat))
+        set_time = min(timeit.repeat(lambda: dedupe_with_ordered_set(paths), number=1, repeat=repeat))
+        print('{:>8} {:>12.5f} {:>12.5f} {:>8.1f}x'.format(size, list_time, set_time, list_time / set_time))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,63 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for file paths resolution.
+Run them with: python -m pytest tests/benchmarks/paths_benchmark.py
+"""
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+
+def _get_asset_files(num_samples=100):
+    import artellapipe
+
+    all_assets = artellapipe.AssetsMgr().find_all_assets(force_update=True)
+    asset_files = list()
+    for asset in all_assets[::max(1, len(all_assets) // num_samples)]:
+        file_types = asset.get_valid_file_types()
+        if file_types:
+            asset_files.append((asset, file_types[0]))
+
+    return asset_files
+
+
+def _solve_paths(asset_files):
+    from artellapipe.core import defines
+
+    return [asset.get_file(file_type, status=defines.ArtellaFileStatus.WORKING, must_exist=False)
+            for asset, file_type in asset_files]
+
+
+def test_solve_path(benchmark, replay_project):
+    asset_files = _get_asset_files()
+    if not asset_files:
+        pytest.skip('Project assets have no valid file types')
+
+    file_paths = benchmark(_solve_paths, asset_files)
+    assert all(file_paths)
+
+
+def test_fix_path(benchmark, replay_project):
+    import artellapipe
+
+    file_paths = [file_path for file_path in _solve_paths(_get_asset_files()) if file_path]
+    files_mgr = artellapipe.FilesMgr()
+
+    # Normalizer cache is cleared before each round, so the cost of uncached paths is measured
+    fixed_paths = benchmark.pedantic(
+        lambda: [files_mgr.fix_path(file_path) for file_path in file_paths],
+        setup=files_mgr.path_normalizer.clear, rounds=20)
+    assert len(fixed_paths) == len(file_paths)
+
+
+def test_parse_path(benchmark, replay_project):
+    import artellapipe
+
+    file_paths = [file_path for file_path in _solve_paths(_get_asset_files()) if file_path]
+    files_mgr = artellapipe.FilesMgr()
+
+    parsed_paths = benchmark(lambda: [files_mgr.parse_path(file_path) for file_path in file_paths])
+    assert len(parsed_paths) == len(file_paths)
@@ -0,0 +1,103 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for local versions lookup and synchronization planning.
+Run them with: python -m pytest tests/benchmarks/sync_benchmark.py
+"""
+
+import os
+
+import pytest
+
+from artellapipe.core import localversions
+from artellapipe.utils import orderedset
+
+pytest.importorskip('pytest_benchmark')
+
+FILE_TYPES = ('model', 'shading', 'rig', 'groom')
+
+
+def _split_version(folder_name):
+    return folder_name, int(folder_name.rsplit('v', 1)[-1])
+
+
+def test_local_version_index(benchmark, artella_drive):
+    # Folder index used by get_local_versions, measured without a project
+    asset_paths = list()
+    for i in range(100):
+        asset_path = os.path.join(artella_drive.local_path, 'assets', 'asset_{:03d}'.format(i))
+        for file_type in FILE_TYPES:
+            for version in range(1, 11):
+                os.makedirs(os.path.join(asset_path, '__{}__v{:03d}'.format(file_type, version)))
+        asset_paths.append(asset_path)
+
+    def _get_local_versions():
+        localversions.invalidate_local_version_indices()
+        local_versions = list()
+        for asset_path in asset_paths:
+            version_index = localversions.get_local_version_index(asset_path, ignored_folders=['__working__'])
+            for file_type in FILE_TYPES:
+                local_versions.append(version_index.get_versions(
+                    resolve_fn=lambda folder: file_type in folder, version_fn=_split_version))
+        return local_versions
+
+    local_versions = benchmark(_get_local_versions)
+    assert all(len(versions) == 10 for versions in local_versions)
+
+
+def test_ordered_paths(benchmark, tracking_fixtures, num_assets):
+    # Removal of duplicated paths done by _get_paths_to_sync, measured without a project, using working and published
+    # paths of all the file types of each asset
+    paths = list()
+    for asset in tracking_fixtures.replay('all_project_assets'):
+        asset_path = 'P:/project/assets/{}/{}'.format(asset['category'], asset['name'])
+        for file_type in FILE_TYPES:
+            paths.append('{}/__working__/{}'.format(asset_path, file_type))
+            paths.append('{}/__{}__v001'.format(asset_path, file_type))
+            paths.append('{}/__working__/{}'.format(asset_path, file_type))
+
+    def _get_paths_to_sync():
+        paths_to_sync = orderedset.OrderedSet()
+        paths_to_sync.update(paths)
+        return paths_to_sync.to_list()
+
+    paths_to_sync = benchmark(_get_paths_to_sync)
+    assert len(paths_to_sync) == num_assets * len(FILE_TYPES) * 2
+
+
+def _sample_assets(num_samples=100):
+    import artellapipe
+
+    all_assets = artellapipe.AssetsMgr().find_all_assets(force_update=True)
+
+    return all_assets[::max(1, len(all_assets) // num_samples)]
+
+
+def test_get_local_versions(benchmark, replay_project):
+    from artellapipe.core import defines
+
+    assets = _sample_assets()
+    for asset in assets:
+        asset_path = asset.get_path()
+        if not asset_path:
+            continue
+        for file_type in asset.get_valid_file_types():
+            for version in range(1, 4):
+                version_folder = os.path.join(asset_path, '__{}__v{:03d}'.format(file_type, version))
+                if not os.path.isdir(version_folder):
+                    os.makedirs(version_folder)
+
+    local_versions = benchmark(
+        lambda: [asset.get_local_versions(status=defines.ArtellaFileStatus.PUBLISHED) for asset in assets])
+    assert len(local_versions) == len(assets)
+
+
+def test_get_paths_to_sync(benchmark, replay_project):
+    from artellapipe.core import defines
+
+    assets = _sample_assets()
+
+    paths_to_sync = benchmark(
+        lambda: [asset._get_paths_to_sync(None, defines.ArtellaFileStatus.ALL) for asset in assets])
+    assert len(paths_to_sync) == len(assets)
@@ -0,0 +1,50 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe asset index
+"""
+
+from artellapipe.core import assetindex
+
+
+class _Asset(object):
+    def __init__(self, asset_data):
+        self.asset_data = asset_data
+
+    def get_id(self):
+        return self.asset_data.get('id', None)
+
+    def get_name(self):
+        return self.asset_data.get('name', None)
+
+
+def test_queries():
+    chair = _Asset({'id': 'asset_001', 'name': 'chair'})
+    other_chair = _Asset({'id': 'asset_002', 'name': 'chair'})
+    lamp = _Asset({'name': 'lamp'})
+    index = assetindex.AssetIndex([chair, other_chair, lamp])
+
+    assert len(index) == 3
+    assert 'chair' in index
+    assert index.get_asset_by_id('asset_002 ') is other_chair
+    assert index.get_asset_by_id(None) is None
+    assert index.get_assets_by_name('chair') == [chair, other_chair]
+    assert index.get_assets_by_name('table') == list()
+
+    assert index.resolve({'id': 'asset_001 '}, 'id', _Asset) is chair
+    created = index.resolve({'id': 'asset_003', 'name': 'table'}, 'id', _Asset)
+    assert created.get_name() == 'table'
+    assert 'table' not in index
+
+
+def test_rebuild_drops_stale_assets():
+    index = assetindex.AssetIndex([_Asset({'id': 'asset_001', 'name': 'chair'})])
+    index.clear()
+    assert not len(index)
+    assert index.get_asset_by_id('asset_001') is None
+
+    renamed = _Asset({'id': 'asset_001', 'name': 'armchair'})
+    index.add(renamed)
+    assert index.get_assets_by_name('chair') == list()
+    assert index.resolve({'id': 'asset_001'}, 'id', _Asset) is renamed
@@ -0,0 +1,50 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe casting matrix
+"""
+
+from artellapipe.core import casting
+
+
+def test_breakdown_queries():
+    casting_matrix = casting.CastingMatrix.from_breakdown(
+        [('sh010', 'chair', 4), ('sh010', 'table', 1), ('sh020', 'chair', 2)], shot_ids=['sh010', 'sh020', 'sh030'])
+    assert len(casting_matrix) == 3
+    assert casting_matrix.get_occurrences('chair', 'sh010') == 4
+    assert casting_matrix.get_occurrences('table', 'sh020') == 0
+    assert casting_matrix.get_occurrences('chair', 'sh999') is None
+    assert casting_matrix.get_assets_in_shot('sh010') == {'chair': 4, 'table': 1}
+    assert casting_matrix.get_assets_in_shot('sh030') == dict()
+    assert casting_matrix.get_shots_of_asset('chair') == {'sh010': 4, 'sh020': 2}
+
+
+def test_partial_matrix():
+    casting_matrix = casting.CastingMatrix()
+    casting_matrix.set_occurrences('sh010', 'chair', 0)
+    casting_matrix.set_occurrences('sh010', 'lamp', 2)
+    assert casting_matrix.get_occurrences('chair', 'sh010') == 0
+    assert casting_matrix.get_occurrences('table', 'sh010') is None
+    assert casting_matrix.get_assets_in_shot('sh010') is None
+    assert casting_matrix.get_shots_of_asset('lamp') == {'sh010': 2}
+
+
+def test_shot_occurrences():
+    casting_matrix = casting.CastingMatrix()
+    casting_matrix.set_occurrences('sh010', 'table', 3)
+    casting_matrix.set_shot_occurrences('sh010', {'chair': 2, 'lamp': 1, 'sofa': 0, None: 1})
+    casting_matrix.set_shot_occurrences('sh020', dict())
+    assert casting_matrix.get_assets_in_shot('sh010') == {'chair': 2, 'lamp': 1}
+    assert casting_matrix.get_occurrences('table', 'sh010') == 0
+    assert casting_matrix.get_occurrences('sofa', 'sh010') == 0
+    assert casting_matrix.get_assets_in_shot('sh020') == dict()
+    assert casting_matrix.get_shots_of_asset('chair') == {'sh010': 2}
+    assert casting_matrix.get_shots_of_asset('table') == dict()
+
+    # Reloading a shot only replaces the casting of that shot
+    casting_matrix.set_occurrences('sh030', 'chair', 1)
+    casting_matrix.set_shot_occurrences('sh010', {'lamp': 4})
+    assert casting_matrix.get_assets_in_shot('sh010') == {'lamp': 4}
+    assert casting_matrix.get_shots_of_asset('chair') == {'sh030': 1}
+    assert casting_matrix.get_shots_of_asset('lamp') == {'sh010': 4}
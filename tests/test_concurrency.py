@@ -0,0 +1,30 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe concurrency utilities
+"""
+
+import time
+import threading
+
+from artellapipe.utils import concurrency
+
+
+def test_results_keep_order():
+    assert concurrency.map_concurrent(lambda x: x * 2, range(20)) == [x * 2 for x in range(20)]
+    assert list(concurrency.map_concurrent_dict(len, ['a', 'bbb']).items()) == [('a', 1), ('bbb', 3)]
+
+
+def test_queries_are_executed_concurrently():
+    def _query(item):
+        time.sleep(0.1)
+        return threading.current_thread().name
+
+    start = time.time()
+    concurrency.map_concurrent(_query, range(8), max_workers=8)
+    assert time.time() - start < 0.5
+
+
+def test_single_item_is_executed_inline():
+    assert concurrency.map_concurrent(lambda x: threading.current_thread(), [0]) == [threading.current_thread()]
@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe dependency crawler
+"""
+
+import time
+import threading
+
+from artellapipe.core import dependencycrawler
+
+
+def _create_tree(folder, depth=3, width=3):
+    references = dict()
+
+    def _create(name, level):
+        path = str(folder / '{}.ma'.format(name)).replace('\\', '/')
+        open(path, 'w').close()
+        children = list()
+        if level < depth:
+            for i in range(width):
+                children.append(_create('{}_{}'.format(name, i), level + 1))
+        # All the branches share the same rig, so it must be parsed only once
+        references[path] = children + [str(folder / 'rig.ma').replace('\\', '/'), '/missing/texture.png']
+        return path
+
+    open(str(folder / 'rig.ma'), 'w').close()
+    references[str(folder / 'rig.ma').replace('\\', '/')] = list()
+
+    return _create('shot', 0), references
+
+
+def test_crawl_finds_all_dependencies_once(tmp_path):
+    root, references = _create_tree(tmp_path)
+    parsed = list()
+    parsed_lock = threading.Lock()
+
+    def _parse(file_path):
+        time.sleep(0.005)
+        with parsed_lock:
+            parsed.append(file_path)
+        return references.get(file_path, list())
+
+    consumed = list()
+    crawler = dependencycrawler.DependencyCrawler(_parse, max_workers=4)
+    found = crawler.get_dependencies([root], consumer=consumed.append)
+
+    expected = set(path for refs in references.values() for path in refs)
+    assert set(found) == expected and len(found) == len(expected)
+    assert consumed == found
+    assert sorted(parsed) == sorted(set(parsed))
+    assert '/missing/texture.png' not in parsed
+
+
+def test_crawl_errors_do_not_stop_the_crawl(tmp_path):
+    root, references = _create_tree(tmp_path, depth=1, width=2)
+
+    def _parse(file_path):
+        if file_path.endswith('shot_0.ma'):
+            raise RuntimeError('Corrupted file')
+        return references.get(file_path, list())
+
+    crawler = dependencycrawler.DependencyCrawler(_parse, max_workers=2)
+    found = crawler.get_dependencies([root])
+    assert len(found) == 4
+    assert list(crawler.errors.keys()) == [root.replace('shot.ma', 'shot_0.ma')]
+    assert crawler.get_dependencies([]) == list()
@@ -0,0 +1,63 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe dependency graph
+"""
+
+import os
+
+from artellapipe.core import dependencygraph
+
+
+def _create_files(folder, references):
+    paths = dict()
+    for name in references:
+        paths[name] = str(folder / name).replace('\\', '/')
+    for name, refs in references.items():
+        with open(paths[name], 'w') as fh:
+            fh.write('\n'.join(paths[ref] for ref in refs))
+
+    return paths
+
+
+def _parse(file_path, parsed=None):
+    if parsed is not None:
+        parsed.append(os.path.basename(file_path))
+    with open(file_path, 'r') as fh:
+        return [line for line in fh.read().splitlines() if line]
+
+
+def test_only_changed_files_are_parsed(tmp_path):
+    paths = _create_files(tmp_path, {'shot.ma': ['set.ma', 'rig.ma'], 'set.ma': ['prop.ma'], 'rig.ma': [],
+                                     'prop.ma': []})
+    cache_file = str(tmp_path / 'cache' / 'graph.json')
+    graph = dependencygraph.DependencyGraph(cache_file=cache_file)
+
+    parsed = list()
+    graph.update(paths['shot.ma'], lambda f: _parse(f, parsed))
+    assert sorted(parsed) == ['prop.ma', 'rig.ma', 'set.ma', 'shot.ma']
+    assert graph.get_references(paths['shot.ma'], recursive=True) == [paths['set.ma'], paths['rig.ma'],
+                                                                        paths['prop.ma']]
+    assert graph.save()
+
+    # Graph loaded from disk does not parse files again
+    graph = dependencygraph.DependencyGraph(cache_file=cache_file)
+    parsed = list()
+    graph.update(paths['shot.ma'], lambda f: _parse(f, parsed))
+    assert parsed == list()
+
+    with open(paths['set.ma'], 'a') as fh:
+        fh.write('\n' + paths['rig.ma'])
+    graph.update(paths['shot.ma'], lambda f: _parse(f, parsed))
+    assert parsed == ['set.ma']
+
+
+def test_reverse_lookups_and_topological_order(tmp_path):
+    paths = _create_files(tmp_path, {'shot.ma': ['set.ma', 'rig.ma'], 'set.ma': ['rig.ma'], 'rig.ma': []})
+    graph = dependencygraph.DependencyGraph()
+    graph.update(paths['shot.ma'], _parse)
+
+    assert graph.get_referencing_files(paths['rig.ma']) == sorted([paths['set.ma'], paths['shot.ma']])
+    assert graph.get_referencing_files(paths['set.ma'], recursive=True) == [paths['shot.ma']]
+    assert graph.get_topological_order([paths['shot.ma']]) == [paths['rig.ma'], paths['set.ma'], paths['shot.ma']]
@@ -0,0 +1,54 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe fake Artella Drive client
+"""
+
+import os
+import types
+
+from artellapipe.utils import fakeartella
+
+
+def test_versions_and_sync(tmpdir):
+    drive = fakeartella.FakeArtellaDrive(root_path=str(tmpdir))
+    file_path = drive.add_file('assets/chair/model/chair.ma', versions=3, comment='update')
+    assert drive.get_current_version(file_path) == 3
+    assert [version for version, _ in drive.get_file_history(file_path).versions] == [1, 2, 3]
+    assert drive.get_status(file_path).references['chair.ma'].view_version == 0
+
+    drive.add_file('assets/chair/rig/chair_rig.ma')
+    assert drive.synchronize_path_with_folders(os.path.join(drive.local_path, 'assets'), recursive=True)
+    assert drive.get_synchronization_progress()[:3] == (100, 2, 2)
+    assert drive.get_status(file_path).references['chair.ma'].view_version == 3
+    assert sorted(drive.get_status(os.path.dirname(file_path), as_json=True)['data']) == ['chair.ma']
+    assert drive.calls['get_status'] == 3
+
+
+def test_lock_and_upload(tmpdir):
+    drive = fakeartella.FakeArtellaDrive(root_path=str(tmpdir))
+    file_path = drive.add_file('props/lamp.ma', sync=True)
+    drive.lock_file_by(file_path, 'other_user')
+    assert drive.is_locked(file_path) == (True, False)
+    assert not drive.lock_file(file_path)
+    assert not drive.upload_new_asset_version(file_path)
+    assert drive.lock_file(file_path, force=True)
+    with open(file_path, 'w') as fh:
+        fh.write('new version')
+    assert drive.upload_new_asset_version(file_path, comment='new')
+    assert drive.unlock_file(file_path)
+    assert drive.is_locked(file_path) == (False, False)
+    history = drive.get_file_history(file_path)
+    assert history.versions[-1][1].comment == 'new'
+
+
+def test_patch(tmpdir):
+    module = types.ModuleType('artellalib')
+    module.get_status = None
+    drive = fakeartella.FakeArtellaDrive(root_path=str(tmpdir))
+    with drive.patch(module):
+        assert module.get_status == drive.get_status
+        assert module.lock_file == drive.lock_file
+    assert module.get_status is None
+    assert not hasattr(module, 'lock_file')
@@ -0,0 +1,56 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe file types queries
+"""
+
+import pytest
+
+from artellapipe.core import filequeries
+
+FILE_TYPES = {'model': 'model_type', 'shading': 'shading_type', 'rig': 'rig_type'}
+
+
+@pytest.mark.parametrize('concurrent', [False, True])
+def test_query_file_types(concurrent):
+    queried = list()
+
+    def _query(file_type):
+        queried.append(file_type)
+        return file_type.upper()
+
+    results = filequeries.query_file_types(
+        ['model', 'invalid', 'rig'], FILE_TYPES.get, _query, concurrent=concurrent, max_workers=2)
+    if not concurrent:
+        # Sequential queries are only executed while results are consumed
+        assert not queried
+    assert list(results) == [('model', 'MODEL_TYPE'), ('rig', 'RIG_TYPE')]
+    assert sorted(queried) == ['model_type', 'rig_type']
+
+
+def test_is_any_published():
+    published = [{'version_path': '/model_v001'}, {'version_path': '/model_v002'}]
+    missing_path = [{'version_path': '/shading_v001'}, {'version_path': None}]
+    assert filequeries.is_any_published([('shading', missing_path), ('model', published)])
+    assert not filequeries.is_any_published([('shading', missing_path), ('rig', list()), ('model', None)])
+    assert filequeries.is_any_published(list()) is False
+
+    consumed = list()
+
+    def _infos():
+        for file_type, infos in (('model', published), ('shading', missing_path)):
+            consumed.append(file_type)
+            yield file_type, infos
+
+    # Published file types are searched lazily
+    assert filequeries.is_any_published(_infos())
+    assert consumed == ['model']
+
+
+@pytest.mark.parametrize('concurrent', [False, True])
+def test_get_files(concurrent):
+    files_paths = {'model': '/chair/model/chair.ma', 'rig': None}
+    result = filequeries.get_files(['model', 'rig'], files_paths.get, concurrent=concurrent, max_workers=2)
+    assert result == files_paths
+    assert filequeries.get_files(list(), files_paths.get, concurrent=concurrent) == dict()
@@ -0,0 +1,87 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe files transactions
+"""
+
+import os
+import threading
+
+import pytest
+
+from artellapipe.core import filestransaction
+from artellapipe.utils import fakeartella
+
+
+def _write(file_path, contents):
+    folder = os.path.dirname(file_path)
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    with open(file_path, 'w') as fh:
+        fh.write(contents)
+
+
+def test_commit(tmpdir):
+    drive = fakeartella.FakeArtellaDrive(root_path=str(tmpdir))
+    shader_a = drive.add_file('shaders/chair_shd.sshader', versions=2, sync=True)
+    shader_b = drive.add_file('shaders/lamp_shd.sshader', sync=True)
+    shader_c = os.path.join(os.path.dirname(shader_a), 'table_shd.sshader')
+    drive.reset_calls()
+
+    with filestransaction.FilesTransaction(
+            comment=lambda versions: 'New shaders', client=drive) as transaction:
+        assert transaction.lock([shader_a, shader_b, shader_c])
+        assert drive.is_locked(shader_a) == (True, True)
+        for shader_file in (shader_a, shader_b, shader_c):
+            _write(shader_file, 'new version')
+
+    assert transaction.versions == {shader_a: 3, shader_b: 2, shader_c: 1}
+    assert drive.calls['get_status'] == 1
+    assert drive.calls['upload_new_asset_version'] == 3
+    assert not transaction.locked_files
+    assert drive.is_locked(shader_a) == (False, False)
+    assert drive.get_file_history(shader_c).versions[-1][1].comment == 'New shaders'
+
+
+def test_rollback(tmpdir):
+    drive = fakeartella.FakeArtellaDrive(root_path=str(tmpdir))
+    file_path = drive.add_file('shots/sh010/sh010.ma', sync=True)
+    other_path = drive.add_file('shots/sh020/sh020.ma', sync=True)
+    drive.lock_file_by(other_path, 'other_user')
+
+    with pytest.raises(RuntimeError):
+        with filestransaction.FilesTransaction(files=[file_path], comment='new', client=drive) as transaction:
+            transaction.lock()
+            raise RuntimeError()
+    assert drive.is_locked(file_path) == (False, False)
+    assert drive.get_current_version(file_path) == 1
+
+    drive.lock_file = lambda file_path=None, force=False, **kwargs: file_path != other_path
+    transaction = filestransaction.FilesTransaction(files=[file_path, other_path], comment='new', client=drive)
+    assert not transaction.commit()
+    assert not transaction.uploaded_files
+    assert drive.is_locked(file_path) == (False, False)
+
+
+def test_scene_saved_in_calling_thread(tmpdir):
+    drive = fakeartella.FakeArtellaDrive(root_path=str(tmpdir))
+    file_paths = [drive.add_file('shaders/shader_{}.sshader'.format(index), sync=True) for index in range(4)]
+    upload_new_asset_version = drive.upload_new_asset_version
+    skip_saving_values = list()
+
+    def _upload(file_path=None, skip_saving=False, **kwargs):
+        skip_saving_values.append(skip_saving)
+        return upload_new_asset_version(file_path=file_path, skip_saving=skip_saving, **kwargs)
+
+    class _Transaction(filestransaction.FilesTransaction):
+        saved_scenes = list()
+
+        def _save_scene(self):
+            self.saved_scenes.append(threading.current_thread())
+
+    drive.upload_new_asset_version = _upload
+    transaction = _Transaction(files=file_paths, comment='new', skip_saving=False, client=drive)
+    assert transaction.commit()
+    assert _Transaction.saved_scenes == [threading.current_thread()]
+    assert skip_saving_values == [True] * 4
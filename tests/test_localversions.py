@@ -0,0 +1,49 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe local versions index
+"""
+
+from artellapipe.core import localversions
+
+
+def _split_version(folder):
+    name, _, number = folder.partition('_v')
+    return (name, int(number)) if number.isdigit() else None
+
+
+def test_versions_are_validated_on_each_call(tmp_path):
+    for folder in ('__working__', 'model_v001', 'model_v002', 'notes'):
+        (tmp_path / folder).mkdir()
+    (tmp_path / 'notes.txt').write_text(u'')
+
+    version_index = localversions.LocalVersionIndex(str(tmp_path), ignored_folders=['__working__'])
+    assert sorted(version_index.get_folders()) == ['model_v001', 'model_v002', 'notes']
+
+    parsed = list()
+    version_files = set(['model_v001'])
+
+    def _split(folder):
+        parsed.append(folder)
+        return _split_version(folder)
+
+    assert version_index.get_versions(lambda folder: folder in version_files, _split) == {'1': 'model_v001'}
+
+    # A file created inside a version folder does not modify the index path, but it is found anyway
+    version_files.add('model_v002')
+    versions = version_index.get_versions(lambda folder: folder in version_files, _split)
+    assert versions == {'1': 'model_v001', '2': 'model_v002'}
+    assert sorted(parsed) == ['model_v001', 'model_v002', 'notes']
+
+
+def test_index_invalidation(tmp_path):
+    (tmp_path / 'model_v001').mkdir()
+    version_index = localversions.get_local_version_index(str(tmp_path))
+    assert localversions.get_local_version_index(str(tmp_path)) is version_index
+    assert version_index.get_versions(lambda folder: True, _split_version) == {'1': 'model_v001'}
+
+    (tmp_path / 'model_v002').mkdir()
+    localversions.invalidate_local_version_indices(str(tmp_path))
+    assert sorted(version_index.get_folders()) == ['model_v001', 'model_v002']
+    assert len(version_index.get_versions(lambda folder: True, _split_version)) == 2
@@ -0,0 +1,92 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe media profiles registry
+"""
+
+import os
+import json
+
+from artellapipe.core import mediaprofiles
+
+
+class _PathUtils(object):
+    """
+    Same path functions used by MediaProfileRegistry from tpDcc.libs.python.path, that is not required to run the tests
+    """
+
+    @staticmethod
+    def clean_path(path):
+        return os.path.normpath(path).replace('\\', '/')
+
+
+def _write_profile(folder, file_name, data):
+    folder.mkdir(parents=True, exist_ok=True)
+    profile_path = folder / file_name
+    profile_path.write_text(u'{}'.format(json.dumps(data)))
+
+    return str(profile_path).replace('\\', '/')
+
+
+def _create_registry(media_paths, loaded=None):
+    def _load(media_profile_path):
+        if loaded is not None:
+            loaded.append(media_profile_path)
+        with open(media_profile_path, 'r') as fh:
+            return json.load(fh)
+
+    return mediaprofiles.MediaProfileRegistry(
+        [str(media_path) for media_path in media_paths], ['.yml'], load_fn=_load, path_utils=_PathUtils)
+
+
+def test_profiles_index(tmp_path):
+    studio_path = _write_profile(tmp_path / 'studio', 'default.yml', {'font_size': 12})
+    _write_profile(tmp_path / 'project' / 'shots', 'default.yml', {'font_size': 20})
+    shot_path = _write_profile(tmp_path / 'project' / 'shots', 'shot.yml', {'font_size': 14})
+    _write_profile(tmp_path / 'project', 'notes.txt', dict())
+
+    registry = _create_registry([tmp_path / 'studio', tmp_path / 'project'])
+    assert len(registry.get_paths()) == 3
+    assert registry.get_path('default') == studio_path
+    assert registry.get_path('default.yml') == studio_path
+    assert registry.get_path('shot') == shot_path
+    assert registry.get_path('notes') is None
+    assert registry.get_data('default') == {'font_size': 12}
+    assert registry.get_data('missing') == dict()
+
+
+def test_profiles_data_reloaded_when_modified(tmp_path):
+    profile_path = _write_profile(tmp_path, 'default.yml', {'font_size': 12})
+    loaded = list()
+    registry = _create_registry([tmp_path], loaded=loaded)
+
+    profile_data = registry.get_data('default')
+    profile_data['font_size'] = 40
+    assert registry.get_data('default') == {'font_size': 12}
+    assert loaded == [profile_path]
+
+    _write_profile(tmp_path, 'default.yml', {'font_size': 18})
+    mtime = os.stat(profile_path).st_mtime + 10
+    os.utime(profile_path, (mtime, mtime))
+    assert registry.get_data('default') == {'font_size': 18}
+    assert len(loaded) == 2
+
+    os.remove(profile_path)
+    assert registry.get_data('default') == dict()
+
+
+def test_profiles_indexed_again_when_paths_change(tmp_path):
+    _write_profile(tmp_path / 'studio', 'default.yml', {'font_size': 12})
+    project_path = _write_profile(tmp_path / 'project', 'default.yml', {'font_size': 20})
+
+    registry = _create_registry([tmp_path / 'studio'])
+    assert registry.get_data('default') == {'font_size': 12}
+    assert not registry.set_media_paths([str(tmp_path / 'studio')])
+
+    assert registry.set_media_paths([str(tmp_path / 'project')])
+    assert registry.get_path('default') == project_path
+    assert registry.get_data('default') == {'font_size': 20}
+
+    assert registry.set_media_paths([str(tmp_path / 'project')], extensions=['.json'])
+    assert registry.get_paths() == list()
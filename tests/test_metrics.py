@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe metrics
+"""
+
+import os
+import json
+
+import pytest
+
+from artellapipe.utils import metrics
+
+
+def test_disabled_registry():
+    registry = metrics.MetricsRegistry()
+    with registry.span('assets.find_all_assets'):
+        registry.increment('files.synced_files', 3)
+    assert registry.snapshot() == {'counters': [], 'histograms': []}
+
+
+def test_spans_and_sinks(tmpdir):
+    registry = metrics.MetricsRegistry()
+    json_file = os.path.join(str(tmpdir), 'metrics.json')
+    prometheus_sink = metrics.PrometheusSink(os.path.join(str(tmpdir), 'metrics.prom'))
+    registry.add_sink(metrics.JsonFileSink(json_file))
+    registry.add_sink(prometheus_sink)
+
+    with registry.span('file.sync', file_type='model'):
+        pass
+    with pytest.raises(ValueError):
+        with registry.span('file.sync', file_type='model'):
+            raise ValueError()
+    registry.increment('files.synced_files', 3)
+    registry.flush()
+
+    with open(json_file, 'r') as fh:
+        document = json.loads(fh.readline())
+    histogram = document['histograms'][0]
+    assert histogram['name'] == 'file.sync.seconds'
+    assert histogram['labels'] == {'file_type': 'model'}
+    assert histogram['count'] == 2
+    assert {'name': 'file.sync.errors', 'labels': {'file_type': 'model'}, 'value': 1} in document['counters']
+
+    prometheus_text = prometheus_sink.format(registry.snapshot())
+    assert 'artellapipe_files_synced_files_total 3' in prometheus_text
+    assert 'artellapipe_file_sync_seconds_count{file_type="model"} 2' in prometheus_text
+    assert 'artellapipe_file_sync_seconds_bucket{file_type="model",le="+Inf"} 2' in prometheus_text
+
+
+def test_timed():
+
+    @metrics.timed('tests.timed')
+    def _add(a, b):
+        return a + b
+
+    assert _add(1, 2) == 3
+    assert _add.__name__ == '_add'
@@ -0,0 +1,27 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe ordered set
+"""
+
+from artellapipe.utils import orderedset
+
+
+def test_keeps_insertion_order():
+    items = orderedset.OrderedSet(['b', 'a', 'b', 'c', 'a'])
+    assert items.to_list() == ['b', 'a', 'c']
+    assert len(items) == 3
+    assert 'c' in items
+    assert list(reversed(items)) == ['c', 'a', 'b']
+
+
+def test_add_and_discard():
+    items = orderedset.OrderedSet()
+    items.add('a')
+    items.update(['b', 'a'])
+    items.discard('a')
+    items.discard('missing')
+    assert items.to_list() == ['b']
+    assert items == {'b'}
+    assert items != orderedset.OrderedSet(['b', 'c'])
@@ -0,0 +1,96 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe path normalization utilities
+"""
+
+import posixpath
+from collections import namedtuple
+
+from artellapipe.utils import paths
+
+# Same fields as ArtellaProjectContext, that cannot be imported without a DCC
+_Context = namedtuple('_Context', [
+    'env_var', 'project_path', 'project_type', 'root_prefix', 'artella_root', 'working_folder',
+    'production_folder', 'data_path', 'clean_name'])
+
+
+class _PathUtils(object):
+    """
+    Same path functions used by PathNormalizer from tpDcc.libs.python.path, that is not required to run the tests
+    """
+
+    @staticmethod
+    def clean_path(path):
+        return posixpath.normpath(path.replace('\\', '/'))
+
+    @staticmethod
+    def join_path(*paths):
+        return _PathUtils.clean_path(posixpath.join(*paths))
+
+
+def _create_context(project_path='/projects/test/', artella_root='/artella/'):
+    return _Context(
+        'TEST_PROJECT', project_path, 'indie', 'ART_LOCAL_ROOT', artella_root, '__working__', '_art/production',
+        None, 'test')
+
+
+def test_lru_cache_eviction_order():
+    cache = paths.LRUCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert cache.get('a') == 1 and cache.get('c') == 3
+
+    cache.set('a', 4)
+    cache.set('d', 5)
+    assert 'c' not in cache
+    assert cache.get('a') == 4
+    assert cache.get('c', 'missing') == 'missing'
+    assert len(cache) == 2
+
+    cache.clear()
+    assert not len(cache)
+
+
+def test_many_paths_match_single_paths():
+    normalizer = paths.PathNormalizer(_create_context(), path_utils=_PathUtils)
+    paths_to_fix = [
+        '$TEST_PROJECT/assets/chair/__working__/model/chair.ma', '$ART_LOCAL_ROOT/assets/lamp.ma',
+        '/other/assets/table.ma', '$TEST_PROJECT/assets/chair/__working__/model/chair.ma']
+    fixed_paths = normalizer.fix_paths(paths_to_fix)
+    assert fixed_paths[0] == '/projects/test/assets/chair/__working__/model/chair.ma'
+    assert fixed_paths[2] == '/other/assets/table.ma'
+
+    normalizer.clear()
+    assert fixed_paths == [normalizer.fix_path(path_to_fix) for path_to_fix in paths_to_fix]
+
+    paths_to_resolve = ['/projects/test/assets/chair.ma', 'C:\\other\\table.ma']
+    resolved_paths = normalizer.resolve_paths(paths_to_resolve)
+    assert resolved_paths[0] == '$TEST_PROJECT/assets/chair.ma'
+    normalizer.clear()
+    assert resolved_paths == [normalizer.resolve_path(path_to_resolve) for path_to_resolve in paths_to_resolve]
+
+    paths_to_prefix = ['assets/chair.ma', '_art/production/chair.ma']
+    prefixed_paths = normalizer.prefix_paths_with_project_path(paths_to_prefix)
+    normalizer.clear()
+    assert prefixed_paths == [normalizer.prefix_path_with_project_path(path) for path in paths_to_prefix]
+
+
+def test_normalizer_invalidation_on_context_change():
+    context = _create_context()
+    normalizer = paths.get_path_normalizer(context, path_utils=_PathUtils)
+    assert normalizer.fix_path('$TEST_PROJECT/chair.ma') == '/projects/test/chair.ma'
+    assert paths.get_path_normalizer(context, path_utils=_PathUtils) is normalizer
+
+    # Project context is built again each time project environment changes
+    new_context = _create_context(project_path='/projects/other/')
+    new_normalizer = paths.get_path_normalizer(new_context, path_utils=_PathUtils)
+    assert new_normalizer is not normalizer
+    assert new_normalizer.fix_path('$TEST_PROJECT/chair.ma') == '/projects/other/chair.ma'
+
+    no_project_normalizer = paths.get_path_normalizer(_create_context(project_path=''), path_utils=_PathUtils)
+    assert no_project_normalizer.fix_path('$TEST_PROJECT/chair.ma') == '$TEST_PROJECT/chair.ma'
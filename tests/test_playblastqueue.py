@@ -0,0 +1,94 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe playblasts capture queue
+"""
+
+import os
+
+from artellapipe.core import playblastqueue
+from artellapipe.utils import tokens
+
+
+class _FakePlayblastsManager(object):
+    def __init__(self, folder):
+        self.folder = folder
+        self.panels = list()
+        self.deleted_panels = list()
+        self.captures = list()
+
+    def _create_capture_panel(self, **kwargs):
+        self.panels.append('capturePanel{}'.format(len(self.panels) + 1))
+        return self.panels[-1]
+
+    def _delete_capture_panel(self, panel):
+        self.deleted_panels.append(panel)
+
+    def create_token_context(self, attrs_dict):
+        return tokens.TokenContext(attrs_dict)
+
+    def format_tokens(self, token_str, attrs_dict=None, context=None):
+        formatter = tokens.TokenFormatter({'<camera>': {'fn': lambda attrs: attrs['camera'], 'label': ''}})
+        return formatter.format(token_str, attrs_dict, context=context)
+
+    def capture(self, **kwargs):
+        self.captures.append(kwargs)
+        for frame in range(kwargs['start_frame'], kwargs['end_frame'] + 1):
+            with open(os.path.join(self.folder, '{}.{:04d}.png'.format(kwargs['filename'], frame)), 'w') as fh:
+                fh.write('raw')
+        return os.path.join(self.folder, '{}.####.png'.format(kwargs['filename']))
+
+
+def _stamp(sources, outputs):
+    for source, output in zip(sources, outputs):
+        if not os.path.isdir(os.path.dirname(output)):
+            os.makedirs(os.path.dirname(output))
+        with open(output, 'w') as fh:
+            fh.write('stamped')
+    return outputs
+
+
+def test_get_playblast_frames(tmpdir):
+    folder = str(tmpdir)
+    for name in ('shot.0001.png', 'shot.0002.png', 'shot.01.png', 'shot.mov'):
+        open(os.path.join(folder, name), 'w').close()
+
+    assert playblastqueue.get_playblast_frames(os.path.join(folder, 'shot.####.png')) == [
+        os.path.join(folder, 'shot.0001.png'), os.path.join(folder, 'shot.0002.png')]
+    assert playblastqueue.get_playblast_frames(os.path.join(folder, 'shot.01.png')) == [
+        os.path.join(folder, 'shot.01.png')]
+    assert playblastqueue.get_playblast_frames(os.path.join(folder, 'shot.mov')) == list()
+    assert playblastqueue.get_playblast_frames(os.path.join(folder, 'missing.png')) == list()
+    assert playblastqueue.get_playblast_frames(None) == list()
+
+
+def test_capture_queue(tmpdir):
+    manager = _FakePlayblastsManager(str(tmpdir))
+    queue = playblastqueue.PlayblastCaptureQueue(manager, stamp_fn=_stamp, width=64, height=48)
+    queue.add('sh010', camera='cam_sh010', start_frame=1, end_frame=2, filename='<camera>')
+    queue.add('sh020', camera='cam_sh020', start_frame=5, end_frame=5, filename='<camera>')
+    assert len(queue) == 2
+
+    results = queue.run()
+    assert manager.panels == ['capturePanel1']
+    assert manager.deleted_panels == ['capturePanel1']
+    assert [capture['panel'] for capture in manager.captures] == ['capturePanel1', 'capturePanel1']
+    assert [capture['width'] for capture in manager.captures] == [64, 64]
+    assert list(results) == ['sh010', 'sh020']
+    assert results['sh010'] == os.path.join(str(tmpdir), 'stamped', 'cam_sh010.####.png')
+    assert len(playblastqueue.get_playblast_frames(results['sh010'])) == 2
+
+    with open(os.path.join(str(tmpdir), 'cam_sh010.0001.png'), 'r') as fh:
+        assert fh.read() == 'raw'
+    with open(os.path.join(str(tmpdir), 'stamped', 'cam_sh010.0001.png'), 'r') as fh:
+        assert fh.read() == 'stamped'
+
+
+def test_capture_queue_without_stamp(tmpdir):
+    manager = _FakePlayblastsManager(str(tmpdir))
+    queue = playblastqueue.PlayblastCaptureQueue(manager)
+    queue.add('sh010', camera='cam_sh010', start_frame=1, end_frame=1, filename='sh010')
+
+    assert queue.run() == {'sh010': os.path.join(str(tmpdir), 'sh010.####.png')}
+    assert not os.path.isdir(os.path.join(str(tmpdir), 'stamped'))
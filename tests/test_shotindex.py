@@ -0,0 +1,49 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe shot index
+"""
+
+import random
+
+from artellapipe.core import shotindex
+
+
+def _create_index(ranges):
+    entries = list()
+    for i, (start, end) in enumerate(ranges):
+        name = 'shot_{:03d}'.format(i)
+        entries.append(shotindex.ShotIndexEntry(name, name, 'seq_{}'.format(i % 3), start, end))
+
+    return shotindex.ShotIndex(entries)
+
+
+def test_name_and_sequence_queries():
+    index = _create_index([(1050, 1100), (1001, 1049), (1101, 1200)])
+    assert index.get_shots_by_name('shot_001') == ['shot_001']
+    assert index.get_shots_by_name('missing') == list()
+    assert index.get_shots() == ['shot_001', 'shot_000', 'shot_002']
+    assert index.get_shots(reverse=True) == ['shot_002', 'shot_000', 'shot_001']
+    assert index.get_sequence_shots('seq_1') == ['shot_001']
+
+
+def test_range_queries_match_linear_scan():
+    rng = random.Random(0)
+    ranges = list()
+    for _ in range(500):
+        start = rng.randint(0, 10000)
+        ranges.append((start, start + rng.randint(0, 300)))
+    index = _create_index(ranges)
+
+    for _ in range(200):
+        query_start = rng.randint(-100, 10500)
+        query_end = query_start + rng.randint(0, 500)
+        expected = set(
+            'shot_{:03d}'.format(i) for i, (start, end) in enumerate(ranges)
+            if start <= query_end and end >= query_start)
+        found = index.get_shots_in_range(query_start, query_end)
+        assert set(found) == expected and len(found) == len(expected)
+
+    assert index.get_shots_at_frame(-1000) == list()
+    assert shotindex.ShotIndex().get_shots_in_range(0, 100) == list()
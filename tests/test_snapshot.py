@@ -0,0 +1,41 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe configuration snapshots
+"""
+
+import pytest
+
+from artellapipe.utils import snapshot
+
+
+class _DummyConfig(object):
+    def __init__(self, data):
+        self.name = 'artellapipe-dummy'
+        self.data = data
+
+
+def test_dotted_key_access():
+    config_snapshot = snapshot.ConfigSnapshot({'data': {'id_attribute': 'id'}, 'types': {'prop': {}}})
+    assert config_snapshot.get('data.id_attribute') == 'id'
+    assert config_snapshot.get('data.missing', default='fallback') == 'fallback'
+    assert 'types.prop' in config_snapshot
+    assert set(config_snapshot.keys()) == {'data', 'types'}
+
+
+def test_snapshot_is_frozen():
+    data = {'default_name': 'New Asset'}
+    config_snapshot = snapshot.ConfigSnapshot(data)
+    data['default_name'] = 'Changed'
+    assert config_snapshot.get('default_name') == 'New Asset'
+    with pytest.raises(AttributeError):
+        config_snapshot._values = dict()
+
+
+def test_snapshot_cache_and_invalidation():
+    config = _DummyConfig({'files': {'model': {}}})
+    first = snapshot.get_config_snapshot(config)
+    assert snapshot.get_config_snapshot(config) is first
+    snapshot.invalidate_snapshots()
+    assert snapshot.get_config_snapshot(config) is not first
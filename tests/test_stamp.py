@@ -0,0 +1,88 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe stamp engine
+"""
+
+import pytest
+
+from artellapipe.utils import stamp
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def _create_frames(folder, num_frames, size=(64, 48)):
+    sources = list()
+    for i in range(num_frames):
+        source = str(folder / 'playblast.{0:04d}.png'.format(i + 1))
+        Image.new('RGB', size, (0, 128, 0)).save(source)
+        sources.append(source)
+
+    return sources
+
+
+def test_template_splits_static_and_frame_texts():
+    template = stamp.StampTemplate({'top_left': '{project}', 'bottom_right': '{frame}', 'project': 'Solstice'})
+    assert template.static_texts == {'top_left': 'Solstice'}
+    assert template.frame_texts == {'bottom_right': '{frame}'}
+    assert stamp.get_frame_number('/tmp/playblast.0012.png') == 12
+    assert stamp.get_frame_number('/tmp/playblast.png') is None
+
+
+def test_padded_frame_tokens(tmp_path):
+    template = stamp.StampTemplate({
+        'bottom_left': 'Frame {frame:04d} of {shot!r} {{x}}', 'top_left': '{project:>8}', 'shot': 'sh010',
+        'project': 'Solstice'})
+    assert template.frame_texts == {'bottom_left': "Frame {frame:04d} of 'sh010' {{x}}"}
+    assert template.static_texts == {'top_left': 'Solstice'}
+    assert stamp.format_text(template.frame_texts['bottom_left'], {'frame': 12}) == "Frame 0012 of 'sh010' {x}"
+    assert stamp.format_text(template.frame_texts['bottom_left'], {'frame': None}) == "Frame  of 'sh010' {x}"
+
+    source = _create_frames(tmp_path, 1)[0]
+    no_frame_source = str(tmp_path / 'playblast.png')
+    Image.new('RGB', (64, 48)).save(no_frame_source)
+    assert template.stamp(source, str(tmp_path / 'stamped.0001.png'))
+    assert template.stamp(no_frame_source, str(tmp_path / 'stamped.png'))
+
+
+@pytest.mark.parametrize('processes, threads', [(None, None), (None, 1), (1, None), (2, None)])
+def test_stamp_many(tmp_path, processes, threads):
+    sources = _create_frames(tmp_path, 5)
+    outputs = [str(tmp_path / 'out' / 'stamped.{0:04d}.png'.format(i + 1)) for i in range(5)]
+    profile = {'border_height': 8, 'border_color': [255, 0, 0, 255], 'bottom_right': '{frame}'}
+
+    result = list(stamp.stamp_many(sources, outputs, profile, processes=processes, threads=threads))
+    assert result == outputs
+    for output in outputs:
+        with Image.open(output) as stamped:
+            assert stamped.size == (64, 48)
+            assert stamped.getpixel((0, 0))[:3] == (255, 0, 0)
+            assert stamped.getpixel((32, 24))[:3] == (0, 128, 0)
+
+
+def test_text_size_fallback(tmp_path):
+    # Old Pillow versions (< 8) do not support ImageDraw.textbbox
+    class _OldDraw(object):
+        def __init__(self, draw):
+            self._draw = draw
+
+        def textsize(self, text, font=None):
+            left, top, right, bottom = self._draw.textbbox((0, 0), text, font=font)
+            return right - left, bottom - top
+
+        def text(self, *args, **kwargs):
+            return self._draw.text(*args, **kwargs)
+
+    template = stamp.StampTemplate({'bottom_right': 'sh010', 'border_height': 16})
+    image = Image.new('RGBA', (64, 48))
+    template._draw_text(_OldDraw(stamp.ImageDraw.Draw(image)), image.size, 'bottom_right', 'sh010')
+    assert image.getbbox() is not None
+
+
+def test_processes_need_python_executable(monkeypatch):
+    spawn = pytest.importorskip('multiprocessing.spawn')
+    monkeypatch.setattr(spawn, 'get_executable', lambda: '/usr/autodesk/maya2020/bin/maya.bin')
+    assert not stamp.can_use_processes()
+    monkeypatch.setattr(spawn, 'get_executable', lambda: '/usr/bin/python3.11')
+    assert stamp.can_use_processes()
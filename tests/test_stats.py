@@ -0,0 +1,67 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe tools statistics database
+"""
+
+import os
+
+from artellapipe.utils import stats
+
+
+def test_percentile():
+    assert stats.percentile([], 50) is None
+    assert stats.percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert stats.percentile([1.0, 2.0, 3.0, 4.0], 100) == 4.0
+
+
+def test_slowest_tools(tmpdir):
+    db_path = os.path.join(str(tmpdir), 'stats', 'plugin_stats.db')
+    database = stats.PluginStatsDatabase(db_path, max_runs=10)
+    for i in range(20):
+        database.add_run('playblast', execution_time=float(i), dcc='maya')
+    database.add_info({'name': 'sync', 'application': 'maya', 'executionTime': 0.5, 'traceback': 'error'})
+    database.add_info({'name': 'not_finished'})
+
+    tool_stats = database.get_slowest_tools(limit=1)
+    assert len(tool_stats) == 1
+    assert tool_stats[0]['tool'] == 'playblast'
+    assert tool_stats[0]['runs'] == 10
+    assert tool_stats[0]['p50'] == 14.5
+    sync_stats = database.get_tool_stats(tool='sync')[0]
+    assert sync_stats['failures'] == 1
+    assert not database.get_tool_stats(dcc='houdini')
+
+    assert stats.main(['--db', db_path, '--sort', 'runs']) == 0
+
+
+class _Stats(object):
+    def __init__(self, info):
+        self.info = info
+
+
+def test_background_record(tmpdir):
+    db_path = os.path.join(str(tmpdir), 'plugin_stats.db')
+    info = {'name': 'playblast', 'application': 'maya', 'executionTime': 1.0}
+    plugin_stats = _Stats(info)
+    for i in range(5):
+        info['executionTime'] = float(i)
+        assert stats.record(plugin_stats, db_path=db_path)
+    stats.flush()
+
+    tool_stats = stats.get_database(db_path).get_tool_stats(tool='playblast')[0]
+    assert tool_stats['runs'] == 5
+    assert tool_stats['max'] == 4.0
+
+
+def test_batched_writes(tmpdir):
+    db_path = os.path.join(str(tmpdir), 'plugin_stats.db')
+    database = stats.PluginStatsDatabase(db_path, max_runs=3)
+    database.add_infos(
+        [{'name': 'sync', 'executionTime': float(i)} for i in range(5)] + [{'name': 'lock', 'executionTime': 2.0}])
+
+    tool_stats = dict((tool_stats['tool'], tool_stats) for tool_stats in database.get_tool_stats())
+    assert tool_stats['sync']['runs'] == 3
+    assert tool_stats['sync']['mean'] == 3.0
+    assert tool_stats['lock']['dcc'] == 'standalone'
@@ -0,0 +1,106 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe shots timing table
+"""
+
+import pytest
+
+from artellapipe.core import timing
+
+
+def _create_table():
+    return timing.ShotTimingTable.from_rows([
+        timing.ShotTiming('shot_010', 1001, 1050, 101, 150, 0, 0, 1.0, 1),
+        timing.ShotTiming('shot_020', 1051, 1120, 101, 170, 2, 3, 1.0, 2),
+        None
+    ])
+
+
+def test_min_max_values():
+    table = _create_table()
+    assert len(table) == 2
+    assert table.get_min_sequencer() == 1001
+    assert table.get_max_sequencer() == 1120
+    assert table.get_min_time() == 101
+    assert table.get_max_time() == 170
+    assert timing.ShotTimingTable().get_max_time() == 0.0
+
+
+def test_range_data():
+    table = _create_table()
+    shot_timing = table.get_timing('shot_020')
+    assert shot_timing.track == 2 and shot_timing.scale == 1.0
+    range_data = table.get_range_data('shot_020', (1060, 1100))
+    assert range_data['time_start_frame'] == 108
+    assert range_data['time_end_frame'] == 150
+    assert range_data == timing.get_range_data(shot_timing, (1060, 1100))
+    assert table.get_range_data('missing', (0, 1)) is None
+
+
+def test_range_data_many_matches_scalar():
+    import random
+
+    rng = random.Random(0)
+    timings = list()
+    sequence_ranges = list()
+    for i in range(200):
+        sequencer_start = rng.randint(0, 5000)
+        sequencer_end = sequencer_start + rng.randint(1, 200)
+        start = rng.randint(0, 500)
+        timings.append(timing.ShotTiming(
+            'shot_{}'.format(i), sequencer_start, sequencer_end, start, start + sequencer_end - sequencer_start,
+            rng.randint(0, 5), rng.randint(0, 5), rng.choice([0.5, 1.0, 2.0]), 1))
+        sequence_ranges.append(
+            (sequencer_start + rng.randint(-10, 10), sequencer_end + rng.randint(-10, 10)))
+
+    expected = [timing.get_range_data(t, r) for t, r in zip(timings, sequence_ranges)]
+    assert timing.get_range_data_many(timings, sequence_ranges, use_numpy=False) == expected
+    assert timing.get_range_data_many(timings, sequence_ranges) == expected
+
+
+class _Shot(object):
+    """
+    Shot with the same timing interface as ArtellaShot, that cannot be imported without a DCC
+    """
+
+    def __init__(self, shot_timing=None, name=None):
+        self._timing = shot_timing
+        self._name = name or shot_timing.name
+
+    def get_name(self):
+        return self._name
+
+    def get_timing(self):
+        return self._timing
+
+    def get_camera(self):
+        return '{}_cam'.format(self._name)
+
+
+def test_shots_data_matches_shot_data():
+    table = _create_table()
+    # shot_030 is not stored in the table and shot_040 has no shot node, so both are read from the shot
+    shots = [
+        _Shot(table.get_timing('shot_010')), _Shot(table.get_timing('shot_020')),
+        _Shot(timing.ShotTiming('shot_030', 1121, 1140, 1, 20, 0, 0, 2.0, 1)), _Shot(name='shot_040')]
+    sequence_ranges = [(1001, 1050), (1060, 1100), (1125, 1135), (0, 10)]
+
+    expected = [timing.get_shot_data(shot, r, timing_table=table) for shot, r in zip(shots, sequence_ranges)]
+    assert expected[2]['time_start_frame'] == 3 and expected[2]['camera'] == 'shot_030_cam'
+    assert expected[3]['shot_name'] == 'shot_040' and expected[3]['track'] == -1
+    assert timing.get_shots_data(shots, sequence_ranges, timing_table=table) == expected
+    assert timing.get_shots_data(shots, sequence_ranges, timing_table=table, use_numpy=False) == expected
+    assert timing.get_shots_data(shots, sequence_ranges) == expected
+
+
+@pytest.mark.parametrize('use_numpy', [False, True])
+def test_zero_scale(use_numpy):
+    shot_timing = timing.ShotTiming('shot_010', 1001, 1050, 101, 150, 0, 0, 0.0, 1)
+    assert timing.get_range_data_many([shot_timing], [(1001, 1050)], use_numpy=use_numpy) == [
+        timing.get_range_data(shot_timing, (1001, 1050))]
+    with pytest.raises(ZeroDivisionError):
+        timing.get_range_data(shot_timing, (1010, 1050))
+    with pytest.raises(ZeroDivisionError):
+        timing.get_range_data_many([shot_timing], [(1010, 1050)], use_numpy=use_numpy)
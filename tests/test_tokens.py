@@ -0,0 +1,46 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe tokens formatter
+"""
+
+from artellapipe.utils import tokens
+
+
+def _create_tokens(calls):
+    def _camera(attrs_dict):
+        calls.append('camera')
+        return attrs_dict['camera'].rsplit('|', 1)[-1]
+
+    def _scene(attrs_dict):
+        calls.append('scene')
+        return 'shot_010'
+
+    return {'<camera>': {'fn': _camera, 'label': ''}, '<scene>': {'fn': _scene, 'label': ''}}
+
+
+def test_compiled_template_segments():
+    formatter = tokens.TokenFormatter(_create_tokens(list()))
+    compiled = formatter.compile('<scene>/<camera>_<unknown>.mov')
+    assert compiled.tokens == ['<scene>', '<camera>']
+    assert formatter.compile('<scene>/<camera>_<unknown>.mov') is compiled
+
+
+def test_tokens_are_evaluated_once_per_context():
+    calls = list()
+    formatter = tokens.TokenFormatter(_create_tokens(calls))
+    result = formatter.format_many(
+        ['<scene>/<camera>.{}.png'.format(i) for i in range(3)], {'camera': '|cameras|shotCam'})
+    assert result == ['shot_010/shotCam.{}.png'.format(i) for i in range(3)]
+    assert sorted(calls) == ['camera', 'scene']
+    assert formatter.format('', {}) == ''
+
+
+def test_shared_context():
+    calls = list()
+    formatter = tokens.TokenFormatter(_create_tokens(calls))
+    context = tokens.TokenContext({'camera': 'shotCam'})
+    assert formatter.format('<camera>.mov', {'camera': 'otherCam'}, context=context) == 'shotCam.mov'
+    assert formatter.format_many(['<scene>_<camera>', '<camera>'], context=context) == ['shot_010_shotCam', 'shotCam']
+    assert calls == ['camera', 'scene']
@@ -0,0 +1,64 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe tracking fixtures
+"""
+
+import os
+
+from artellapipe.core import trackingfixtures
+
+
+class _Tracker(object):
+
+    def get_project_name(self):
+        return 'Project'
+
+    def all_assets_in_shot(self, shot):
+        return [{'id': 'asset_{}'.format(shot)}]
+
+
+def test_generate_fixtures():
+    fixtures = trackingfixtures.generate_fixtures(num_assets=100, num_shots=40, num_sequences=4, seed=3)
+    assets = fixtures.replay('all_project_assets')
+    shots = fixtures.replay('all_project_shots')
+    assert len(assets) == 100
+    assert len(shots) == 40
+    assert len(set(shot['sequence'] for shot in shots)) == 4
+    assert fixtures.replay('all_assets_in_shot', shots[0]['id'])
+    other = trackingfixtures.generate_fixtures(num_assets=100, num_shots=40, num_sequences=4, seed=3)
+    assert other.replay('get_shots_breakdown') == fixtures.replay('get_shots_breakdown')
+
+
+def test_record_and_replay(tmpdir):
+    fixtures_file = os.path.join(str(tmpdir), 'fixtures.json')
+    recorder = trackingfixtures.TrackingRecorder(_Tracker(), fixtures_file=fixtures_file)
+    assert recorder.get_project_name() == 'Project'
+    assert recorder.all_assets_in_shot('sh010') == [{'id': 'asset_sh010'}]
+    assert recorder.save()
+
+    fixtures = trackingfixtures.TrackingFixtures.load(fixtures_file)
+    assert fixtures.replay('get_project_name') == 'Project'
+    payload = fixtures.replay('all_assets_in_shot', 'sh010')
+    payload.append(None)
+    assert fixtures.replay('all_assets_in_shot', 'sh010') == [{'id': 'asset_sh010'}]
+    assert fixtures.replay('all_assets_in_shot', 'sh020', default=None) is None
+
+
+def test_occurrences():
+    fixtures = trackingfixtures.TrackingFixtures()
+    fixtures.record('all_assets_in_shot', ['sh010'], [{'name': 'chair'}, {'name': 'lamp'}, {'name': 'chair'}])
+    fixtures.record('all_assets_in_shot', ['sh020'], list())
+    assert fixtures.get_occurrences('sh010', 'chair') == 2
+    assert fixtures.get_occurrences('sh010', 'table') == 0
+    assert fixtures.get_occurrences('sh020', 'chair') == 0
+    assert fixtures.get_occurrences('sh030', 'chair') is None
+
+    fixtures.record('get_occurrences_of_asset_in_shot', ['sh010', 'table'], 5)
+    assert fixtures.get_occurrences('sh010', 'table') == 5
+
+    generated = trackingfixtures.generate_fixtures(num_assets=50, num_shots=20, num_sequences=2, seed=1)
+    for shot_id, asset_name, occurrences in generated.replay('get_shots_breakdown'):
+        assert generated.get_occurrences(shot_id, asset_name) == occurrences
+    assert generated.get_occurrences('shot_000000', 'missing') == 0
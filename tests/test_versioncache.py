@@ -0,0 +1,113 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe versions caches
+"""
+
+import os
+import json
+import time
+
+from artellapipe.core import versioncache
+from artellapipe.utils import fakeartella
+
+
+def test_version_cache(tmpdir):
+    drive = fakeartella.FakeArtellaDrive(root_path=os.path.join(str(tmpdir), 'drive'))
+    file_path = drive.add_file('assets/chair/model/chair.ma', versions=3)
+    new_file_path = os.path.join(os.path.dirname(file_path), 'chair_new.ma')
+    cache_path = os.path.join(str(tmpdir), 'cache', 'versions.json')
+
+    cache = versioncache.VersionCache(cache_path, save_delay=0)
+    assert cache.get_current_version(file_path, client=drive) == 3
+    assert cache.get_current_version(new_file_path, client=drive) == 0
+    assert cache.get_current_version(file_path, client=drive) == 3
+    assert drive.calls['get_status'] == 2
+    assert 'get_file_history' not in drive.calls
+    assert not os.path.isfile(cache_path)
+
+    cache.set(file_path, 4)
+    assert versioncache.VersionCache(cache_path).get(file_path) == 4
+    assert versioncache.VersionCache(cache_path, max_age=-1).get(file_path) is None
+    cache.invalidate(file_path)
+    assert versioncache.VersionCache(cache_path).get(file_path) is None
+
+
+
+def test_current_version_fallbacks(tmpdir):
+    drive = fakeartella.FakeArtellaDrive(root_path=str(tmpdir))
+    file_path = drive.add_file('assets/chair/model/chair.ma', versions=2)
+    drive.get_status = lambda *args, **kwargs: None
+
+    # Indie projects cannot query current versions, so history of the file is used
+    assert versioncache.query_current_version(file_path, client=drive, use_history=True) == 2
+    assert drive.calls['get_file_history'] == 1 and 'get_current_version' not in drive.calls
+    assert versioncache.query_current_version(file_path, client=drive) == 2
+    assert drive.calls['get_current_version'] == 1
+
+    cache = versioncache.VersionCache()
+    cache.set(file_path, 1)
+    assert cache.get_current_version(file_path, client=drive, use_history=True) == 1
+    assert cache.get_current_version(file_path, client=drive, force_update=True, use_history=True) == 2
+
+def test_version_cache_sessions(tmpdir):
+    cache_path = os.path.join(str(tmpdir), 'versions.json')
+    with open(cache_path, 'w') as fh:
+        json.dump({'expired.ma': [1, time.time() - versioncache.MAX_AGE - 1]}, fh)
+
+    session_a = versioncache.VersionCache(cache_path, save_delay=60)
+    session_b = versioncache.VersionCache(cache_path, save_delay=60)
+    for index in range(200):
+        session_a.set('a_{}.ma'.format(index), index)
+    session_b.set('b.ma', 2)
+    with open(cache_path, 'r') as fh:
+        assert list(json.load(fh)) == ['expired.ma']
+
+    session_a.save()
+    session_b.save()
+    with open(cache_path, 'r') as fh:
+        stored_versions = json.load(fh)
+    assert len(stored_versions) == 201
+    assert 'expired.ma' not in stored_versions
+    fresh_cache = versioncache.VersionCache(cache_path)
+    assert fresh_cache.get('a_199.ma') == 199
+    assert fresh_cache.get('b.ma') == 2
+
+
+def test_history_cache(tmpdir):
+    drive = fakeartella.FakeArtellaDrive(root_path=str(tmpdir))
+    file_path = drive.add_file('assets/chair/model/chair.ma', versions=45, sync=True)
+    cache = versioncache.HistoryCache(client=drive, page_size=20)
+
+    assert [version for version, _ in cache.get_page(file_path)] == list(range(45, 25, -1))
+    assert [version for version, _ in cache.get_page(file_path, page=2)] == [5, 4, 3, 2, 1]
+    assert cache.get_num_pages(file_path) == 3
+    assert drive.calls['get_file_history'] == 1
+    assert 'get_status' not in drive.calls
+
+    with open(file_path, 'w') as fh:
+        fh.write('new version')
+    drive.upload_new_asset_version(file_path)
+    cache.version_cache.set(file_path, 46)
+    assert cache.get_page(file_path, page_size=1)[0][0] == 46
+    assert drive.calls['get_file_history'] == 2
+
+
+def test_history_cache_ttl_and_invalidation(tmpdir, monkeypatch):
+    drive = fakeartella.FakeArtellaDrive(root_path=str(tmpdir))
+    file_path = drive.add_file('assets/chair/model/chair.ma', versions=2)
+    monkeypatch.setenv('ARTELLAPIPE_TEST_ROOT', drive.local_path)
+    env_path = os.path.join('$ARTELLAPIPE_TEST_ROOT', 'assets', 'chair', 'model', 'chair.ma')
+
+    cache = versioncache.HistoryCache(client=drive, ttl=None)
+    assert cache.get_history(file_path) is cache.get_history(env_path)
+    assert drive.calls['get_file_history'] == 1
+    cache.invalidate(env_path)
+    cache.get_history(file_path)
+    assert drive.calls['get_file_history'] == 2
+
+    expired_cache = versioncache.HistoryCache(client=drive, ttl=-1)
+    expired_cache.get_history(file_path)
+    expired_cache.get_history(file_path)
+    assert drive.calls['get_file_history'] == 4